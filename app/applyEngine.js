@@ -0,0 +1,272 @@
+import { TerminalNode } from "./diagram.js";
+import { NodeFactory } from "./nodeFactory.js";
+import { LRUCache } from "./lruCache.js";
+
+// Operations which can be given by name, the value is the function applied to terminal values
+const OPERATIONS = {
+    min: Math.min,
+    max: Math.max,
+    plus: (a, b) => a + b,
+    times: (a, b) => a * b,
+};
+
+// Operations whose result does not depend on the order of operands, their cache keys ignore the order
+const COMMUTATIVE_OPERATIONS = new Set(["min", "max", "plus", "times"]);
+
+// Ids of the operations in the computed table, operations given as functions get the following ids
+const OPERATION_IDS = { ite: 0, min: 1, max: 2, plus: 3, times: 4 };
+
+/**
+ * Bounded cache of computed results with least recently used eviction.
+ * Results are stored by an operation id and the ids of up to three operand nodes. The key is a numeric hash
+ * of the ids, so no key strings are created, and entries keep the ids to tell colliding results apart.
+ */
+class ComputedTable {
+    /**
+     * Constructs an empty table.
+     * @param {number} maxEntries - Maximal number of stored results.
+     */
+    constructor(maxEntries = 65536) {
+        this._entries = new LRUCache(maxEntries); // Entries {operationId, a, b, c, result} by hash
+        this.hits = 0;
+        this.misses = 0;
+    }
+
+    /**
+     * Generates a numeric hash key of the operation and the operands.
+     * @param {number} operationId - Id of the operation.
+     * @param {number} a - Id of the first operand.
+     * @param {number} b - Id of the second operand.
+     * @param {number} c - Id of the third operand, or -1.
+     * @returns {number} A 32-bit hash of the ids.
+     */
+    makeHashKey(operationId, a, b, c) {
+        let hash = Math.imul(operationId ^ 0x811c9dc5, 0x01000193);
+        hash = Math.imul(hash ^ a, 0x01000193);
+        hash = Math.imul(hash ^ b, 0x01000193);
+        hash = Math.imul(hash ^ c, 0x01000193);
+        return hash ^ (hash >>> 16);
+    }
+
+    /**
+     * Gets the stored result and marks it as the most recently used one.
+     * @param {number} operationId - Id of the operation.
+     * @param {number} a - Id of the first operand.
+     * @param {number} b - Id of the second operand.
+     * @param {number} c - Id of the third operand, or -1 for operations with two operands.
+     * @returns {InternalNode|TerminalNode|undefined} The stored result, or undefined if there is none.
+     */
+    get(operationId, a, b, c = -1) {
+        const entry = this._entries.get(this.makeHashKey(operationId, a, b, c));
+        if (entry === undefined || entry.operationId !== operationId || entry.a !== a || entry.b !== b || entry.c !== c) {
+            this.misses++;
+            return undefined;
+        }
+        this.hits++;
+        return entry.result;
+    }
+
+    /**
+     * Stores the result, evicting the least recently used one if the table is full.
+     * A result with the same hash is replaced.
+     * @param {number} operationId - Id of the operation.
+     * @param {number} a - Id of the first operand.
+     * @param {number} b - Id of the second operand.
+     * @param {number} c - Id of the third operand, or -1 for operations with two operands.
+     * @param {InternalNode|TerminalNode} result - The result.
+     * @returns {void}
+     */
+    set(operationId, a, b, c, result) {
+        this._entries.set(this.makeHashKey(operationId, a, b, c), { operationId, a, b, c, result });
+    }
+
+    /**
+     * Gets the number of stored results.
+     * @returns {number} The number of stored results.
+     */
+    getSize() {
+        return this._entries.getSize();
+    }
+
+    /**
+     * Removes all stored results.
+     * @returns {void}
+     */
+    clear() {
+        this._entries.clear();
+    }
+}
+
+/**
+ * Combines MDDs without expanding them to truth vectors.
+ *
+ * The operands are traversed together from the top level down, on each level the result node is created
+ * from the results for each decision. Results for pairs of nodes are stored in a computed table, so every pair
+ * is computed only once and the cost is bounded by the product of the node counts of the operands.
+ * The operands should be built by the node factory of the engine, otherwise the result may not be reduced.
+ */
+class ApplyEngine {
+    /**
+     * Constructs the engine.
+     * @param {NodeFactory} nodeFactory - Node factory used for creating the nodes of the results.
+     * @param {number} cacheSize - Maximal number of results stored in the computed table.
+     */
+    constructor(nodeFactory = new NodeFactory(), cacheSize = 65536) {
+        this._nodeFactory = nodeFactory;
+        this._computedTable = new ComputedTable(cacheSize);
+        this._operationIds = new WeakMap(); // Ids of operations given as functions, used in the cache keys
+        this._nextOperationId = Object.keys(OPERATION_IDS).length;
+    }
+
+    /**
+     * Gets the node factory of the engine.
+     * @returns {NodeFactory} The node factory.
+     */
+    getNodeFactory() {
+        return this._nodeFactory;
+    }
+
+    /**
+     * Gets the computed table of the engine.
+     * @returns {ComputedTable} The computed table.
+     */
+    getComputedTable() {
+        return this._computedTable;
+    }
+
+    /**
+     * Combines two functions, the value of the result is the operation applied to the values of the operands.
+     * @param {string|function(number, number): number} operation - Name of the operation ("min", "max", "plus"
+     *        or "times"), or a function combining two terminal values.
+     * @param {MDD} mddA - The first operand.
+     * @param {MDD} mddB - The second operand.
+     * @returns {MDD|null} - The combined MDD, or null if the operands have different domains.
+     */
+    apply(operation, mddA, mddB) {
+        const operationFunction = typeof operation === "function" ? operation : OPERATIONS[operation];
+        if (operationFunction === undefined) {
+            console.error(`Apply cannot be performed. Unknown operation ${operation}.`);
+            return null;
+        }
+        const operationId = this.getOperationId(operation);
+        const commutative = COMMUTATIVE_OPERATIONS.has(operation);
+
+        const applyNodes = (a, b) => {
+            if (a instanceof TerminalNode && b instanceof TerminalNode) {
+                return this._nodeFactory.createTerminalNode(operationFunction(a.getResultValue(), b.getResultValue()));
+            }
+            const swap = commutative && a.getId() > b.getId();
+            const idA = swap ? b.getId() : a.getId();
+            const idB = swap ? a.getId() : b.getId();
+            let result = this._computedTable.get(operationId, idA, idB);
+            if (result === undefined) {
+                result = this.expand([a, b], (successors) => applyNodes(successors[0], successors[1]));
+                this._computedTable.set(operationId, idA, idB, -1, result);
+            }
+            return result;
+        };
+
+        return this.applyToRoots([mddA, mddB], (roots) => applyNodes(roots[0], roots[1]));
+    }
+
+    /**
+     * Combines three functions by the if-then-else operation: the result has the value of the second function
+     * where the first one is not 0, and the value of the third function elsewhere.
+     * @param {MDD} mddF - The condition.
+     * @param {MDD} mddG - The function used where the condition is not 0.
+     * @param {MDD} mddH - The function used where the condition is 0.
+     * @returns {MDD|null} - The combined MDD, or null if the operands have different domains.
+     */
+    ite(mddF, mddG, mddH) {
+        const iteNodes = (f, g, h) => {
+            if (f instanceof TerminalNode) {
+                return f.getResultValue() !== 0 ? g : h;
+            }
+            if (g === h) {
+                return g;
+            }
+            let result = this._computedTable.get(OPERATION_IDS.ite, f.getId(), g.getId(), h.getId());
+            if (result === undefined) {
+                result = this.expand([f, g, h], (successors) => iteNodes(successors[0], successors[1], successors[2]));
+                this._computedTable.set(OPERATION_IDS.ite, f.getId(), g.getId(), h.getId(), result);
+            }
+            return result;
+        };
+
+        return this.applyToRoots([mddF, mddG, mddH], (roots) => iteNodes(roots[0], roots[1], roots[2]));
+    }
+
+    /**
+     * Creates the node on the topmost level of the operands, its successor for each decision is computed
+     * from the successors of the operands on that level (operands on lower levels stay the same).
+     * @param {Array} operands - The operand nodes, at least one of them is an internal node.
+     * @param {function(Array): (InternalNode|TerminalNode)} compute - Computes the result for the successors.
+     * @returns {InternalNode|TerminalNode} - The result node.
+     * @throws {RangeError} - If operands on the same level have a different number of successors.
+     */
+    expand(operands, compute) {
+        let level = Infinity;
+        let decisionsCount = 0;
+        for (const operand of operands) {
+            if (!(operand instanceof TerminalNode) && operand.getIndex() <= level) {
+                const successorsCount = operand.getSuccessors().length;
+                if (operand.getIndex() === level && successorsCount !== decisionsCount) {
+                    throw new RangeError(`Variable x${level} has ${decisionsCount} values in one operand and ${successorsCount} in another.`);
+                }
+                level = operand.getIndex();
+                decisionsCount = successorsCount;
+            }
+        }
+
+        const successors = new Array(decisionsCount);
+        for (let decision = 0; decision < decisionsCount; decision++) {
+            successors[decision] = compute(operands.map(operand =>
+                operand instanceof TerminalNode || operand.getIndex() !== level ? operand : operand.getSuccessors()[decision]));
+        }
+        return this._nodeFactory.createInternalNode(level, successors);
+    }
+
+    /**
+     * Computes the result from the roots of the diagrams and reports operands with different domains.
+     * @param {MDD[]} mdds - The operands.
+     * @param {function(Array): (InternalNode|TerminalNode)} compute - Computes the result for the roots.
+     * @returns {MDD|null} - The resulting MDD, or null if the operands have different domains.
+     */
+    applyToRoots(mdds, compute) {
+        try {
+            return this._nodeFactory.createDiagram(compute(mdds.map(mdd => mdd.getRoot())));
+        } catch (error) {
+            if (!(error instanceof RangeError)) {
+                throw error;
+            }
+            console.error(`Apply cannot be performed. ${error.message}`);
+            return null;
+        }
+    }
+
+    /**
+     * Gets the id identifying the operation in the computed table.
+     * @param {string|Function} operation - Name of the operation or the function.
+     * @returns {number} - The id of the named operation, or an id given to the function.
+     */
+    getOperationId(operation) {
+        if (typeof operation !== "function") {
+            return OPERATION_IDS[operation];
+        }
+        if (!this._operationIds.has(operation)) {
+            this._operationIds.set(operation, this._nextOperationId++);
+        }
+        return this._operationIds.get(operation);
+    }
+}
+
+if (typeof window !== 'undefined') {
+    window.ApplyEngine = ApplyEngine;
+}
+
+export { ApplyEngine, ComputedTable };
+
+// Enable CommonJS only if running in Node.js (Jest)
+if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
+    module.exports = { ApplyEngine, ComputedTable };
+}
@@ -0,0 +1,659 @@
+import { TerminalNode, MDD, validateAssignments, validateAssignment } from "./diagram.js";
+import { NodeFactory } from "./nodeFactory.js";
+
+/**
+ * Class CompactMDD representing diagram stored in typed arrays instead of one object per node.
+ * Internal nodes are identified by non-negative ids. Terminal nodes are identified by negative ids,
+ * where id -1 is the first terminal, id -2 the second one and so on.
+ */
+class CompactMDD {
+    /**
+     * Constructs a CompactMDD from its arrays.
+     * @param {Int32Array} levels - Index (level) of each internal node.
+     * @param {Int32Array} successorOffsets - Position of the first successor of each internal node in successors.
+     *                                        It has one more element than levels, the last one is the length of successors.
+     * @param {Int32Array} successors - Ids of successors of all internal nodes, stored one after another.
+     * @param {TerminalNode[]} terminals - Terminal nodes, terminal with id -k is stored at position k-1.
+     * @param {number} rootId - The id of the root node.
+     * @param {{nodeFactory: CompactNodeFactory, collectionCount: number, rootId: number}|null} origin - The factory
+     *        which created the diagram, the number of its garbage collections and the id of the root in it.
+     */
+    constructor(levels, successorOffsets, successors, terminals, rootId, origin = null) {
+        this._levels = levels;
+        this._successorOffsets = successorOffsets;
+        this._successors = successors;
+        this._terminals = terminals;
+        this._rootId = rootId;
+        this._origin = origin;
+    }
+
+    /**
+     * Gets the id of the root node of the MDD.
+     * @returns {number} The id of the root node.
+     */
+    getRoot() {
+        return this._rootId;
+    }
+
+    /**
+     * Gets the number of internal nodes.
+     * @returns {number} The number of internal nodes.
+     */
+    getNodeCount() {
+        return this._levels.length;
+    }
+
+    /**
+     * Checks if the id belongs to a terminal node.
+     * @param {number} id - The id of the node.
+     * @returns {boolean} True if the node is a terminal node, false otherwise.
+     */
+    isTerminal(id) {
+        return id < 0;
+    }
+
+    /**
+     * Gets the terminal node with the given id.
+     * @param {number} id - The (negative) id of the terminal node.
+     * @returns {TerminalNode} The terminal node.
+     */
+    getTerminal(id) {
+        return this._terminals[-id - 1];
+    }
+
+    /**
+     * Gets the index of the internal node.
+     * @param {number} id - The id of the internal node.
+     * @returns {number} The index of the internal node.
+     */
+    getIndex(id) {
+        return this._levels[id];
+    }
+
+    /**
+     * Gets the number of successors of the internal node.
+     * @param {number} id - The id of the internal node.
+     * @returns {number} The number of successors.
+     */
+    getSuccessorsCount(id) {
+        return this._successorOffsets[id + 1] - this._successorOffsets[id];
+    }
+
+    /**
+     * Gets the id of the successor of the internal node.
+     * @param {number} id - The id of the internal node.
+     * @param {number} decision - The decision leading to the successor.
+     * @returns {number} The id of the successor.
+     */
+    getSuccessor(id, decision) {
+        return this._successors[this._successorOffsets[id] + decision];
+    }
+
+    /**
+     * Method evaluate evaluates the result of the given variablesValues in the MDD.
+     * It works the same way as MDD.evaluate.
+     * @param {number[]} variablesValues - An array of integers such as: [0,1,0,0,0,1] representing the decision variablesValues.
+     * @returns {TerminalNode|null} The result of the evaluation, which is TerminalNode if found, or null if not found.
+     */
+    evaluate(variablesValues) {
+        let currentId = this._rootId;
+
+        while (currentId >= 0) {
+            const index = this._levels[currentId];
+            const decision = variablesValues[index];
+            const offset = this._successorOffsets[currentId];
+            if ((variablesValues.length - 1) < index || decision > (this._successorOffsets[currentId + 1] - offset - 1)) {
+                console.error(`Invalid decision at node index ${index}: Either the decision exceeds the number of node's successors or it is beyond the provided decisions' scope.`);
+                return null;
+            }
+            currentId = this._successors[offset + decision];
+        }
+        return this._terminals[-currentId - 1];
+    }
+
+    /**
+     * Evaluates many assignments at once. It works the same way as MDD.evaluateBatch.
+     * @param {Int32Array|Uint8Array|number[]} assignments - Flat array of assignments, one row of variablesCount values for each assignment.
+     * @param {number} variablesCount - The number of variables in one assignment.
+     * @param {Int32Array|null} results - Array for storing the results, it is created if not provided.
+     * @returns {Int32Array|null} Result value of each assignment, or null if any of the assignments is invalid.
+     */
+    evaluateBatch(assignments, variablesCount, results = null) {
+        const levelSizes = this.getLevelSizes(variablesCount);
+        if (levelSizes === null || !validateAssignments(assignments, levelSizes)) {
+            return null;
+        }
+
+        const assignmentsCount = assignments.length / variablesCount;
+        results = results || new Int32Array(assignmentsCount);
+        const terminalValues = this._terminals.map(terminal => terminal.getResultValue());
+        const levels = this._levels;
+        const successorOffsets = this._successorOffsets;
+        const successors = this._successors;
+        for (let row = 0, rowStart = 0; row < assignmentsCount; row++, rowStart += variablesCount) {
+            let currentId = this._rootId;
+            while (currentId >= 0) {
+                currentId = successors[successorOffsets[currentId] + assignments[rowStart + levels[currentId]]];
+            }
+            results[row] = terminalValues[-currentId - 1];
+        }
+        return results;
+    }
+
+    /**
+     * Creates the diagram of the function which differs from this one only in the value of one assignment.
+     * It works the same way as MDD.setValue, the nodes are changed in the node factory by setValueId.
+     * @param {number[]} assignment - Values of the variables.
+     * @param {number} value - The new value of the function for the assignment.
+     * @param {number[]|Int32Array} domains - An array representing the domains of variables.
+     * @param {CompactNodeFactory} nodeFactory - Node factory used for creating the nodes.
+     * @returns {CompactMDD|null} The changed diagram, or null if the assignment is invalid.
+     */
+    setValue(assignment, value, domains, nodeFactory) {
+        if (!validateAssignment(assignment, domains)) {
+            return null;
+        }
+
+        return nodeFactory.createDiagram(nodeFactory.setValueId(nodeFactory.getDiagramRoot(this), assignment, value, domains));
+    }
+
+    /**
+     * Finds the number of successors of nodes on each level of the diagram.
+     * Levels without any node get Infinity, as any decision is valid there.
+     * @param {number} variablesCount - The number of variables (levels).
+     * @returns {number[]|null} The number of successors for each level, or null if a node has index out of range.
+     */
+    getLevelSizes(variablesCount) {
+        const levelSizes = new Array(variablesCount).fill(Infinity);
+        for (let id = 0; id < this._levels.length; id++) {
+            const index = this._levels[id];
+            if (index >= variablesCount) {
+                console.error(`Evaluation cannot be performed. The diagram contains node index ${index}, but only ${variablesCount} variables are provided.`);
+                return null;
+            }
+            levelSizes[index] = Math.min(levelSizes[index], this.getSuccessorsCount(id));
+        }
+        return levelSizes;
+    }
+
+    /**
+     * Converts the diagram to the object representation made of InternalNode and TerminalNode.
+     * @param {NodeFactory} nodeFactory - Node factory used for creating the nodes.
+     * @returns {MDD} The MDD with the same structure.
+     */
+    toMDD(nodeFactory = new NodeFactory()) {
+        const terminals = this._terminals.map(terminal => nodeFactory.createTerminalNode(terminal.getResultValue()));
+        const nodes = new Array(this._levels.length);
+
+        // Successors always have smaller ids than their predecessors, so nodes are created bottom-up.
+        for (let id = 0; id < this._levels.length; id++) {
+            const successors = [];
+            for (let i = this._successorOffsets[id]; i < this._successorOffsets[id + 1]; i++) {
+                const successorId = this._successors[i];
+                successors.push(successorId < 0 ? terminals[-successorId - 1] : nodes[successorId]);
+            }
+            nodes[id] = nodeFactory.createInternalNode(this._levels[id], successors);
+        }
+
+        return new MDD(this._rootId < 0 ? terminals[-this._rootId - 1] : nodes[this._rootId]);
+    }
+
+    /**
+     * Gets the arrays of the diagram, e.g. to send them to another thread as transferable buffers.
+     * @returns {{levels: Int32Array, successorOffsets: Int32Array, successors: Int32Array, terminalValues: Float64Array, rootId: number}}
+     *          The arrays (see the constructor), terminal nodes are given by their values.
+     */
+    getBuffers() {
+        return {
+            levels: this._levels,
+            successorOffsets: this._successorOffsets,
+            successors: this._successors,
+            terminalValues: Float64Array.from(this._terminals, terminal => terminal.getResultValue()),
+            rootId: this._rootId,
+        };
+    }
+
+    /**
+     * Creates a CompactMDD from the arrays returned by getBuffers.
+     * @param {Object} buffers - The arrays {levels, successorOffsets, successors, terminalValues, rootId}.
+     * @returns {CompactMDD} The diagram.
+     */
+    static fromBuffers(buffers) {
+        const terminals = Array.from(buffers.terminalValues, value => new TerminalNode(value));
+        return new CompactMDD(buffers.levels, buffers.successorOffsets, buffers.successors, terminals, buffers.rootId);
+    }
+
+    /**
+     * Creates a CompactMDD with the same structure as the given MDD.
+     * @param {MDD} mdd - The MDD made of InternalNode and TerminalNode objects.
+     * @returns {CompactMDD} The compact representation of the MDD.
+     */
+    static fromMDD(mdd) {
+        const nodeFactory = new CompactNodeFactory();
+        const ids = new Map();
+
+        // Each frame holds [node, visited], successors are converted before the node itself.
+        const stack = [[mdd.getRoot(), false]];
+        while (stack.length > 0) {
+            const frame = stack.pop();
+            const node = frame[0];
+            if (ids.has(node)) {
+                continue;
+            }
+
+            if (node instanceof TerminalNode) {
+                ids.set(node, nodeFactory.createTerminalNode(node.getResultValue()));
+            } else if (frame[1]) {
+                const successors = node.getSuccessors().map(successor => ids.get(successor));
+                ids.set(node, nodeFactory.createInternalNode(node.getIndex(), successors));
+            } else {
+                stack.push([node, true]);
+                for (const successor of node.getSuccessors()) {
+                    if (!ids.has(successor)) {
+                        stack.push([successor, false]);
+                    }
+                }
+            }
+        }
+
+        return nodeFactory.createDiagram(ids.get(mdd.getRoot()));
+    }
+}
+
+/**
+ * CompactNodeFactory class responsible for creating nodes of the CompactMDD.
+ * It has the same interface as NodeFactory, but nodes are represented by integer ids.
+ */
+class CompactNodeFactory {
+    /**
+     * Constructs a CompactNodeFactory with empty arrays for storing nodes.
+     * @param {number} initialCapacity - Number of internal nodes that can be stored before the arrays grow.
+     */
+    constructor(initialCapacity = 1024) {
+        // Stores unique terminal nodes. Key is the value, value is the (negative) id of the terminal node.
+        this._terminalTable = new Map();
+        this._terminals = [];
+
+        // Arrays of internal nodes, see CompactMDD for their meaning.
+        this._nodeCount = 0;
+        this._collectionCount = 0; // Ids of diagrams created before the last collection are no longer valid
+        this._levels = new Int32Array(Math.max(initialCapacity, 1));
+        this._successorOffsets = new Int32Array(this._levels.length + 1);
+        this._successors = new Int32Array(this._levels.length * 2);
+
+        // Open addressing unique table. It stores id + 1 of internal nodes, 0 marks an empty slot.
+        // Its length is a power of two, so the hash can be masked instead of using modulo.
+        this._uniqueTable = new Int32Array(2 ** Math.ceil(Math.log2(Math.max(initialCapacity, 1) * 2)));
+    }
+
+    /**
+     * Generates a numeric hash key of the index and ids of successors.
+     * @param {number} index - The index of the node.
+     * @param {number[]} successors - Ids of successors of the node.
+     * @returns {number} A 32-bit hash of the index and successors.
+     */
+    makeHashKey(index, successors = []) {
+        let hash = Math.imul(index ^ 0x811c9dc5, 0x01000193);
+        for (let i = 0; i < successors.length; i++) {
+            hash = Math.imul(hash ^ successors[i], 0x01000193);
+        }
+        return hash ^ (hash >>> 16);
+    }
+
+    /**
+     * Checks if the node has the given index and exactly the same successors.
+     * @param {number} id - The id of the internal node to compare.
+     * @param {number} index - The index of the node.
+     * @param {number[]} successors - Ids of successors of the node.
+     * @returns {boolean} True if the node matches the index and successors, false otherwise.
+     */
+    isSameNode(id, index, successors = []) {
+        const offset = this._successorOffsets[id];
+        if (this._levels[id] !== index || this._successorOffsets[id + 1] - offset !== successors.length) {
+            return false;
+        }
+        for (let i = 0; i < successors.length; i++) {
+            if (this._successors[offset + i] !== successors[i]) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    /**
+     * Checks if a node is considered redundant, which means all its successors are the same node.
+     * @param {number[]} successors - Ids of successors of the node.
+     * @returns {boolean} True if the node is redundant, false otherwise.
+     */
+    isRedundant(successors = []) {
+        if (successors.length === 0) {
+            return false;
+        }
+        for (let i = 1; i < successors.length; i++) {
+            if (successors[i] !== successors[0]) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    /**
+     * Creates or retrieves a terminal node with the specified value.
+     * @param {number} value - The value for the terminal node.
+     * @returns {number} The (negative) id of the terminal node.
+     */
+    createTerminalNode(value) {
+        let id = this._terminalTable.get(value);
+        if (id === undefined) {
+            this._terminals.push(new TerminalNode(value));
+            id = -this._terminals.length;
+            this._terminalTable.set(value, id);
+        }
+        return id;
+    }
+
+    /**
+     * Creates or retrieves an internal node with the given index and successors.
+     * If the node would be redundant, the id of its only successor is returned.
+     * @param {number} index - The index of the node.
+     * @param {number[]} successors - Ids of successors of the node.
+     * @returns {number} The id of the internal node, or in the case of redundancy, the id of the common successor.
+     */
+    createInternalNode(index, successors = []) {
+        if (this.isRedundant(successors)) {
+            return successors[0];
+        }
+
+        const mask = this._uniqueTable.length - 1;
+        let slot = this.makeHashKey(index, successors) & mask;
+        while (this._uniqueTable[slot] !== 0) {
+            const id = this._uniqueTable[slot] - 1;
+            if (this.isSameNode(id, index, successors)) {
+                return id;
+            }
+            slot = (slot + 1) & mask;
+        }
+
+        const id = this.addNode(index, successors);
+        this._uniqueTable[slot] = id + 1;
+        if (this._nodeCount * 2 > this._uniqueTable.length) {
+            this.growUniqueTable();
+        }
+        return id;
+    }
+
+    /**
+     * Stores a new internal node in the arrays, growing them if needed.
+     * @param {number} index - The index of the node.
+     * @param {number[]} successors - Ids of successors of the node.
+     * @returns {number} The id of the new internal node.
+     */
+    addNode(index, successors) {
+        const id = this._nodeCount++;
+        if (id >= this._levels.length) {
+            this._levels = growArray(this._levels, this._levels.length * 2);
+            this._successorOffsets = growArray(this._successorOffsets, this._levels.length + 1);
+        }
+
+        const offset = this._successorOffsets[id];
+        if (offset + successors.length > this._successors.length) {
+            this._successors = growArray(this._successors, Math.max(this._successors.length * 2, offset + successors.length));
+        }
+
+        this._levels[id] = index;
+        this._successors.set(successors, offset);
+        this._successorOffsets[id + 1] = offset + successors.length;
+        return id;
+    }
+
+    /**
+     * Doubles the size of the unique table and inserts all internal nodes again.
+     * @returns {void}
+     */
+    growUniqueTable() {
+        this.rebuildUniqueTable(this._uniqueTable.length * 2);
+    }
+
+    /**
+     * Creates an empty unique table of the given length and inserts all internal nodes.
+     * @param {number} length - Length of the table, a power of two.
+     * @returns {void}
+     */
+    rebuildUniqueTable(length) {
+        this._uniqueTable = new Int32Array(length);
+        const mask = this._uniqueTable.length - 1;
+        for (let id = 0; id < this._nodeCount; id++) {
+            const successors = this._successors.subarray(this._successorOffsets[id], this._successorOffsets[id + 1]);
+            let slot = this.makeHashKey(this._levels[id], successors) & mask;
+            while (this._uniqueTable[slot] !== 0) {
+                slot = (slot + 1) & mask;
+            }
+            this._uniqueTable[slot] = id + 1;
+        }
+    }
+
+    /**
+     * Gets the number of stored internal nodes.
+     * @returns {number} The number of internal nodes.
+     */
+    getNodeCount() {
+        return this._nodeCount;
+    }
+
+    /**
+     * Removes nodes which cannot be reached from any of the roots (mark and sweep).
+     * The kept internal nodes are moved to the start of the arrays in their original order, so successors still have
+     * smaller ids than their predecessors, but the ids change. The kept terminal nodes are numbered again the same way.
+     * @param {number[]} roots - Ids of the root nodes of the diagrams which are still used.
+     * @returns {Int32Array} The new ids of the roots.
+     */
+    collectGarbage(roots) {
+        // Successors have smaller ids, so one pass from the last node marks everything reachable
+        const reachable = new Uint8Array(this._nodeCount);
+        const reachableTerminals = new Uint8Array(this._terminals.length); // By -id - 1
+        for (const root of roots) {
+            if (root >= 0) {
+                reachable[root] = 1;
+            } else {
+                reachableTerminals[-root - 1] = 1;
+            }
+        }
+        for (let id = this._nodeCount - 1; id >= 0; id--) {
+            if (reachable[id] === 1) {
+                for (let i = this._successorOffsets[id]; i < this._successorOffsets[id + 1]; i++) {
+                    const successor = this._successors[i];
+                    if (successor >= 0) {
+                        reachable[successor] = 1;
+                    } else {
+                        reachableTerminals[-successor - 1] = 1;
+                    }
+                }
+            }
+        }
+
+        // Keep the reachable terminal nodes in their original order
+        const newTerminalIds = this.compactTerminals(reachableTerminals);
+        this._terminals = this._terminals.filter((terminal, i) => reachableTerminals[i] === 1);
+        this._terminalTable.clear();
+        this._terminals.forEach((terminal, i) => this._terminalTable.set(terminal.getResultValue(), -i - 1));
+
+        // Move the kept nodes in place, nothing is written past the position being read
+        const newIds = new Int32Array(this._nodeCount);
+        let keptCount = 0;
+        let offset = 0;
+        let start = this._successorOffsets[0];
+        for (let id = 0; id < this._nodeCount; id++) {
+            const end = this._successorOffsets[id + 1];
+            if (reachable[id] === 1) {
+                newIds[id] = keptCount;
+                this._levels[keptCount] = this._levels[id];
+                for (let i = start; i < end; i++) {
+                    const successor = this._successors[i];
+                    this._successors[offset++] = successor < 0 ? newTerminalIds[-successor - 1] : newIds[successor];
+                }
+                this._successorOffsets[++keptCount] = offset;
+            }
+            start = end;
+        }
+        this._nodeCount = keptCount;
+        this._collectionCount++;
+        this.rebuildUniqueTable(this._uniqueTable.length);
+
+        return Int32Array.from(roots, root => root < 0 ? newTerminalIds[-root - 1] : newIds[root]);
+    }
+
+    /**
+     * Numbers the kept terminal nodes again in their original order.
+     * @param {Uint8Array} keptTerminals - 1 for each kept terminal node, terminal with id -k is at position k-1.
+     * @returns {Int32Array} The new ids of the kept terminal nodes, at the same positions.
+     */
+    compactTerminals(keptTerminals) {
+        const newTerminalIds = new Int32Array(keptTerminals.length);
+        let keptCount = 0;
+        for (let i = 0; i < keptTerminals.length; i++) {
+            if (keptTerminals[i] === 1) {
+                newTerminalIds[i] = -++keptCount;
+            }
+        }
+        return newTerminalIds;
+    }
+
+    /**
+     * Creates the diagram from the nodes reachable from the root. The factory may hold nodes of other diagrams,
+     * so the reachable nodes are copied and numbered again in their original order (successors keep smaller ids).
+     * The same holds for the reachable terminal nodes.
+     * @param {number} rootId - The id of the root node.
+     * @returns {CompactMDD} The diagram with the given root.
+     */
+    createDiagram(rootId) {
+        // Find the reachable nodes
+        const reachable = [];
+        const visited = new Uint8Array(this._nodeCount);
+        const reachableTerminals = new Uint8Array(this._terminals.length); // By -id - 1
+        if (rootId >= 0) {
+            visited[rootId] = 1;
+            reachable.push(rootId);
+        } else {
+            reachableTerminals[-rootId - 1] = 1;
+        }
+        for (let i = 0; i < reachable.length; i++) {
+            const id = reachable[i];
+            for (let j = this._successorOffsets[id]; j < this._successorOffsets[id + 1]; j++) {
+                const successor = this._successors[j];
+                if (successor < 0) {
+                    reachableTerminals[-successor - 1] = 1;
+                } else if (visited[successor] === 0) {
+                    visited[successor] = 1;
+                    reachable.push(successor);
+                }
+            }
+        }
+        const ids = Int32Array.from(reachable).sort();
+        const newTerminalIds = this.compactTerminals(reachableTerminals);
+        const terminals = this._terminals.filter((terminal, i) => reachableTerminals[i] === 1);
+
+        // Copy them with the new ids, which are their positions among the reachable nodes
+        const newIds = new Map();
+        ids.forEach((id, newId) => newIds.set(id, newId));
+        const levels = new Int32Array(ids.length);
+        const successorOffsets = new Int32Array(ids.length + 1);
+        let successorsLength = 0;
+        ids.forEach((id, newId) => {
+            levels[newId] = this._levels[id];
+            successorsLength += this._successorOffsets[id + 1] - this._successorOffsets[id];
+            successorOffsets[newId + 1] = successorsLength;
+        });
+        const successors = new Int32Array(successorsLength);
+        ids.forEach((id, newId) => {
+            let offset = successorOffsets[newId];
+            for (let j = this._successorOffsets[id]; j < this._successorOffsets[id + 1]; j++) {
+                const successor = this._successors[j];
+                successors[offset++] = successor < 0 ? newTerminalIds[-successor - 1] : newIds.get(successor);
+            }
+        });
+
+        return new CompactMDD(levels, successorOffsets, successors, terminals,
+            rootId < 0 ? newTerminalIds[-rootId - 1] : newIds.get(rootId), {nodeFactory: this, collectionCount: this._collectionCount, rootId});
+    }
+
+    /**
+     * Gets the id of the root of the diagram in this factory, e.g. for retaining it by a NodeManager.
+     * Ids of the diagram differ from the ids in the factory, so the diagram is added to the factory
+     * if it was not created by it or the factory has collected garbage since.
+     * @param {CompactMDD} mdd - The diagram.
+     * @returns {number} The id of the root node.
+     */
+    getDiagramRoot(mdd) {
+        const origin = mdd._origin;
+        if (origin !== null && origin.nodeFactory === this && origin.collectionCount === this._collectionCount) {
+            return origin.rootId;
+        }
+        const rootId = mdd.getRoot();
+        return rootId < 0 ? this.createTerminalNode(mdd.getTerminal(rootId).getResultValue()) : this.addDiagram(mdd)[rootId];
+    }
+
+    /**
+     * Changes the value of one assignment in the diagram with the given root, see CompactMDD.setValue.
+     * Only the nodes on the path of the assignment are created, so several changes can be made
+     * before the diagram is created from the returned root.
+     * @param {number} rootId - The id of the root node in this factory.
+     * @param {number[]} assignment - The valid assignment, one value for each variable.
+     * @param {number} value - The new value of the function for the assignment.
+     * @param {number[]} domains - Number of values of each variable.
+     * @returns {number} The id of the root node of the changed diagram.
+     */
+    setValueId(rootId, assignment, value, domains) {
+        const update = (id, level) => {
+            if (level === domains.length) {
+                return this.createTerminalNode(value);
+            }
+            // Successors are copied, because creating nodes may replace the arrays
+            const successors = id < 0 || this._levels[id] > level
+                ? new Array(domains[level]).fill(id)
+                : Array.from(this._successors.subarray(this._successorOffsets[id], this._successorOffsets[id + 1]));
+            successors[assignment[level]] = update(successors[assignment[level]], level + 1);
+            return this.createInternalNode(level, successors);
+        };
+
+        return update(rootId, 0);
+    }
+
+    /**
+     * Adds all nodes of the CompactMDD to the factory.
+     * @param {CompactMDD} mdd - The diagram.
+     * @returns {Int32Array} - Ids of the nodes in the factory by their ids in the diagram.
+     */
+    addDiagram(mdd) {
+        const ids = new Int32Array(mdd.getNodeCount());
+        const node = (id) => id < 0 ? this.createTerminalNode(mdd.getTerminal(id).getResultValue()) : ids[id];
+
+        // Successors always have smaller ids than their predecessors
+        for (let id = 0; id < ids.length; id++) {
+            const successors = new Array(mdd.getSuccessorsCount(id));
+            for (let decision = 0; decision < successors.length; decision++) {
+                successors[decision] = node(mdd.getSuccessor(id, decision));
+            }
+            ids[id] = this.createInternalNode(mdd.getIndex(id), successors);
+        }
+        return ids;
+    }
+}
+
+/**
+ * Copies the typed array into a new bigger typed array of the same type.
+ * @param {Int32Array} array - The array to copy.
+ * @param {number} length - The length of the new array.
+ * @returns {Int32Array} The new array.
+ */
+function growArray(array, length) {
+    const grownArray = new array.constructor(length);
+    grownArray.set(array);
+    return grownArray;
+}
+
+export { CompactMDD, CompactNodeFactory };
+
+// Enable CommonJS only if running in Node.js (Jest)
+if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
+    module.exports = { CompactMDD, CompactNodeFactory };
+}
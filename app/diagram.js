@@ -1,3 +1,6 @@
+// Counter used to give every node a stable integer identifier.
+let nextNodeId = 0;
+
 /**
  * Class InternalNode representing one InternalNode in diagram.
  * It has its index and holds array of its
@@ -10,10 +13,19 @@ class InternalNode {
      * @param {InternalNode[]} successors - An array of successor InternalNodes.
      */
     constructor(index, successors = []) {
+        this._id = nextNodeId++;
         this._index = index;
         this._successors = successors;
     }
 
+    /**
+     * Gets the unique identifier of the node.
+     * @returns {number} The identifier of the InternalNode.
+     */
+    getId() {
+        return this._id;
+    }
+
     /**
      * Gets the index of the node.
      * @returns {number} The index of the InternalNode.
@@ -84,9 +96,18 @@ class TerminalNode {
      * @param {number} value - The value that TerminalNode will represent.
      */
     constructor(value) {
+        this._id = nextNodeId++;
         this._value = value;
     }
 
+    /**
+     * Gets the unique identifier of the node.
+     * @returns {number} The identifier of the TerminalNode.
+     */
+    getId() {
+        return this._id;
+    }
+
     /**
      * Gets the result value of the node.
      * @returns {number} The result value.
@@ -154,6 +175,90 @@ class MDD {
         return CurrentNode;
     }
 
+    /**
+     * Evaluates many assignments at once. The assignments are validated once before the evaluation,
+     * so no checks are made while walking the diagram.
+     * @param {Int32Array|Uint8Array|number[]} assignments - Flat array of assignments, one row of variablesCount values for each assignment.
+     * @param {number} variablesCount - The number of variables in one assignment.
+     * @param {Int32Array|null} results - Array for storing the results, it is created if not provided.
+     * @returns {Int32Array|null} Result value of each assignment, or null if any of the assignments is invalid.
+     */
+    evaluateBatch(assignments, variablesCount, results = null) {
+        const levelSizes = this.getLevelSizes(variablesCount);
+        if (levelSizes === null || !validateAssignments(assignments, levelSizes)) {
+            return null;
+        }
+
+        const assignmentsCount = assignments.length / variablesCount;
+        results = results || new Int32Array(assignmentsCount);
+        const rootNode = this._rootNode;
+        for (let row = 0, rowStart = 0; row < assignmentsCount; row++, rowStart += variablesCount) {
+            let currentNode = rootNode;
+            while (!(currentNode instanceof TerminalNode)) {
+                currentNode = currentNode.getSuccessors()[assignments[rowStart + currentNode.getIndex()]];
+            }
+            results[row] = currentNode.getResultValue();
+        }
+        return results;
+    }
+
+    /**
+     * Creates the diagram of the function which differs from this one only in the value of one assignment.
+     * Only the nodes on the path of the assignment are created again, the rest of the diagram is shared,
+     * so the cost grows with the number of variables instead of the length of the truth vector.
+     * The diagram must be created by the node factory with variables in the input order, otherwise the result may not be reduced.
+     * @param {number[]} assignment - Values of the variables.
+     * @param {number} value - The new value of the function for the assignment.
+     * @param {number[]|Int32Array} domains - An array representing the domains of variables.
+     * @param {NodeFactory} nodeFactory - Node factory used for creating the nodes.
+     * @returns {MDD|null} The changed diagram, or null if the assignment is invalid.
+     */
+    setValue(assignment, value, domains, nodeFactory) {
+        if (!validateAssignment(assignment, domains)) {
+            return null;
+        }
+
+        const update = (node, level) => {
+            if (level === domains.length) {
+                return nodeFactory.createTerminalNode(value);
+            }
+            // Levels without a node on the path were removed as redundant, all decisions lead to the same node
+            const successors = node instanceof TerminalNode || node.getIndex() > level
+                ? new Array(domains[level]).fill(node)
+                : node.getSuccessors().slice();
+            successors[assignment[level]] = update(successors[assignment[level]], level + 1);
+            return nodeFactory.createInternalNode(level, successors);
+        };
+
+        return nodeFactory.createDiagram(update(this._rootNode, 0));
+    }
+
+    /**
+     * Finds the number of successors of nodes on each level of the diagram.
+     * Levels without any node get Infinity, as any decision is valid there.
+     * @param {number} variablesCount - The number of variables (levels).
+     * @returns {number[]|null} The number of successors for each level, or null if a node has index out of range.
+     */
+    getLevelSizes(variablesCount) {
+        const levelSizes = new Array(variablesCount).fill(Infinity);
+        const visited = new Set();
+        const stack = [this._rootNode];
+        while (stack.length > 0) {
+            const node = stack.pop();
+            if (node instanceof TerminalNode || visited.has(node)) {
+                continue;
+            }
+            visited.add(node);
+            if (node.getIndex() >= variablesCount) {
+                console.error(`Evaluation cannot be performed. The diagram contains node index ${node.getIndex()}, but only ${variablesCount} variables are provided.`);
+                return null;
+            }
+            levelSizes[node.getIndex()] = Math.min(levelSizes[node.getIndex()], node.getSuccessorsCount());
+            stack.push(...node.getSuccessors());
+        }
+        return levelSizes;
+    }
+
     /**
      * Evaluates route and prints the path through the diagram.
      * @param {number[]} variablesValues - An array of integers representing the decisions on nodes.
@@ -209,9 +314,53 @@ class MDD {
     }
 }
 
-export { InternalNode, TerminalNode, MDD };
+/**
+ * Validates assignments used for batch evaluation. Prints an error message for the first problem found.
+ * @param {Int32Array|Uint8Array|number[]} assignments - Flat array of assignments, one row of domains.length values for each assignment.
+ * @param {number[]} domains - The number of valid values of each variable.
+ * @returns {boolean} True if all assignments are valid, false otherwise.
+ */
+function validateAssignments(assignments, domains) {
+    const variablesCount = domains.length;
+    if (variablesCount === 0 || assignments.length % variablesCount !== 0) {
+        console.error(`Batch evaluation cannot be performed. The number of provided values (${assignments.length}) is not a multiple of the number of variables (${variablesCount}).`);
+        return false;
+    }
+
+    for (let i = 0, variable = 0; i < assignments.length; i++) {
+        const value = assignments[i];
+        if (!(value >= 0 && value < domains[variable]) || !Number.isInteger(value)) {
+            console.error(`Batch evaluation cannot be performed. Invalid value ${value} of variable x${variable} in assignment ${Math.floor(i / variablesCount)}.`);
+            return false;
+        }
+        variable = variable + 1 === variablesCount ? 0 : variable + 1;
+    }
+    return true;
+}
+
+/**
+ * Validates the assignment of a single row whose value is changed. Prints an error message for the first problem found.
+ * @param {number[]} assignment - Values of the variables.
+ * @param {number[]|Int32Array} domains - The number of valid values of each variable.
+ * @returns {boolean} True if the assignment is valid, false otherwise.
+ */
+function validateAssignment(assignment, domains) {
+    if (assignment.length !== domains.length) {
+        console.error(`Value cannot be set. The number of variable values (${assignment.length}) does not match the number of variables (${domains.length}).`);
+        return false;
+    }
+    for (let i = 0; i < domains.length; i++) {
+        if (!(assignment[i] >= 0 && assignment[i] < domains[i]) || !Number.isInteger(assignment[i])) {
+            console.error(`Value cannot be set. Invalid value ${assignment[i]} of variable x${i}.`);
+            return false;
+        }
+    }
+    return true;
+}
+
+export { InternalNode, TerminalNode, MDD, validateAssignments, validateAssignment };
 
 // Enable CommonJS only if running in Node.js (Jest)
 if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
-    module.exports = { InternalNode, TerminalNode, MDD };
+    module.exports = { InternalNode, TerminalNode, MDD, validateAssignments, validateAssignment };
 }
\ No newline at end of file
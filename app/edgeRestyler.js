@@ -0,0 +1,166 @@
+/**
+ * Colors offered in the edge color menus, as Graphviz writes them to SVG.
+ * Graphviz uses the X11 color scheme, so e.g. gray and purple differ from the SVG colors of the same name.
+ */
+const SVG_COLORS = {
+    black: "#000000",
+    red: "#ff0000",
+    blue: "#0000ff",
+    green: "#00ff00",
+    orange: "#ffa500",
+    purple: "#a020f0",
+    yellow: "#ffff00",
+    cyan: "#00ffff",
+    magenta: "#ff00ff",
+    brown: "#a52a2a",
+    gray: "#c0c0c0",
+    pink: "#ffc0cb",
+    navy: "#000080",
+    teal: "#008080",
+};
+
+// Dash patterns Graphviz writes for the edge styles, solid and bold edges have none
+const SVG_DASH_ARRAYS = {dashed: "5,2", dotted: "1,5"};
+
+// Edge styles which keep the edge in the SVG (invisible edges are left out of it entirely)
+const RESTYLABLE_STYLES = ["solid", "dashed", "dotted", "bold"];
+
+// Edge definition generated by Graph, the attributes are in the second group
+const EDGE_DEFINITION = /^( {4}\d+ -> \d+ \[)(.*)(\];)$/gm;
+
+/**
+ * Restyles an already rendered graph without running the Graphviz layout again.
+ *
+ * Colors and dash patterns of edges do not change the geometry of the graph, so the rendered SVG can be
+ * updated in place. Graphviz gives the SVG group of the n-th edge definition the id "edge<n>",
+ * which is used to find the decision of every edge in the SVG.
+ */
+class EdgeRestyler {
+    /**
+     * Constructs the restyler of a rendered graph.
+     * @param {Int32Array|number[]} edgeDecisions - The decision of each edge, see Graph.getEdgeDecisions.
+     */
+    constructor(edgeDecisions) {
+        this.edgeDecisions = edgeDecisions;
+        this.decisionsCount = edgeDecisions.reduce((count, decision) => Math.max(count, decision + 1), 0);
+    }
+
+    /**
+     * Checks whether the graph rendered with the previous settings can be restyled to the new ones.
+     * Fonts and labels change the sizes of the elements and invisible edges have no shapes in the SVG,
+     * so these changes need a new layout.
+     * @param {Graph} previousGraph - Graph with the settings the graph was rendered with.
+     * @param {Graph} graph - Graph with the new settings.
+     * @returns {boolean} - True if the SVG can be restyled in place.
+     */
+    canRestyle(previousGraph, graph) {
+        if (previousGraph.font !== graph.font || previousGraph.labelsEnabled !== graph.labelsEnabled) {
+            return false;
+        }
+
+        for (let decision = 0; decision < this.decisionsCount; decision++) {
+            for (const appearance of [previousGraph.getEdgeAppearance(decision), graph.getEdgeAppearance(decision)]) {
+                if (!RESTYLABLE_STYLES.includes(appearance.style) || !(appearance.color in SVG_COLORS)) {
+                    return false;
+                }
+                if (appearance.fontColor !== null && !(appearance.fontColor in SVG_COLORS)) {
+                    return false;
+                }
+            }
+        }
+        return true;
+    }
+
+    /**
+     * Replaces the attributes of the edges in the DOT string generated by Graph with the attributes of the new graph.
+     * @param {string} dotString - The DOT string of the rendered graph.
+     * @param {Graph} graph - Graph with the new settings.
+     * @returns {string|null} - The restyled DOT string, or null if its edges do not match the edge decisions.
+     */
+    restyleDOTString(dotString, graph) {
+        const attributesStrings = [];
+        let edgeIndex = 0;
+
+        const restyledDOTString = dotString.replace(EDGE_DEFINITION, (definition, start, attributes, end) => {
+            const decision = this.edgeDecisions[edgeIndex++];
+            if (decision === undefined) {
+                return definition;
+            }
+            if (attributesStrings[decision] === undefined) {
+                attributesStrings[decision] = graph.getEdgeAttributes(decision);
+            }
+            return start + attributesStrings[decision] + end;
+        });
+
+        return edgeIndex === this.edgeDecisions.length ? restyledDOTString : null;
+    }
+
+    /**
+     * Updates the attributes of the edge shapes in the rendered SVG, the same way Graphviz would draw them.
+     * @param {Element} svgElement - The rendered SVG element (or any of its ancestors).
+     * @param {Graph} graph - Graph with the new settings.
+     * @returns {void}
+     */
+    restyleSVGElement(svgElement, graph) {
+        const appearances = [];
+
+        for (const edgeElement of svgElement.querySelectorAll("g.edge")) {
+            const match = /^edge(\d+)$/.exec(edgeElement.getAttribute("id"));
+            const decision = match === null ? undefined : this.edgeDecisions[Number(match[1]) - 1];
+            if (decision === undefined) {
+                continue;
+            }
+            if (appearances[decision] === undefined) {
+                appearances[decision] = graph.getEdgeAppearance(decision);
+            }
+            const {style, color, fontColor} = appearances[decision];
+            const strokeWidth = style === "bold" ? "2" : null;
+
+            for (const shapeElement of edgeElement.children) {
+                switch (shapeElement.tagName) {
+                    case "path":
+                        shapeElement.setAttribute("stroke", SVG_COLORS[color]);
+                        setOptionalAttribute(shapeElement, "stroke-dasharray", SVG_DASH_ARRAYS[style] || null);
+                        setOptionalAttribute(shapeElement, "stroke-width", strokeWidth);
+                        break;
+                    case "polygon": // Arrowhead
+                        shapeElement.setAttribute("fill", SVG_COLORS[color]);
+                        shapeElement.setAttribute("stroke", SVG_COLORS[color]);
+                        setOptionalAttribute(shapeElement, "stroke-width", strokeWidth);
+                        break;
+                    case "text": // Label
+                        if (fontColor !== null) {
+                            shapeElement.setAttribute("fill", SVG_COLORS[fontColor]);
+                        }
+                        break;
+                }
+            }
+        }
+    }
+}
+
+/**
+ * Sets the attribute of the element, or removes it if there is no value.
+ * @param {Element} element - The element.
+ * @param {string} name - Name of the attribute.
+ * @param {string|null} value - Value of the attribute, null to remove it.
+ * @returns {void}
+ */
+function setOptionalAttribute(element, name, value) {
+    if (value === null) {
+        element.removeAttribute(name);
+    } else {
+        element.setAttribute(name, value);
+    }
+}
+
+if (typeof window !== 'undefined') {
+    window.EdgeRestyler = EdgeRestyler;
+}
+
+export { EdgeRestyler };
+
+// Enable CommonJS only if running in Node.js (Jest)
+if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
+    module.exports = { EdgeRestyler };
+}
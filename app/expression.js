@@ -0,0 +1,376 @@
+/**
+ * Expressions describing multi-valued functions, e.g. "(x0 + x1 * x2) % 3" or "x0 == 2 ? x1 : max(x1, x2)".
+ *
+ * Supported are whole numbers, variables x0, x1, ..., the operators + - * / % (integer division and remainder),
+ * comparisons == != < <= > >= and logical operators && || ! (which give 1 or 0), the conditional operator ?:,
+ * the functions min and max, and parentheses. An expression is parsed into a tree of nodes
+ * {type: "constant", value}, {type: "variable", index}, {type: "unary", operator, operand},
+ * {type: "binary", operator, left, right}, {type: "conditional", test, consequent, alternate}
+ * or {type: "call", name, args}. Every node also has minVariable, the smallest index of a variable in it.
+ */
+
+const BINARY_PRECEDENCE = {
+    "||": 1,
+    "&&": 2,
+    "==": 3, "!=": 3,
+    "<": 4, "<=": 4, ">": 4, ">=": 4,
+    "+": 5, "-": 5,
+    "*": 6, "/": 6, "%": 6,
+};
+
+const FUNCTIONS = {
+    min: Math.min,
+    max: Math.max,
+};
+
+// Tokens: numbers, variables, function names, operators and punctuation
+const TOKEN = /\s*(?:(\d+)|x(\d+)|([a-z]+)|(\|\||&&|==|!=|<=|>=|[-+*/%<>!?:(),]))/y;
+
+/**
+ * Parses the expression.
+ * @param {string} text - The expression.
+ * @returns {Object} - The root node of the expression tree.
+ * @throws {SyntaxError} - If the expression is not valid, the message contains the position of the error.
+ */
+function parseExpression(text) {
+    const tokens = tokenize(text);
+    let position = 0;
+
+    const peek = () => tokens[position].value;
+    const expect = (value) => {
+        if (peek() !== value) {
+            throw new SyntaxError(`Expected "${value}" at position ${tokens[position].start} of the expression.`);
+        }
+        position++;
+    };
+
+    function parseConditional() {
+        const test = parseBinary(1);
+        if (peek() !== "?") {
+            return test;
+        }
+        position++;
+        const consequent = parseConditional();
+        expect(":");
+        return createConditional(test, consequent, parseConditional());
+    }
+
+    function parseBinary(minPrecedence) {
+        let left = parseUnary();
+        while (BINARY_PRECEDENCE[peek()] >= minPrecedence) {
+            const operator = tokens[position++].value;
+            const right = parseBinary(BINARY_PRECEDENCE[operator] + 1);
+            left = createBinary(operator, left, right);
+        }
+        return left;
+    }
+
+    function parseUnary() {
+        const token = tokens[position];
+        if (token.value === "-" || token.value === "!") {
+            position++;
+            return createUnary(token.value, parseUnary());
+        }
+        return parsePrimary();
+    }
+
+    function parsePrimary() {
+        const token = tokens[position++];
+        if (token.type === "number") {
+            return createConstant(token.number);
+        }
+        if (token.type === "variable") {
+            return {type: "variable", index: token.number, minVariable: token.number};
+        }
+        if (token.type === "name" && FUNCTIONS[token.value] !== undefined) {
+            expect("(");
+            const args = [parseConditional()];
+            while (peek() === ",") {
+                position++;
+                args.push(parseConditional());
+            }
+            expect(")");
+            return createCall(token.value, args);
+        }
+        if (token.value === "(") {
+            const expression = parseConditional();
+            expect(")");
+            return expression;
+        }
+        throw new SyntaxError(`Unexpected ${token.type === "end" ? "end" : `"${token.value}"`} at position ${token.start} of the expression.`);
+    }
+
+    const expression = parseConditional();
+    if (tokens[position].type !== "end") {
+        throw new SyntaxError(`Unexpected "${peek()}" at position ${tokens[position].start} of the expression.`);
+    }
+    return expression;
+}
+
+/**
+ * Splits the expression into tokens.
+ * @param {string} text - The expression.
+ * @returns {Object[]} - The tokens {type, value, number, start}, the last one has the type "end".
+ * @throws {SyntaxError} - If the expression contains an unknown character.
+ */
+function tokenize(text) {
+    const tokens = [];
+    TOKEN.lastIndex = 0;
+    while (TOKEN.lastIndex < text.length) {
+        const start = TOKEN.lastIndex;
+        const match = TOKEN.exec(text);
+        if (match === null) {
+            const rest = text.slice(start);
+            if (rest.trim() === "") {
+                break;
+            }
+            throw new SyntaxError(`Unexpected character at position ${start + rest.length - rest.trimStart().length} of the expression.`);
+        }
+        const tokenStart = match.index + match[0].length - match[0].trimStart().length;
+        if (match[1] !== undefined) {
+            tokens.push({type: "number", value: match[1], number: Number(match[1]), start: tokenStart});
+        } else if (match[2] !== undefined) {
+            tokens.push({type: "variable", value: match[0].trim(), number: Number(match[2]), start: tokenStart});
+        } else if (match[3] !== undefined) {
+            tokens.push({type: "name", value: match[3], start: tokenStart});
+        } else {
+            tokens.push({type: "operator", value: match[4], start: tokenStart});
+        }
+    }
+    tokens.push({type: "end", value: undefined, start: text.length});
+    return tokens;
+}
+
+/**
+ * Replaces the variable with the given value and simplifies the expression.
+ * Parts of the expression without the variable are shared with the original expression.
+ * @param {Object} expression - The expression tree.
+ * @param {number} index - Index of the variable.
+ * @param {number} value - Value of the variable.
+ * @returns {Object} - The expression tree with the variable bound.
+ */
+function bindVariable(expression, index, value) {
+    if (expression.minVariable > index || !containsVariable(expression, index)) {
+        return expression;
+    }
+
+    switch (expression.type) {
+        case "variable":
+            return createConstant(value);
+        case "unary":
+            return createUnary(expression.operator, bindVariable(expression.operand, index, value));
+        case "binary":
+            return createBinary(expression.operator,
+                bindVariable(expression.left, index, value), bindVariable(expression.right, index, value));
+        case "conditional":
+            return createConditional(bindVariable(expression.test, index, value),
+                bindVariable(expression.consequent, index, value), bindVariable(expression.alternate, index, value));
+        case "call":
+            return createCall(expression.name, expression.args.map(arg => bindVariable(arg, index, value)));
+    }
+}
+
+/**
+ * Gets indexes of all variables in the expression. The result is cached in the expression node.
+ * @param {Object} expression - The expression tree.
+ * @returns {Set<number>} - The indexes of variables.
+ */
+function getExpressionVariables(expression) {
+    if (expression.variables === undefined) {
+        const variables = new Set();
+        collectVariables(expression, variables);
+        expression.variables = variables;
+    }
+    return expression.variables;
+}
+
+/**
+ * Checks whether the variable occurs in the expression. The result is cached in the expression node.
+ * @param {Object} expression - The expression tree.
+ * @param {number} index - Index of the variable.
+ * @returns {boolean} - True if the variable occurs in the expression.
+ */
+function containsVariable(expression, index) {
+    return getExpressionVariables(expression).has(index);
+}
+
+/**
+ * Adds indexes of all variables in the expression to the set.
+ * @param {Object} expression - The expression tree.
+ * @param {Set<number>} variables - The set of indexes.
+ * @returns {void}
+ */
+function collectVariables(expression, variables) {
+    if (expression.variables !== undefined) {
+        expression.variables.forEach(index => variables.add(index));
+        return;
+    }
+    switch (expression.type) {
+        case "variable":
+            variables.add(expression.index);
+            break;
+        case "unary":
+            collectVariables(expression.operand, variables);
+            break;
+        case "binary":
+            collectVariables(expression.left, variables);
+            collectVariables(expression.right, variables);
+            break;
+        case "conditional":
+            collectVariables(expression.test, variables);
+            collectVariables(expression.consequent, variables);
+            collectVariables(expression.alternate, variables);
+            break;
+        case "call":
+            expression.args.forEach(arg => collectVariables(arg, variables));
+            break;
+    }
+}
+
+/**
+ * Generates a string which is the same for equal expressions. The result is cached in the expression node.
+ * @param {Object} expression - The expression tree.
+ * @returns {string} - The key of the expression.
+ */
+function getExpressionKey(expression) {
+    if (expression.key === undefined) {
+        switch (expression.type) {
+            case "constant":
+                expression.key = String(expression.value);
+                break;
+            case "variable":
+                expression.key = `x${expression.index}`;
+                break;
+            case "unary":
+                expression.key = `${expression.operator}(${getExpressionKey(expression.operand)})`;
+                break;
+            case "binary":
+                expression.key = `(${getExpressionKey(expression.left)})${expression.operator}(${getExpressionKey(expression.right)})`;
+                break;
+            case "conditional":
+                expression.key = `(${getExpressionKey(expression.test)})?(${getExpressionKey(expression.consequent)}):(${getExpressionKey(expression.alternate)})`;
+                break;
+            case "call":
+                expression.key = `${expression.name}(${expression.args.map(getExpressionKey).join(",")})`;
+                break;
+        }
+    }
+    return expression.key;
+}
+
+/**
+ * Creates a constant node.
+ * @param {number} value - The value.
+ * @returns {Object} - The node.
+ */
+function createConstant(value) {
+    return {type: "constant", value: value, minVariable: Infinity};
+}
+
+/**
+ * Creates a unary operator node, or a constant if the operand is constant.
+ * @param {string} operator - The operator ("-" or "!").
+ * @param {Object} operand - The operand.
+ * @returns {Object} - The node.
+ */
+function createUnary(operator, operand) {
+    if (operand.type === "constant") {
+        return createConstant(operator === "-" ? -operand.value : Number(operand.value === 0));
+    }
+    return {type: "unary", operator: operator, operand: operand, minVariable: operand.minVariable};
+}
+
+/**
+ * Creates a binary operator node, or a constant if the result does not depend on the variables.
+ * Logical operators and multiplication are short-circuited, so e.g. "0 && x1" is simplified to 0.
+ * @param {string} operator - The operator.
+ * @param {Object} left - The left operand.
+ * @param {Object} right - The right operand.
+ * @returns {Object} - The node.
+ */
+function createBinary(operator, left, right) {
+    if (left.type === "constant" && right.type === "constant") {
+        return createConstant(applyBinaryOperator(operator, left.value, right.value));
+    }
+    for (const [constant, other] of [[left, right], [right, left]]) {
+        if (constant.type !== "constant") {
+            continue;
+        }
+        if ((operator === "&&" && constant.value === 0) || (operator === "*" && constant.value === 0)) {
+            return createConstant(0);
+        }
+        if (operator === "||" && constant.value !== 0) {
+            return createConstant(1);
+        }
+        if (operator === "+" && constant.value === 0) {
+            return other;
+        }
+    }
+    return {type: "binary", operator: operator, left: left, right: right,
+        minVariable: Math.min(left.minVariable, right.minVariable)};
+}
+
+/**
+ * Creates a conditional operator node, or the chosen branch if the test is constant.
+ * @param {Object} test - The condition.
+ * @param {Object} consequent - The value if the condition is not 0.
+ * @param {Object} alternate - The value if the condition is 0.
+ * @returns {Object} - The node.
+ */
+function createConditional(test, consequent, alternate) {
+    if (test.type === "constant") {
+        return test.value !== 0 ? consequent : alternate;
+    }
+    return {type: "conditional", test: test, consequent: consequent, alternate: alternate,
+        minVariable: Math.min(test.minVariable, consequent.minVariable, alternate.minVariable)};
+}
+
+/**
+ * Creates a function call node, or a constant if all arguments are constant.
+ * @param {string} name - Name of the function.
+ * @param {Object[]} args - The arguments.
+ * @returns {Object} - The node.
+ */
+function createCall(name, args) {
+    if (args.every(arg => arg.type === "constant")) {
+        return createConstant(FUNCTIONS[name](...args.map(arg => arg.value)));
+    }
+    return {type: "call", name: name, args: args, minVariable: Math.min(...args.map(arg => arg.minVariable))};
+}
+
+/**
+ * Applies the binary operator to two numbers.
+ * @param {string} operator - The operator.
+ * @param {number} a - The left operand.
+ * @param {number} b - The right operand.
+ * @returns {number} - The result.
+ * @throws {RangeError} - On division by zero.
+ */
+function applyBinaryOperator(operator, a, b) {
+    switch (operator) {
+        case "+": return a + b;
+        case "-": return a - b;
+        case "*": return a * b;
+        case "/":
+        case "%":
+            if (b === 0) {
+                throw new RangeError("Division by zero in the expression.");
+            }
+            return operator === "/" ? Math.trunc(a / b) : a % b;
+        case "==": return Number(a === b);
+        case "!=": return Number(a !== b);
+        case "<": return Number(a < b);
+        case "<=": return Number(a <= b);
+        case ">": return Number(a > b);
+        case ">=": return Number(a >= b);
+        case "&&": return Number(a !== 0 && b !== 0);
+        case "||": return Number(a !== 0 || b !== 0);
+    }
+}
+
+export { parseExpression, bindVariable, getExpressionKey, getExpressionVariables };
+
+// Enable CommonJS only if running in Node.js (Jest)
+if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
+    module.exports = { parseExpression, bindVariable, getExpressionKey, getExpressionVariables };
+}
@@ -1,4 +1,5 @@
 import { TerminalNode, InternalNode} from "./diagram.js";
+import { CompactMDD } from "./compactDiagram.js";
 
 /**
  * Class representing the Graph structure used for visualization.
@@ -9,6 +10,7 @@ class Graph {
         this.vertices = new Map(); // Map to store vertices by node reference
         this.edges = new Map();    // Map to store edges with {from, to, decision}
         this.vertexId = 0;         // Unique identifier for each vertex
+        this.terminalVertexIds = []; // IDs of vertices created for terminal nodes, in order of creation
 
         this.font = "Times-Roman"; // Default font for the whole graph
 
@@ -89,6 +91,22 @@ class Graph {
         this.labelColorMatchesEdge = enabled;
     }
 
+    /**
+     * Applies settings given as a plain object, e.g. settings received from the main thread by a worker.
+     * Settings which are not present in the object are left unchanged.
+     * @param {Object} settings - Object with optional properties font, edgeStyling, edgeColoring, labelsEnabled,
+     *                            labelColorMatchesEdge, edgeStyles (array of styles) and edgeColors (array of colors).
+     */
+    applySettings(settings = {}) {
+        if (settings.font !== undefined) this.setFont(settings.font);
+        if (settings.edgeStyling !== undefined) this.setEdgeStyling(settings.edgeStyling);
+        if (settings.edgeColoring !== undefined) this.setEdgeColoring(settings.edgeColoring);
+        if (settings.labelsEnabled !== undefined) this.setLabelsEnabled(settings.labelsEnabled);
+        if (settings.labelColorMatchesEdge !== undefined) this.setLabelColorMatchesEdge(settings.labelColorMatchesEdge);
+        (settings.edgeStyles || []).forEach((style, index) => this.setEdgeStyle(index, style));
+        (settings.edgeColors || []).forEach((color, index) => this.setEdgeColor(index, color));
+    }
+
     /**
      * Adds a vertex for a given node. If the node already exists, it reuses the existing vertex.
      * @param {TerminalNode|InternalNode} node - The node for which to add a vertex.
@@ -99,6 +117,7 @@ class Graph {
             const vertexId = this.vertexId++;
             if (node instanceof TerminalNode) {
                 this.vertices.set(node, {id: vertexId, value: node.getResultValue()});
+                this.terminalVertexIds.push(vertexId);
             } else {
                 this.vertices.set(node, {id: vertexId, index: node.getIndex()});
             }
@@ -121,23 +140,102 @@ class Graph {
     }
 
     /**
-     * Recursively traverses the Multi-valued Decision Diagram (MDD) and adds vertices and edges to the graph.
-     * @param {TerminalNode|InternalNode} node - The current node being traversed.
-     * @returns {number} - The unique ID of the vertex added for the current node.
+     * Traverses the Multi-valued Decision Diagram (MDD) and adds vertices and edges to the graph.
+     * Every node is visited exactly once, so shared subdiagrams are not walked again. An explicit stack
+     * is used instead of recursion, so deep diagrams cannot overflow the call stack.
+     * Vertices and edges are added in the same order as a depth-first recursive walk would add them.
+     * A CompactMDD can be passed instead of the root node, see traverseCompactMDD.
+     * @param {TerminalNode|InternalNode|CompactMDD} node - The root node of the traversed diagram.
+     * @returns {number} - The unique ID of the vertex added for the root node.
      */
     traverseMDD(node) {
-        let vertexId = this.addVertex(node); // Add vertex for the current node
+        if (node instanceof CompactMDD) {
+            return this.traverseCompactMDD(node);
+        }
+        if (this.vertices.has(node)) {
+            return this.vertices.get(node).id; // Subdiagram was already traversed
+        }
+        const rootVertexId = this.addVertex(node); // Add vertex for the root node
+
+        // Each frame holds [node, vertexId, decision] where decision is the next successor to process
+        const stack = [[node, rootVertexId, 0]];
+        while (stack.length > 0) {
+            const frame = stack[stack.length - 1];
+            const currentNode = frame[0];
 
-        if (node instanceof TerminalNode) {
-            return vertexId; // No successors to process for terminal nodes
+            if (currentNode instanceof TerminalNode || frame[2] >= currentNode.getSuccessorsCount()) {
+                stack.pop(); // No more successors to process for this node
+                continue;
+            }
+
+            const decision = frame[2];
+            const successor = currentNode.getSuccessors()[decision];
+            const successorVertex = this.vertices.get(successor);
+            if (successorVertex === undefined) {
+                // Visit the successor first, the edge is added once we return to this frame
+                stack.push([successor, this.addVertex(successor), 0]);
+            } else {
+                this.addEdge(frame[1], successorVertex.id, decision); // Add edge with decision index
+                frame[2]++;
+            }
         }
 
-        let successors = node.getSuccessors(); // Get the successors of the internal node
-        for (let decision = 0; decision < successors.length; decision++) {
-            const successorVertexId = this.traverseMDD(successors[decision]); // Recur for each successor
-            this.addEdge(vertexId, successorVertexId, decision); // Add edge with decision index
+        return rootVertexId;
+    }
+
+    /**
+     * Traverses the CompactMDD and adds vertices and edges to the graph in the same order as traverseMDD.
+     * Vertices are stored by node ids of the CompactMDD instead of node references.
+     * @param {CompactMDD} mdd - The traversed diagram.
+     * @returns {number} - The unique ID of the vertex added for the root node.
+     */
+    traverseCompactMDD(mdd) {
+        const rootId = mdd.getRoot();
+        if (this.vertices.has(rootId)) {
+            return this.vertices.get(rootId).id; // Diagram was already traversed
         }
+        const rootVertexId = this.addCompactVertex(mdd, rootId);
 
+        // Each frame holds [nodeId, vertexId, decision] where decision is the next successor to process
+        const stack = [[rootId, rootVertexId, 0]];
+        while (stack.length > 0) {
+            const frame = stack[stack.length - 1];
+            const currentId = frame[0];
+
+            if (mdd.isTerminal(currentId) || frame[2] >= mdd.getSuccessorsCount(currentId)) {
+                stack.pop(); // No more successors to process for this node
+                continue;
+            }
+
+            const decision = frame[2];
+            const successorId = mdd.getSuccessor(currentId, decision);
+            const successorVertex = this.vertices.get(successorId);
+            if (successorVertex === undefined) {
+                // Visit the successor first, the edge is added once we return to this frame
+                stack.push([successorId, this.addCompactVertex(mdd, successorId), 0]);
+            } else {
+                this.addEdge(frame[1], successorVertex.id, decision); // Add edge with decision index
+                frame[2]++;
+            }
+        }
+
+        return rootVertexId;
+    }
+
+    /**
+     * Adds a vertex for a node of the CompactMDD.
+     * @param {CompactMDD} mdd - The diagram containing the node.
+     * @param {number} nodeId - The id of the node in the diagram.
+     * @returns {number} - The unique ID of the added vertex.
+     */
+    addCompactVertex(mdd, nodeId) {
+        const vertexId = this.vertexId++;
+        if (mdd.isTerminal(nodeId)) {
+            this.vertices.set(nodeId, {id: vertexId, value: mdd.getTerminal(nodeId).getResultValue()});
+            this.terminalVertexIds.push(vertexId);
+        } else {
+            this.vertices.set(nodeId, {id: vertexId, index: mdd.getIndex(nodeId)});
+        }
         return vertexId;
     }
 
@@ -146,18 +244,49 @@ class Graph {
      * @returns {string} - The DOT string representing the graph.
      */
     toDOTString() {
-        let dotString = 'digraph DD {\n';
+        return Array.from(this.toDOTChunks()).join('');
+    }
 
-        dotString += this.getCoreGraphStyling();
+    /**
+     * Generates the DOT representation of the graph in chunks, so the whole string never has to be built.
+     * The chunks can be passed to a Blob, posted to a worker or written to a Node stream,
+     * e.g. new Blob([...graph.toDOTChunks()]) or Readable.from(graph.toDOTChunks()).
+     * @param {number} chunkSize - Minimal length of each chunk (except the last one) in characters.
+     * @returns {Generator<string>} - Generator yielding parts of the DOT string in order.
+     */
+    *toDOTChunks(chunkSize = 65536) {
+        let parts = [];
+        let partsLength = 0;
+        for (const line of this.generateDOTLines()) {
+            parts.push(line);
+            partsLength += line.length;
+            if (partsLength >= chunkSize) {
+                yield parts.join('');
+                parts = [];
+                partsLength = 0;
+            }
+        }
+        if (partsLength > 0) {
+            yield parts.join('');
+        }
+    }
+
+    /**
+     * Generates the DOT representation of the graph line by line.
+     * @returns {Generator<string>} - Generator yielding lines of the DOT string in order.
+     */
+    *generateDOTLines() {
+        yield 'digraph DD {\n';
+
+        yield this.getCoreGraphStyling();
 
         // Add vertices (terminal and internal nodes)
-        dotString += this.getVertexDefinitions();
+        yield* this.generateVertexDefinitions();
 
         // Add edges
-        dotString += this.getEdgeDefinitions();
+        yield* this.generateEdgeDefinitions();
 
-        dotString += '}';
-        return dotString;
+        yield '}';
     }
 
     /**
@@ -175,31 +304,28 @@ class Graph {
      * @returns {string}
      */
     getVertexDefinitions() {
-        let vertexDefinitions = '';
-
-        let terminalNodeIDs = [];
-        for (const [node, vertex] of this.vertices.entries()) {
-            if (node instanceof TerminalNode) {
-                terminalNodeIDs.push(vertex.id);
-            }
-        }
+        return Array.from(this.generateVertexDefinitions()).join('');
+    }
 
-        if (terminalNodeIDs.length > 0) {
-            vertexDefinitions += `    node [shape = square] ${terminalNodeIDs.join(' ')};\n`;
+    /**
+     * Generates vertex definitions line by line.
+     * @returns {Generator<string>}
+     */
+    *generateVertexDefinitions() {
+        if (this.terminalVertexIds.length > 0) {
+            yield `    node [shape = square] ${this.terminalVertexIds.join(' ')};\n`;
         }
 
-        vertexDefinitions += '    node [shape = circle];\n';
+        yield '    node [shape = circle];\n';
 
         // Add vertex labels
-        for (const [node, vertex] of this.vertices.entries()) {
-            if (node instanceof TerminalNode) {
-                vertexDefinitions += `    ${vertex.id} [label = "${vertex.value}"];\n`;
+        for (const vertex of this.vertices.values()) {
+            if (vertex.index === undefined) {
+                yield `    ${vertex.id} [label = "${vertex.value}"];\n`;
             } else {
-                vertexDefinitions += `    ${vertex.id} [label = <x<sub><font point-size="10">${vertex.index}</font></sub>>];\n`;
+                yield `    ${vertex.id} [label = <x<sub><font point-size="10">${vertex.index}</font></sub>>];\n`;
             }
         }
-
-        return vertexDefinitions;
     }
 
     /**
@@ -207,42 +333,88 @@ class Graph {
      * @returns {string}
      */
     getEdgeDefinitions() {
-        let edgeDefinitions = '';
+        return Array.from(this.generateEdgeDefinitions()).join('');
+    }
 
-        // Add edges
-        for (const { from, to, decision } of this.edges.values()) {
-            let edgeAttributes = [];
+    /**
+     * Generates edge definitions line by line. Attributes are built only once for each decision.
+     * @returns {Generator<string>}
+     */
+    *generateEdgeDefinitions() {
+        const attributesStrings = [];
 
-            // Apply styling if enabled
-            if (this.edgeStyling) {
-                let edgeStyle = this.edgeStyles[decision] || "solid";
-                edgeAttributes.push(`style="${edgeStyle}"`);
+        for (const { from, to, decision } of this.edges.values()) {
+            let attributesString = attributesStrings[decision];
+            if (attributesString === undefined) {
+                attributesString = this.getEdgeAttributes(decision);
+                attributesStrings[decision] = attributesString;
             }
+            yield `    ${from} -> ${to} [${attributesString}];\n`;
+        }
+    }
 
-            // Apply coloring if enabled
-            if (this.edgeColoring) {
-                let edgeColor = this.edgeColors[decision] || "black";
-                edgeAttributes.push(`color="${edgeColor}"`);
-            }
+    /**
+     * Gets the decisions of edges in the order of their definitions in the DOT string.
+     * @returns {Int32Array} - The decision of each edge.
+     */
+    getEdgeDecisions() {
+        const decisions = new Int32Array(this.edges.size);
+        let i = 0;
+        for (const edge of this.edges.values()) {
+            decisions[i++] = edge.decision;
+        }
+        return decisions;
+    }
 
-            // Add label if labels are enabled
-            if (this.labelsEnabled) {
-                let label = `label="${decision}"`;
-                if (this.labelColorMatchesEdge && this.edgeColoring) {
-                    let fontColor = `fontcolor="${this.edgeColors[decision] || "black"}"`;
-                    edgeAttributes.push(`${label}, ${fontColor}`);
-                } else {
-                    edgeAttributes.push(label);
-                }
-            }
+    /**
+     * Gets how the edges representing the given decision look with the current settings.
+     * @param {number} decision - The decision index associated with the edge.
+     * @returns {{style: string, color: string, fontColor: (string|null)}} - The style and color of the edge,
+     *          and the color of its label, which is null if labels are disabled.
+     */
+    getEdgeAppearance(decision) {
+        const style = this.edgeStyling ? this.edgeStyles[decision] || "solid" : "solid";
+        const color = this.edgeColoring ? this.edgeColors[decision] || "black" : "black";
+        let fontColor = null;
+        if (this.labelsEnabled) {
+            fontColor = this.labelColorMatchesEdge && this.edgeColoring ? color : "black";
+        }
+        return {style, color, fontColor};
+    }
 
-            // Join everything with a space and a comma
-            const attributesString = edgeAttributes.join(', ');
-            edgeDefinitions += `    ${from} -> ${to} [${attributesString}];\n`;
+    /**
+     * Generates the attributes of edges representing the given decision.
+     * @param {number} decision - The decision index associated with the edge.
+     * @returns {string} - The attributes separated by a comma.
+     */
+    getEdgeAttributes(decision) {
+        let edgeAttributes = [];
+
+        // Apply styling if enabled
+        if (this.edgeStyling) {
+            let edgeStyle = this.edgeStyles[decision] || "solid";
+            edgeAttributes.push(`style="${edgeStyle}"`);
         }
 
+        // Apply coloring if enabled
+        if (this.edgeColoring) {
+            let edgeColor = this.edgeColors[decision] || "black";
+            edgeAttributes.push(`color="${edgeColor}"`);
+        }
 
-        return edgeDefinitions;
+        // Add label if labels are enabled
+        if (this.labelsEnabled) {
+            let label = `label="${decision}"`;
+            if (this.labelColorMatchesEdge && this.edgeColoring) {
+                let fontColor = `fontcolor="${this.edgeColors[decision] || "black"}"`;
+                edgeAttributes.push(`${label}, ${fontColor}`);
+            } else {
+                edgeAttributes.push(label);
+            }
+        }
+
+        // Join everything with a space and a comma
+        return edgeAttributes.join(', ');
     }
 }
 
@@ -250,3 +422,10 @@ class Graph {
 if (typeof window !== 'undefined') {
     window.Graph = Graph;
 }
+
+export { Graph };
+
+// Enable CommonJS only if running in Node.js (Jest)
+if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
+    module.exports = { Graph };
+}
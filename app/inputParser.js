@@ -0,0 +1,111 @@
+const CHAR_0 = 48;
+const CHAR_9 = 57;
+const CHAR_COMMA = 44;
+
+/**
+ * Checks whether the character code is a whitespace which can separate numbers.
+ * @param {number} charCode - The character code.
+ * @returns {boolean} - True for a space, tab or line break.
+ */
+function isWhitespace(charCode) {
+    return charCode === 32 || charCode === 9 || charCode === 10 || charCode === 13;
+}
+
+/**
+ * Parses a list of whole numbers in a single pass, straight into a typed array.
+ * Numbers may be separated by commas, whitespace or both (e.g. "0, 1 2,3"). Two commas without a number
+ * between them, or a comma at the end, are treated as a missing number.
+ *
+ * @param {string} text - The text to parse.
+ * @param {Object} options - Optional properties:
+ *                           minValue (the smallest valid number, 0 by default),
+ *                           arrayType (Int32Array by default, e.g. Uint16Array for small numbers),
+ *                           expectedCount (the number of values expected, only this many values are stored).
+ * @returns {{values: (Int32Array|Uint16Array|null), count: number, errorPosition: number}} - The parsed values
+ *          (null if the text is invalid or the count differs from expectedCount), the number of values in the text,
+ *          and the position of the first invalid character or number (-1 if the text is valid).
+ */
+function parseNumberList(text, options = {}) {
+    const minValue = options.minValue !== undefined ? options.minValue : 0;
+    const ArrayType = options.arrayType || Int32Array;
+    const maxValue = ArrayType === Uint16Array ? 0xFFFF : 0x7FFFFFFF;
+    const expectedCount = options.expectedCount;
+
+    // Every number takes at least one character and one separator, unless it is the last one
+    let capacity = Math.ceil((text.length + 1) / 2);
+    if (expectedCount !== undefined) {
+        capacity = Math.min(capacity, expectedCount);
+    }
+    const values = new ArrayType(capacity);
+
+    let count = 0;
+    let position = 0;
+    let separated = true; // The next number is separated from the previous one (or there is none)
+    let commaPosition = -1; // Position of the comma after the last number, if there is one
+
+    while (position < text.length) {
+        const charCode = text.charCodeAt(position);
+
+        if (isWhitespace(charCode)) {
+            separated = true;
+            position++;
+        } else if (charCode === CHAR_COMMA) {
+            if (commaPosition !== -1 || count === 0) {
+                return invalidNumberList(count, position); // Missing number before the comma
+            }
+            separated = true;
+            commaPosition = position++;
+        } else if (charCode >= CHAR_0 && charCode <= CHAR_9 && separated) {
+            const start = position;
+            let value = 0;
+            do {
+                value = value * 10 + (text.charCodeAt(position) - CHAR_0);
+                position++;
+            } while (position < text.length && text.charCodeAt(position) >= CHAR_0 && text.charCodeAt(position) <= CHAR_9
+                     && value <= maxValue);
+
+            if (value > maxValue || value < minValue) {
+                return invalidNumberList(count, start);
+            }
+            if (count < capacity) {
+                values[count] = value;
+            }
+            count++;
+            separated = false;
+            commaPosition = -1;
+        } else {
+            return invalidNumberList(count, position);
+        }
+    }
+
+    if (commaPosition !== -1) {
+        return invalidNumberList(count, commaPosition); // Missing number after the last comma
+    }
+    if (count === 0) {
+        return invalidNumberList(0, 0);
+    }
+
+    const countMatches = expectedCount === undefined || count === expectedCount;
+    return {values: countMatches ? values.subarray(0, count) : null, count: count, errorPosition: -1};
+}
+
+/**
+ * Creates the result of parseNumberList for an invalid text.
+ * @param {number} count - The number of values parsed before the invalid position.
+ * @param {number} errorPosition - The position of the first invalid character or number.
+ * @returns {{values: null, count: number, errorPosition: number}}
+ */
+function invalidNumberList(count, errorPosition) {
+    return {values: null, count: count, errorPosition: errorPosition};
+}
+
+if (typeof window !== 'undefined') {
+    window.parseNumberList = parseNumberList;
+}
+
+export { parseNumberList };
+
+// Enable CommonJS only if running in Node.js (Jest)
+if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
+    module.exports = { parseNumberList };
+}
@@ -0,0 +1,70 @@
+/**
+ * Map with a bounded number of entries and least recently used eviction.
+ * It bounds the computed table of ApplyEngine.
+ */
+class LRUCache {
+    /**
+     * Constructs an empty cache.
+     * @param {number} maxEntries - Maximal number of stored entries.
+     */
+    constructor(maxEntries) {
+        this._maxEntries = maxEntries;
+        this._entries = new Map(); // Values by key, ordered from the least recently used
+    }
+
+    /**
+     * Gets the stored value and marks it as the most recently used one.
+     * @param {*} key - The key.
+     * @returns {*} The stored value, or undefined if there is none.
+     */
+    get(key) {
+        const value = this._entries.get(key);
+        if (value === undefined) {
+            return undefined;
+        }
+        this._entries.delete(key);
+        this._entries.set(key, value);
+        return value;
+    }
+
+    /**
+     * Stores the value, evicting the least recently used one if the cache is full.
+     * @param {*} key - The key.
+     * @param {*} value - The value, it must not be undefined.
+     * @returns {void}
+     */
+    set(key, value) {
+        this._entries.delete(key);
+        this._entries.set(key, value);
+        if (this._entries.size > this._maxEntries) {
+            this._entries.delete(this._entries.keys().next().value);
+        }
+    }
+
+    /**
+     * Gets the number of stored entries.
+     * @returns {number} The number of stored entries.
+     */
+    getSize() {
+        return this._entries.size;
+    }
+
+    /**
+     * Removes all stored entries.
+     * @returns {void}
+     */
+    clear() {
+        this._entries.clear();
+    }
+}
+
+if (typeof window !== 'undefined') {
+    window.LRUCache = LRUCache;
+}
+
+export { LRUCache };
+
+// Enable CommonJS only if running in Node.js (Jest)
+if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
+    module.exports = { LRUCache };
+}
@@ -0,0 +1,151 @@
+import { NodeFactory } from "./nodeFactory.js";
+import { parseExpression, bindVariable, getExpressionKey, getExpressionVariables } from "./expression.js";
+
+/**
+ * Builds reduced MDDs directly, without a truth vector whose length is the product of the domains.
+ *
+ * The diagram is built recursively level by level and every node is created by the node factory,
+ * so the unique table and the removal of redundant nodes keep the diagram reduced.
+ * Only the path from the root to the current node is kept in memory besides the diagram itself.
+ */
+class MDDConstructor {
+    /**
+     * Constructs the constructor of MDDs of functions with the given domains.
+     * @param {number[]|Int32Array} domains - An array representing the domains of variables.
+     * @param {NodeFactory|CompactNodeFactory} nodeFactory - Node factory used for creating the nodes.
+     *        Passing a CompactNodeFactory creates a CompactMDD instead of an MDD.
+     */
+    constructor(domains, nodeFactory = new NodeFactory()) {
+        this._domains = domains;
+        this._variablesCount = domains.length;
+        this._nodeFactory = nodeFactory;
+    }
+
+    /**
+     * Builds the MDD of a function given by a callback. The callback is called once for every assignment,
+     * so this is meant for functions which cannot be written as an expression.
+     * @param {function(number[]): number} callback - Returns the value of the function for an assignment.
+     *        The array of variable values is reused, the callback must not keep it.
+     * @returns {MDD|CompactMDD} - The MDD of the function.
+     */
+    fromFunction(callback) {
+        const nodeFactory = this._nodeFactory;
+        const assignment = new Array(this._variablesCount).fill(0);
+
+        const build = (level) => {
+            if (level === this._variablesCount) {
+                return nodeFactory.createTerminalNode(callback(assignment));
+            }
+            const successors = new Array(this._domains[level]);
+            for (let value = 0; value < this._domains[level]; value++) {
+                assignment[level] = value;
+                successors[value] = build(level + 1);
+            }
+            return nodeFactory.createInternalNode(level, successors);
+        };
+
+        return nodeFactory.createDiagram(build(0));
+    }
+
+    /**
+     * Builds the MDD of a function given by the rows of its truth table which differ from the default value.
+     * If more rows have the same assignment, the last one is used.
+     * @param {Array[]} rows - The rows [assignment, value], where assignment is an array of variable values.
+     * @param {number} defaultValue - The value of the function for assignments which are not in the rows.
+     * @returns {MDD|CompactMDD|null} - The MDD of the function, or null if any of the assignments is invalid.
+     */
+    fromSparseRows(rows, defaultValue = 0) {
+        for (let row = 0; row < rows.length; row++) {
+            const assignment = rows[row][0];
+            if (assignment.length !== this._variablesCount) {
+                console.error(`MDD cannot be built. The number of variable values (${assignment.length}) in row ${row} does not match the number of variables (${this._variablesCount}).`);
+                return null;
+            }
+            for (let i = 0; i < this._variablesCount; i++) {
+                if (!(assignment[i] >= 0 && assignment[i] < this._domains[i]) || !Number.isInteger(assignment[i])) {
+                    console.error(`MDD cannot be built. Invalid value ${assignment[i]} of variable x${i} in row ${row}.`);
+                    return null;
+                }
+            }
+        }
+
+        const nodeFactory = this._nodeFactory;
+        const defaultNode = nodeFactory.createTerminalNode(defaultValue);
+
+        // Rows are split by the value of the variable on each level, levels without rows get the default value.
+        const build = (rowIndexes, level) => {
+            if (rowIndexes.length === 0) {
+                return defaultNode;
+            }
+            if (level === this._variablesCount) {
+                return nodeFactory.createTerminalNode(rows[rowIndexes[rowIndexes.length - 1]][1]);
+            }
+            const parts = Array.from({length: this._domains[level]}, () => []);
+            for (const rowIndex of rowIndexes) {
+                parts[rows[rowIndex][0][level]].push(rowIndex);
+            }
+            return nodeFactory.createInternalNode(level, parts.map(part => build(part, level + 1)));
+        };
+
+        return nodeFactory.createDiagram(build(Array.from(rows.keys()), 0));
+    }
+
+    /**
+     * Builds the MDD of a function given by an expression, see expression.js for its syntax.
+     * After each variable is bound to a value, the rest of the expression is simplified, and equal
+     * simplified expressions on the same level share one node. Levels the expression does not depend on
+     * are skipped, so the work grows with the size of the diagram instead of the product of the domains.
+     * @param {string|Object} expression - The expression, or its tree returned by parseExpression.
+     * @returns {MDD|CompactMDD|null} - The MDD of the function, or null if the expression is not valid.
+     */
+    fromExpression(expression) {
+        try {
+            if (typeof expression === "string") {
+                expression = parseExpression(expression);
+            }
+            for (const index of getExpressionVariables(expression)) {
+                if (index >= this._variablesCount) {
+                    throw new RangeError(`Variable x${index} does not exist, the function has ${this._variablesCount} variables.`);
+                }
+            }
+
+            const nodeFactory = this._nodeFactory;
+            const nodesByLevel = Array.from({length: this._variablesCount}, () => new Map()); // Nodes by expression keys
+
+            const build = (expression, level) => {
+                if (expression.type === "constant") {
+                    return nodeFactory.createTerminalNode(expression.value);
+                }
+                level = Math.max(level, expression.minVariable);
+
+                const key = getExpressionKey(expression);
+                let node = nodesByLevel[level].get(key);
+                if (node === undefined) {
+                    const successors = new Array(this._domains[level]);
+                    for (let value = 0; value < this._domains[level]; value++) {
+                        successors[value] = build(bindVariable(expression, level, value), level + 1);
+                    }
+                    node = nodeFactory.createInternalNode(level, successors);
+                    nodesByLevel[level].set(key, node);
+                }
+                return node;
+            };
+
+            return nodeFactory.createDiagram(build(expression, 0));
+        } catch (error) {
+            console.error(`MDD cannot be built. ${error.message}`);
+            return null;
+        }
+    }
+}
+
+if (typeof window !== 'undefined') {
+    window.MDDConstructor = MDDConstructor;
+}
+
+export { MDDConstructor };
+
+// Enable CommonJS only if running in Node.js (Jest)
+if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
+    module.exports = { MDDConstructor };
+}
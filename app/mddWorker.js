@@ -0,0 +1,131 @@
+import { TruthTable } from "./table.js";
+import { Graph } from "./graph.js";
+import { CompactMDD } from "./compactDiagram.js";
+import { VariableReordering } from "./reordering.js";
+import { NodeManager } from "./nodeManager.js";
+
+// Node factory shared by all builds. The last built diagram is retained, so a re-render after a small change
+// of the truth vector finds most of its nodes in the unique table, older diagrams are collected over the limit.
+const nodeManager = new NodeManager();
+let lastBuild = null; // {domains, handle} of the last diagram built by the shared factory
+
+/**
+ * Builds the diagram by the shared node factory. If the changes against the last built truth vector are given
+ * and there are only a few of them, the last diagram is updated instead (see CompactNodeFactory.setValueId).
+ * @param {Int32Array|number[]} domains - An array representing the domains of variables.
+ * @param {Int32Array|number[]} truthVector - The truth vector of the function.
+ * @param {Int32Array|null} changes - Pairs of row index and new value, or null if they are not known.
+ * @returns {CompactMDD} - The diagram.
+ */
+function buildSharedDiagram(domains, truthVector, changes) {
+    const nodeFactory = nodeManager.getNodeFactory();
+    const truthTable = new TruthTable(domains, truthVector);
+    const canUpdate = changes !== null && lastBuild !== null
+        && lastBuild.domains.length === domains.length && lastBuild.domains.every((size, i) => size === domains[i])
+        && changes.length / 2 * domains.length < truthVector.length;
+
+    let mdd = null;
+    let rootId;
+    if (canUpdate) {
+        // All changes are made on node ids in the factory, the diagram is created once at the end
+        rootId = lastBuild.handle.root;
+        const row = new Array(domains.length);
+        for (let i = 0; i < changes.length; i += 2) {
+            rootId = nodeFactory.setValueId(rootId, truthTable.getRow(changes[i], row), changes[i + 1], domains);
+        }
+    } else {
+        mdd = truthTable.fromVector(nodeFactory);
+        rootId = nodeFactory.getDiagramRoot(mdd);
+    }
+
+    if (lastBuild !== null) {
+        nodeManager.release(lastBuild.handle);
+    }
+    const handle = nodeManager.retain(rootId);
+    if (nodeManager.enforceLimit() > 0 || mdd === null) {
+        mdd = nodeFactory.createDiagram(handle.root); // Node ids may have changed
+    }
+    lastBuild = { domains: Int32Array.from(domains), handle };
+    return mdd;
+}
+
+/**
+ * Builds the MDD from the domains and truth vector and the graph visualizing it.
+ * @param {Int32Array|number[]} domains - An array representing the domains of variables.
+ * @param {Int32Array|number[]} truthVector - The truth vector of the function.
+ * @param {Object} settings - Graph settings, see Graph.applySettings. If settings.reorderVariables is true,
+ *        the order of variables is minimized by sifting before the graph is created.
+ * @param {Int32Array|null} changes - Pairs of row index and new value against the truth vector of the last build,
+ *        they let the last diagram be updated instead of built again.
+ * @returns {Graph} - The graph representing the diagram.
+ */
+function buildGraph(domains, truthVector, settings = {}, changes = null) {
+    if (settings.reorderVariables) {
+        // The reordered diagram is not kept, so the next changes cannot be applied to the last build
+        if (lastBuild !== null) {
+            nodeManager.release(lastBuild.handle);
+            lastBuild = null;
+        }
+        return createGraph(new TruthTable(domains, truthVector).fromVector(), domains, settings);
+    }
+    return createGraph(buildSharedDiagram(domains, truthVector, changes), domains, settings);
+}
+
+/**
+ * Creates the graph visualizing the diagram.
+ * @param {MDD|CompactMDD} mdd - The diagram.
+ * @param {Int32Array|number[]} domains - An array representing the domains of variables.
+ * @param {Object} settings - Graph settings, see Graph.applySettings. If settings.reorderVariables is true,
+ *        the order of variables is minimized by sifting before the graph is created.
+ * @returns {Graph} - The graph representing the diagram.
+ */
+function createGraph(mdd, domains, settings = {}) {
+    const graph = new Graph();
+    if (settings.reorderVariables) {
+        // Sifting works with node objects, fewer nodes also make the layout by Graphviz faster
+        const reordering = new VariableReordering(mdd instanceof CompactMDD ? mdd.toMDD() : mdd, domains);
+        reordering.sift();
+        graph.traverseMDD(reordering.getMDD().getRoot());
+    } else {
+        graph.traverseMDD(mdd instanceof CompactMDD ? mdd : mdd.getRoot());
+    }
+    graph.applySettings(settings);
+
+    return graph;
+}
+
+/**
+ * Builds the MDD from the domains and truth vector and generates its DOT representation.
+ * @param {Int32Array|number[]} domains - An array representing the domains of variables.
+ * @param {Int32Array|number[]} truthVector - The truth vector of the function.
+ * @param {Object} settings - Graph settings, see Graph.applySettings.
+ * @returns {string} - The DOT string representing the diagram.
+ */
+function buildDOTString(domains, truthVector, settings = {}) {
+    return buildGraph(domains, truthVector, settings).toDOTString();
+}
+
+// Worker part. Each message contains {id, domains, truthVector, settings, changes}, where domains and truthVector
+// are typed arrays transferred from the main thread and changes are optional (see buildGraph). The reply is {id, dotString, edgeDecisions, truthVector}
+// or {id, error}, edgeDecisions are the decisions of the edges in the DOT string (see Graph.getEdgeDecisions)
+// and the truth vector is transferred back, so the main thread gets it without a copy.
+if (typeof WorkerGlobalScope !== "undefined" && self instanceof WorkerGlobalScope) {
+    self.addEventListener("message", function (event) {
+        const { id, domains, truthVector, settings, changes } = event.data;
+        try {
+            const graph = buildGraph(domains, truthVector, settings, changes || null);
+            const edgeDecisions = graph.getEdgeDecisions();
+            self.postMessage({ id, dotString: graph.toDOTString(), edgeDecisions, truthVector },
+                [edgeDecisions.buffer, truthVector.buffer]);
+        } catch (error) {
+            self.postMessage({ id, error: { message: error.message } });
+        }
+    });
+}
+
+export { buildGraph, buildDOTString, createGraph };
+
+// Enable CommonJS only if running in Node.js (Jest)
+if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
+    module.exports = { buildGraph, buildDOTString, createGraph };
+}
@@ -0,0 +1,113 @@
+/**
+ * Client of the worker which builds the MDD and its DOT representation outside of the UI thread.
+ * Only one job runs at a time. Starting a new job cancels the previous one by terminating the worker,
+ * because the worker is busy with the computation and cannot react to messages.
+ */
+class MDDWorkerClient {
+    /**
+     * Constructs the client. The worker itself is created lazily with the first job.
+     * @param {string|URL} workerURL - URL of the worker module.
+     */
+    constructor(workerURL = new URL("./mddWorker.js", import.meta.url)) {
+        this._workerURL = workerURL;
+        this._worker = null;
+        this._jobId = 0;
+        this._pendingJob = null; // {id, resolve, reject} of the job which has not finished yet
+    }
+
+    /**
+     * Builds the DOT string of the diagram in the worker. The arrays are transferred to the worker,
+     * so they cannot be used by the caller afterward.
+     * @param {Int32Array} domains - An array representing the domains of variables.
+     * @param {Int32Array} truthVector - The truth vector of the function.
+     * @param {Object} settings - Graph settings, see Graph.applySettings.
+     * @param {Int32Array|null} changes - Pairs of row index and new value against the truth vector of the last
+     *        finished build. The worker then updates its last diagram instead of building it again,
+     *        if it still has it (a cancelled job restarts the worker).
+     * @returns {Promise<{dotString: string, edgeDecisions: Int32Array, truthVector: Int32Array}|null>} - The DOT string,
+     *          the decisions of its edges (see Graph.getEdgeDecisions) and the truth vector transferred back from the worker,
+     *          or null if the job was cancelled by a newer one.
+     */
+    build(domains, truthVector, settings = {}, changes = null) {
+        this.cancel();
+
+        const id = ++this._jobId;
+        const transfer = [domains.buffer, truthVector.buffer];
+        if (changes !== null) {
+            transfer.push(changes.buffer);
+        }
+        return new Promise((resolve, reject) => {
+            this._pendingJob = { id, resolve, reject };
+            this.getWorker().postMessage({ id, domains, truthVector, settings, changes }, transfer);
+        });
+    }
+
+    /**
+     * Cancels the running job, if there is any. Its promise is resolved with null.
+     * @returns {void}
+     */
+    cancel() {
+        if (this._pendingJob === null) {
+            return;
+        }
+        this._worker.terminate();
+        this._worker = null;
+        this._pendingJob.resolve(null);
+        this._pendingJob = null;
+    }
+
+    /**
+     * Gets the worker, creating it if needed.
+     * @returns {Worker} - The worker.
+     */
+    getWorker() {
+        if (this._worker === null) {
+            this._worker = new Worker(this._workerURL, { type: "module" });
+            this._worker.addEventListener("message", (event) => this.onMessage(event.data));
+            this._worker.addEventListener("error", (event) => this.onError(new Error(event.message)));
+        }
+        return this._worker;
+    }
+
+    /**
+     * Handles the reply of the worker.
+     * @param {Object} data - The reply {id, dotString, edgeDecisions, truthVector} or {id, error}.
+     * @returns {void}
+     */
+    onMessage(data) {
+        const job = this._pendingJob;
+        if (job === null || job.id !== data.id) {
+            return; // Reply to a cancelled job
+        }
+        this._pendingJob = null;
+
+        if (data.error !== undefined) {
+            job.reject(new Error(data.error.message));
+        } else {
+            job.resolve({ dotString: data.dotString, edgeDecisions: data.edgeDecisions, truthVector: data.truthVector });
+        }
+    }
+
+    /**
+     * Handles an error which stopped the worker, e.g. the worker script could not be loaded.
+     * @param {Error} error - The error.
+     * @returns {void}
+     */
+    onError(error) {
+        const job = this._pendingJob;
+        this._pendingJob = null;
+        if (this._worker !== null) {
+            this._worker.terminate();
+            this._worker = null;
+        }
+        if (job !== null) {
+            job.reject(error);
+        }
+    }
+}
+
+if (typeof window !== 'undefined') {
+    window.MDDWorkerClient = MDDWorkerClient;
+}
+
+export { MDDWorkerClient };
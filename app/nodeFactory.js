@@ -1,4 +1,4 @@
-import { TerminalNode, InternalNode } from "./diagram.js";
+import { TerminalNode, InternalNode, MDD } from "./diagram.js";
 
 /**
  * NodeFactory class responsible for creating nodes in the Multi-Decision Diagram (MDD).
@@ -11,22 +11,50 @@ class NodeFactory {
         // Stores unique terminal nodes. Key is the value, value is TerminalNode object.
         this._terminalTable = new Map();
 
-        // Stores unique internal nodes. Key is composite key made of index and successors, value is InternalNode object.
+        // Stores unique internal nodes. Key is the id of the node, value is InternalNode object.
         this._internalTable = new Map();
+
+        // Unique table used for finding existing internal nodes. Key is numeric hash made of index and ids of
+        // successors, value is an array of InternalNode objects sharing that hash.
+        this._uniqueTable = new Map();
+    }
+
+    /**
+     * Generates a numeric hash key for identifying internal nodes.
+     * This key combines an index with the ids of its successors, so no strings have to be built.
+     * Different nodes can share the same hash, so the key is only used to find a bucket of candidates.
+     *
+     * @param {number} index - The index of the node.
+     * @param {(InternalNode|TerminalNode)[]} successors - An array representing the successors of the node.
+     * @returns {number} A 32-bit hash of the index and successors.
+     */
+    makeHashKey(index, successors = []) {
+        let hash = Math.imul(index ^ 0x811c9dc5, 0x01000193);
+        for (let i = 0; i < successors.length; i++) {
+            hash = Math.imul(hash ^ successors[i].getId(), 0x01000193);
+        }
+        return hash ^ (hash >>> 16);
     }
 
     /**
-     * Generates a composite key for identifying internal nodes uniquely.
-     * This key combines an index with its successors to create a string representation,
-     * ensuring internal nodes with the same structure can be identified and reused.
+     * Checks if the node has the given index and exactly the same successor instances.
      *
+     * @param {InternalNode} node - The node to compare.
      * @param {number} index - The index of the node.
-     * @param {Array} successors - An array representing the successors of the node.
-     * @returns {string} A composite key that uniquely identifies an internal node.
+     * @param {(InternalNode|TerminalNode)[]} successors - An array of successors for the node.
+     * @returns {boolean} True if the node matches the index and successors, false otherwise.
      */
-    makeCompositeKey(index, successors = []) {
-        const successorsString = successors.toString();
-        return `${index}:${successorsString}`;
+    isSameNode(node, index, successors = []) {
+        if (node.getIndex() !== index || node.getSuccessorsCount() !== successors.length) {
+            return false;
+        }
+        const nodeSuccessors = node.getSuccessors();
+        for (let i = 0; i < successors.length; i++) {
+            if (nodeSuccessors[i] !== successors[i]) {
+                return false;
+            }
+        }
+        return true;
     }
 
     /**
@@ -77,8 +105,8 @@ class NodeFactory {
     /**
      * Creates or retrieves an internal node with the given index and successors, applying the Flyweight pattern
      * to minimize memory usage by reusing existing nodes with the same structure. This method ensures uniqueness
-     * through the use of composite keys and supports the optimization of the diagram by preventing the creation
-     * of redundant nodes.
+     * through the unique table keyed by numeric hash of index and successor ids, and supports the optimization
+     * of the diagram by preventing the creation of redundant nodes.
      *
      * If the successors indicate that the node would be redundant, it returns the first successor directly,
      * further optimizing the diagram's structure.
@@ -88,17 +116,100 @@ class NodeFactory {
      * @returns {InternalNode|TerminalNode} An internal node, or in the case of redundancy, the common successor node.
      */
     createInternalNode(index, successors = []) {
-        let compositeKey = this.makeCompositeKey(index, successors);
         if (this.isRedundant(successors)) {
             return successors[0];
-        } else if (this._internalTable.has(compositeKey)) {
-            return this._internalTable.get(compositeKey);
+        }
+
+        const hashKey = this.makeHashKey(index, successors);
+        let bucket = this._uniqueTable.get(hashKey);
+        if (bucket === undefined) {
+            bucket = [];
+            this._uniqueTable.set(hashKey, bucket);
         } else {
-            let tempInternalNode = new InternalNode(index, successors);
-            let key = this.makeCompositeKey(index, successors);
-            this._internalTable.set(key, tempInternalNode);
-            return tempInternalNode;
+            for (let i = 0; i < bucket.length; i++) {
+                if (this.isSameNode(bucket[i], index, successors)) {
+                    return bucket[i];
+                }
+            }
+        }
+
+        let tempInternalNode = new InternalNode(index, successors);
+        bucket.push(tempInternalNode);
+        this._internalTable.set(tempInternalNode.getId(), tempInternalNode);
+        return tempInternalNode;
+    }
+
+    /**
+     * Gets the number of stored internal nodes.
+     *
+     * @returns {number} The number of internal nodes.
+     */
+    getNodeCount() {
+        return this._internalTable.size;
+    }
+
+    /**
+     * Removes nodes which cannot be reached from any of the roots (mark and sweep), so the factory can be used
+     * for many diagrams without keeping the nodes of those which are no longer used.
+     *
+     * @param {(InternalNode|TerminalNode)[]} roots - Root nodes of the diagrams which are still used.
+     * @returns {(InternalNode|TerminalNode)[]} The roots, nodes keep their identity after the collection.
+     */
+    collectGarbage(roots) {
+        // Mark the reachable nodes
+        const reachable = new Set();
+        const stack = Array.from(roots);
+        while (stack.length > 0) {
+            const node = stack.pop();
+            if (reachable.has(node)) {
+                continue;
+            }
+            reachable.add(node);
+            if (!(node instanceof TerminalNode)) {
+                stack.push(...node.getSuccessors());
+            }
+        }
+
+        // Sweep the tables
+        for (const [value, node] of this._terminalTable) {
+            if (!reachable.has(node)) {
+                this._terminalTable.delete(value);
+            }
+        }
+        for (const [id, node] of this._internalTable) {
+            if (!reachable.has(node)) {
+                this._internalTable.delete(id);
+            }
         }
+        for (const [hashKey, bucket] of this._uniqueTable) {
+            const keptNodes = bucket.filter(node => reachable.has(node));
+            if (keptNodes.length === 0) {
+                this._uniqueTable.delete(hashKey);
+            } else if (keptNodes.length !== bucket.length) {
+                this._uniqueTable.set(hashKey, keptNodes);
+            }
+        }
+        return roots;
+    }
+
+    /**
+     * Creates the diagram with the given root node.
+     *
+     * @param {InternalNode|TerminalNode} root - The root node of the diagram.
+     * @returns {MDD} The diagram with the given root.
+     */
+    createDiagram(root) {
+        return new MDD(root);
+    }
+
+    /**
+     * Gets the root node of the diagram, it is the inverse of createDiagram.
+     *
+     * @param {MDD} mdd - The diagram.
+     * @returns {InternalNode|TerminalNode} The root node of the diagram.
+     */
+    getDiagramRoot(mdd) {
+        return mdd.getRoot();
     }
 }
 
@@ -0,0 +1,101 @@
+import { CompactNodeFactory } from "./compactDiagram.js";
+
+/**
+ * Long-lived owner of a node factory shared by many diagrams.
+ *
+ * Diagrams built by the shared factory reuse nodes of the diagrams built before, so building a function similar
+ * to a previous one finds most of its subdiagrams in the unique table instead of adding them again.
+ * Diagrams which are still used are retained, the others are removed by garbage collection once the factory
+ * holds more nodes than the limit.
+ */
+class NodeManager {
+    /**
+     * Constructs the manager.
+     * @param {NodeFactory|CompactNodeFactory} nodeFactory - The shared node factory.
+     * @param {number} maxNodes - Number of internal nodes after which unused nodes are collected.
+     */
+    constructor(nodeFactory = new CompactNodeFactory(), maxNodes = 262144) {
+        this._nodeFactory = nodeFactory;
+        this._maxNodes = maxNodes;
+        this._handles = new Map(); // Reference counts of retained diagrams by their handles
+        this._handlesByRoot = new Map(); // Handles of retained diagrams by their roots
+    }
+
+    /**
+     * Gets the shared node factory.
+     * @returns {NodeFactory|CompactNodeFactory} The node factory.
+     */
+    getNodeFactory() {
+        return this._nodeFactory;
+    }
+
+    /**
+     * Keeps the diagram with the given root from being collected.
+     * Node ids of a CompactNodeFactory change by the collection, so the root is read from the handle.
+     * @param {InternalNode|TerminalNode|number} root - The root node (or its id) created by the shared factory.
+     * @returns {{root: (InternalNode|TerminalNode|number)}} Handle of the diagram, used for releasing it.
+     */
+    retain(root) {
+        let handle = this._handlesByRoot.get(root);
+        if (handle !== undefined) {
+            this._handles.set(handle, this._handles.get(handle) + 1);
+            return handle;
+        }
+        handle = {root};
+        this._handles.set(handle, 1);
+        this._handlesByRoot.set(root, handle);
+        return handle;
+    }
+
+    /**
+     * Releases the diagram, its nodes can be collected once it is released as many times as it was retained.
+     * @param {{root: (InternalNode|TerminalNode|number)}} handle - Handle returned by retain.
+     * @returns {void}
+     */
+    release(handle) {
+        const count = this._handles.get(handle);
+        if (count === undefined) {
+            console.error("Diagram cannot be released. It is not retained by the node manager.");
+        } else if (count === 1) {
+            this._handles.delete(handle);
+            this._handlesByRoot.delete(handle.root);
+        } else {
+            this._handles.set(handle, count - 1);
+        }
+    }
+
+    /**
+     * Removes all nodes which are not reachable from the retained diagrams and updates their handles.
+     * @returns {number} The number of removed internal nodes.
+     */
+    collectGarbage() {
+        const nodeCount = this._nodeFactory.getNodeCount();
+        const handles = Array.from(this._handles.keys());
+        const roots = this._nodeFactory.collectGarbage(handles.map(handle => handle.root));
+        this._handlesByRoot.clear();
+        handles.forEach((handle, i) => {
+            handle.root = roots[i];
+            this._handlesByRoot.set(handle.root, handle);
+        });
+        return nodeCount - this._nodeFactory.getNodeCount();
+    }
+
+    /**
+     * Collects garbage if the factory holds more nodes than the limit.
+     * @returns {number} The number of removed internal nodes.
+     */
+    enforceLimit() {
+        return this._nodeFactory.getNodeCount() > this._maxNodes ? this.collectGarbage() : 0;
+    }
+}
+
+if (typeof window !== 'undefined') {
+    window.NodeManager = NodeManager;
+}
+
+export { NodeManager };
+
+// Enable CommonJS only if running in Node.js (Jest)
+if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
+    module.exports = { NodeManager };
+}
@@ -0,0 +1,164 @@
+import { TruthTable } from "./table.js";
+import { CompactMDD, CompactNodeFactory } from "./compactDiagram.js";
+
+/**
+ * Builds the CompactMDD of a part of the truth vector and returns its arrays. It runs in the workers
+ * of ParallelMDDBuilder (see partWorker.js).
+ * @param {Int32Array|number[]} domains - Domains of the variables of the part.
+ * @param {Int32Array|number[]} truthVector - The truth vector of the part.
+ * @returns {Object} - The arrays of the diagram, see CompactMDD.getBuffers.
+ */
+function buildPart(domains, truthVector) {
+    return new TruthTable(domains, truthVector).fromVector(new CompactNodeFactory()).getBuffers();
+}
+
+/**
+ * Builds MDDs from long truth vectors in parallel.
+ *
+ * The first variables split the truth vector into contiguous parts, one for each assignment of these variables,
+ * and every part is the truth vector of a function of the remaining variables. The parts are built by the workers
+ * into compact diagrams, which are then added to one node factory. Its unique table merges equal subdiagrams
+ * of different parts, so the result is the same reduced diagram as the one built by fromVector.
+ */
+class ParallelMDDBuilder {
+    /**
+     * Constructs the builder.
+     * @param {Array<Worker>} workers - Browser workers or Node.js worker threads running partWorker.js.
+     *        They are used by one build at a time and are not terminated by the builder.
+     */
+    constructor(workers) {
+        this._workers = workers;
+        this._jobId = 0;
+        this._pendingParts = new Map(); // {resolve, reject} of the parts being built by their job ids
+        workers.forEach(worker => {
+            const onMessage = (data) => this.onMessage(data);
+            if (typeof worker.on === "function") {
+                worker.on("message", onMessage);
+            } else {
+                worker.addEventListener("message", (event) => onMessage(event.data));
+            }
+        });
+    }
+
+    /**
+     * Builds the diagram.
+     * @param {Int32Array|number[]} domains - An array representing the domains of variables.
+     * @param {Int32Array|Uint8Array|Uint16Array|Uint32Array|number[]} truthVector - The truth vector of the function.
+     *        Parts of a truth vector in a SharedArrayBuffer are not copied when they are sent to the workers.
+     * @param {NodeFactory|CompactNodeFactory} nodeFactory - Node factory used for creating the nodes of the result.
+     * @returns {Promise<MDD|CompactMDD|null>} - The diagram, or null if the truth vector does not match the domains.
+     */
+    async build(domains, truthVector, nodeFactory = new CompactNodeFactory()) {
+        if (Array.isArray(truthVector)) {
+            truthVector = Int32Array.from(truthVector);
+        }
+        const tableLength = Array.from(domains).reduce((product, size) => product * size, 1);
+        if (truthVector.length !== tableLength) {
+            console.error(`MDD cannot be built. The number of truth vector values (${truthVector.length}) does not match the product of the domains (${tableLength}).`);
+            return null;
+        }
+
+        // Split by as many variables as needed for every worker to get about two parts,
+        // the last variable is never split, so every part is a function of at least one variable
+        let splitCount = 0;
+        let partsCount = 1;
+        while (splitCount < domains.length - 1 && partsCount < this._workers.length * 2) {
+            partsCount *= domains[splitCount++];
+        }
+        const partDomains = Int32Array.from(domains).slice(splitCount);
+        const partLength = tableLength / partsCount;
+
+        const parts = new Array(partsCount);
+        for (let part = 0; part < partsCount; part++) {
+            parts[part] = this.buildPart(part % this._workers.length, partDomains,
+                truthVector.subarray(part * partLength, (part + 1) * partLength));
+            // The parts after the awaited one must not be unhandled if they fail, the first failure rejects the build
+            parts[part].catch(() => {});
+        }
+
+        // Parts are added in order, the next one is still being built meanwhile
+        let nodes = new Array(partsCount);
+        for (let part = 0; part < partsCount; part++) {
+            nodes[part] = addDiagram(nodeFactory, CompactMDD.fromBuffers(await parts[part]), splitCount);
+        }
+
+        // Nodes of the split variables, the last of them changes the fastest in the truth vector
+        for (let level = splitCount - 1; level >= 0; level--) {
+            const upperNodes = new Array(nodes.length / domains[level]);
+            for (let i = 0; i < upperNodes.length; i++) {
+                upperNodes[i] = nodeFactory.createInternalNode(level, nodes.slice(i * domains[level], (i + 1) * domains[level]));
+            }
+            nodes = upperNodes;
+        }
+        return nodeFactory.createDiagram(nodes[0]);
+    }
+
+    /**
+     * Sends the part to the worker.
+     * @param {number} workerIndex - Index of the worker.
+     * @param {Int32Array} domains - Domains of the variables of the part.
+     * @param {Int32Array|Uint8Array|Uint16Array|Uint32Array} truthVector - The truth vector of the part.
+     * @returns {Promise<Object>} - The arrays of the diagram of the part.
+     */
+    buildPart(workerIndex, domains, truthVector) {
+        const id = ++this._jobId;
+        // A view of an ordinary buffer would be sent with the whole buffer, so the part is copied
+        const shared = typeof SharedArrayBuffer !== "undefined" && truthVector.buffer instanceof SharedArrayBuffer;
+        const partVector = shared ? truthVector : truthVector.slice();
+        return new Promise((resolve, reject) => {
+            this._pendingParts.set(id, { resolve, reject });
+            this._workers[workerIndex].postMessage({ id, domains, truthVector: partVector }, shared ? [] : [partVector.buffer]);
+        });
+    }
+
+    /**
+     * Handles the reply of a worker, {id, buffers} or {id, error}.
+     * @param {Object} data - The reply.
+     * @returns {void}
+     */
+    onMessage(data) {
+        const pending = this._pendingParts.get(data.id);
+        if (pending === undefined) {
+            return;
+        }
+        this._pendingParts.delete(data.id);
+        if (data.error !== undefined) {
+            pending.reject(new Error(data.error.message));
+        } else {
+            pending.resolve(data.buffers);
+        }
+    }
+}
+
+/**
+ * Adds all nodes of the CompactMDD to the node factory.
+ * @param {NodeFactory|CompactNodeFactory} nodeFactory - The node factory.
+ * @param {CompactMDD} mdd - The diagram.
+ * @param {number} levelOffset - Number added to the indexes of the nodes.
+ * @returns {InternalNode|TerminalNode|number} - The root of the diagram in the node factory.
+ */
+function addDiagram(nodeFactory, mdd, levelOffset) {
+    const nodes = new Array(mdd.getNodeCount());
+    const node = (id) => id < 0 ? nodeFactory.createTerminalNode(mdd.getTerminal(id).getResultValue()) : nodes[id];
+
+    // Successors always have smaller ids than their predecessors
+    for (let id = 0; id < nodes.length; id++) {
+        const successors = new Array(mdd.getSuccessorsCount(id));
+        for (let decision = 0; decision < successors.length; decision++) {
+            successors[decision] = node(mdd.getSuccessor(id, decision));
+        }
+        nodes[id] = nodeFactory.createInternalNode(mdd.getIndex(id) + levelOffset, successors);
+    }
+    return node(mdd.getRoot());
+}
+
+if (typeof window !== 'undefined') {
+    window.ParallelMDDBuilder = ParallelMDDBuilder;
+}
+
+export { ParallelMDDBuilder, buildPart };
+
+// Enable CommonJS only if running in Node.js (Jest)
+if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
+    module.exports = { ParallelMDDBuilder, buildPart };
+}
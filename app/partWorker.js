@@ -0,0 +1,31 @@
+import { buildPart } from "./parallelBuilder.js";
+
+// Worker of ParallelMDDBuilder, it runs as a browser module worker or as a Node.js worker thread.
+// Each message contains {id, domains, truthVector} of one part, the reply is {id, buffers} or {id, error},
+// where buffers are the transferred arrays of the diagram of the part (see CompactMDD.getBuffers).
+
+/**
+ * Builds the part and sends the reply.
+ * @param {Object} data - The message {id, domains, truthVector}.
+ * @param {function(Object, ArrayBuffer[]): void} postMessage - Sends the reply.
+ * @returns {void}
+ */
+function onPart(data, postMessage) {
+    try {
+        const buffers = buildPart(data.domains, data.truthVector);
+        postMessage({ id: data.id, buffers },
+            [buffers.levels.buffer, buffers.successorOffsets.buffer, buffers.successors.buffer, buffers.terminalValues.buffer]);
+    } catch (error) {
+        postMessage({ id: data.id, error: { message: error.message } }, []);
+    }
+}
+
+if (typeof WorkerGlobalScope !== "undefined" && self instanceof WorkerGlobalScope) {
+    self.addEventListener("message", (event) => onPart(event.data, (reply, transfer) => self.postMessage(reply, transfer)));
+} else if (typeof process !== "undefined" && process.versions !== undefined && process.versions.node !== undefined) {
+    import("worker_threads").then(({ parentPort }) => {
+        if (parentPort !== null) {
+            parentPort.on("message", (data) => onPart(data, (reply, transfer) => parentPort.postMessage(reply, transfer)));
+        }
+    });
+}
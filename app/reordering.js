@@ -0,0 +1,231 @@
+import { TerminalNode } from "./diagram.js";
+import { NodeFactory } from "./nodeFactory.js";
+
+/**
+ * Changes the order of variables of an MDD to make the diagram smaller.
+ *
+ * Nodes keep the indexes of their variables, only the levels of the variables change, so the reordered
+ * diagram is evaluated and displayed the same way as the original one. The diagram is copied to a node factory
+ * owned by the reordering, nodes replaced by swaps stay in that factory until compact is called.
+ */
+class VariableReordering {
+    /**
+     * Constructs the reordering of the MDD.
+     * @param {MDD} mdd - The diagram, it is not changed.
+     * @param {number[]|Int32Array} domains - An array representing the domains of variables.
+     * @param {number[]} order - Indexes of the variables from the top level down, the input order by default.
+     */
+    constructor(mdd, domains, order = Array.from(domains.keys())) {
+        this._domains = domains;
+        this._order = Array.from(order);
+        this._levels = new Array(order.length); // Level of each variable
+        this._order.forEach((index, level) => this._levels[index] = level);
+        this._nodeFactory = new NodeFactory();
+        this._root = this.copyNode(mdd.getRoot(), new Map());
+        // Number of internal nodes on each level, swaps update only the sizes of the swapped levels
+        this._levelSizes = this.countLevelNodes(0, order.length - 1);
+        this._nodeCount = this._levelSizes.reduce((sum, size) => sum + size, 0);
+    }
+
+    /**
+     * Gets the reordered diagram.
+     * @returns {MDD} The diagram.
+     */
+    getMDD() {
+        return this._nodeFactory.createDiagram(this._root);
+    }
+
+    /**
+     * Gets the current order of variables.
+     * @returns {number[]} Indexes of the variables from the top level down.
+     */
+    getOrder() {
+        return Array.from(this._order);
+    }
+
+    /**
+     * Counts the internal nodes of the diagram in the current order.
+     * @returns {number} The number of internal nodes.
+     */
+    getNodeCount() {
+        return this._nodeCount;
+    }
+
+    /**
+     * Counts the internal nodes on each level of the diagram in the current order.
+     * @returns {number[]} The number of nodes on each level from the top down.
+     */
+    getLevelSizes() {
+        return Array.from(this._levelSizes);
+    }
+
+    /**
+     * Counts the internal nodes on the levels from the first to the last one. Only nodes down to the last level
+     * are visited, the part of the diagram below it is not traversed.
+     * @param {number} firstLevel - The first counted level.
+     * @param {number} lastLevel - The last counted level.
+     * @returns {number[]} The number of nodes on each level of the diagram, 0 on levels which were not counted.
+     */
+    countLevelNodes(firstLevel, lastLevel) {
+        const sizes = new Array(this._order.length).fill(0);
+        const visited = new Set();
+        const stack = [this._root];
+        while (stack.length > 0) {
+            const node = stack.pop();
+            if (node instanceof TerminalNode || visited.has(node) || this._levels[node.getIndex()] > lastLevel) {
+                continue;
+            }
+            visited.add(node);
+            const level = this._levels[node.getIndex()];
+            if (level >= firstLevel) {
+                sizes[level]++;
+            }
+            stack.push(...node.getSuccessors());
+        }
+        return sizes;
+    }
+
+    /**
+     * Swaps the variables on the level and the level below it. Only nodes on these two levels and above them
+     * are created again, the part of the diagram below them is shared.
+     * @param {number} level - The upper of the swapped levels.
+     * @returns {void}
+     */
+    swap(level) {
+        const upperIndex = this._order[level];
+        const lowerIndex = this._order[level + 1];
+        const nodeFactory = this._nodeFactory;
+        const swappedNodes = new Map();
+
+        // Successor of the node for the value of the lower variable, nodes not testing it do not depend on it
+        const cofactor = (node, value) =>
+            !(node instanceof TerminalNode) && node.getIndex() === lowerIndex ? node.getSuccessors()[value] : node;
+
+        const swapNode = (node) => {
+            if (node instanceof TerminalNode || this._levels[node.getIndex()] > level) {
+                return node; // Nodes of the lower variable without a node of the upper one above them stay valid
+            }
+            let swapped = swappedNodes.get(node);
+            if (swapped === undefined) {
+                const successors = node.getSuccessors();
+                if (node.getIndex() === upperIndex) {
+                    const lowerSuccessors = new Array(this._domains[lowerIndex]);
+                    for (let value = 0; value < lowerSuccessors.length; value++) {
+                        lowerSuccessors[value] = nodeFactory.createInternalNode(upperIndex,
+                            successors.map(successor => cofactor(successor, value)));
+                    }
+                    swapped = nodeFactory.createInternalNode(lowerIndex, lowerSuccessors);
+                } else {
+                    swapped = nodeFactory.createInternalNode(node.getIndex(), successors.map(swapNode));
+                }
+                swappedNodes.set(node, swapped);
+            }
+            return swapped;
+        };
+
+        this._root = swapNode(this._root);
+        this._order[level] = lowerIndex;
+        this._order[level + 1] = upperIndex;
+        this._levels[lowerIndex] = level;
+        this._levels[upperIndex] = level + 1;
+
+        // Nodes above the swapped levels represent the same functions as before, so their number does not change
+        const sizes = this.countLevelNodes(level, level + 1);
+        this._nodeCount += sizes[level] + sizes[level + 1] - this._levelSizes[level] - this._levelSizes[level + 1];
+        this._levelSizes[level] = sizes[level];
+        this._levelSizes[level + 1] = sizes[level + 1];
+    }
+
+    /**
+     * Moves the variable on the level to the target level by swaps of adjacent levels.
+     * @param {number} level - The current level of the variable.
+     * @param {number} targetLevel - The new level of the variable.
+     * @returns {void}
+     */
+    moveVariable(level, targetLevel) {
+        for (; level < targetLevel; level++) {
+            this.swap(level);
+        }
+        for (; level > targetLevel; level--) {
+            this.swap(level - 1);
+        }
+    }
+
+    /**
+     * Reduces the diagram by the sifting heuristic. Each variable, starting with those on the largest levels,
+     * is moved through all levels (while the diagram does not grow too much) and left on the level where
+     * the diagram was the smallest.
+     * @param {number} maxGrowth - The variable is not moved further once the diagram is this many times larger
+     *        than the smallest one found.
+     * @returns {number} The number of internal nodes after sifting.
+     */
+    sift(maxGrowth = 1.2) {
+        const levelSizes = this.getLevelSizes();
+        const variables = Array.from(this._order).sort((a, b) => levelSizes[this._levels[b]] - levelSizes[this._levels[a]]);
+        const lastLevel = this._order.length - 1;
+        let bestCount = this.getNodeCount();
+
+        for (const index of variables) {
+            const startLevel = this._levels[index];
+            let level = startLevel;
+            let bestLevel = level;
+
+            // Visit the nearer end first, then the other one. On the way back the levels already visited
+            // are passed without the growth check, so the other side is always explored.
+            const directions = level > lastLevel - level ? [1, -1] : [-1, 1];
+            for (const direction of directions) {
+                while (level + direction >= 0 && level + direction <= lastLevel) {
+                    this.swap(direction > 0 ? level : level - 1);
+                    level += direction;
+                    const count = this.getNodeCount();
+                    if (count < bestCount) {
+                        bestCount = count;
+                        bestLevel = level;
+                    } else if ((level - startLevel) * direction > 0 && count > bestCount * maxGrowth) {
+                        break;
+                    }
+                }
+            }
+            this.moveVariable(level, bestLevel);
+            this.compact();
+        }
+        return bestCount;
+    }
+
+    /**
+     * Copies the diagram to a new node factory, so nodes replaced by swaps are released.
+     * @returns {void}
+     */
+    compact() {
+        this._nodeFactory = new NodeFactory();
+        this._root = this.copyNode(this._root, new Map());
+    }
+
+    /**
+     * Copies the node and its successors to the node factory of the reordering.
+     * @param {InternalNode|TerminalNode} node - The copied node.
+     * @param {Map} copies - Nodes already copied, by the original nodes.
+     * @returns {InternalNode|TerminalNode} The copy.
+     */
+    copyNode(node, copies) {
+        let copy = copies.get(node);
+        if (copy === undefined) {
+            copy = node instanceof TerminalNode
+                ? this._nodeFactory.createTerminalNode(node.getResultValue())
+                : this._nodeFactory.createInternalNode(node.getIndex(), node.getSuccessors().map(successor => this.copyNode(successor, copies)));
+            copies.set(node, copy);
+        }
+        return copy;
+    }
+}
+
+if (typeof window !== 'undefined') {
+    window.VariableReordering = VariableReordering;
+}
+
+export { VariableReordering };
+
+// Enable CommonJS only if running in Node.js (Jest)
+if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
+    module.exports = { VariableReordering };
+}
@@ -1,4 +1,4 @@
-import { MDD } from "./diagram.js";
+import { validateAssignments } from "./diagram.js";
 import { NodeFactory } from "./nodeFactory.js";
 
 /**
@@ -37,20 +37,74 @@ class TruthTable {
 
     /**
      * Generates and returns the truth table based on the domains.
-     * @returns {number[]} The generated truth table.
+     * The whole table is kept in memory, use getRow or iterateRows for large domains.
+     * @returns {number[][]} The generated truth table.
      */
     getTruthTable() {
-        let truthTable;
-        //This is the smartest declaration of 2D array I have found.
-        let tableLength = this._domains.reduce((accumulator, currentValue) => accumulator * currentValue, 1); // Multiplies all the elements of an array.
-        truthTable = Array.from({length: tableLength}, () => Array.from({length: this._domains.length}).fill(0));
-        //Fill table with values of variables.
+        return Array.from(this.iterateRows());
+    }
+
+    /**
+     * Gets the number of variables of the function.
+     * @returns {number} The number of domains.
+     */
+    getVariablesCount() {
+        return this._variablesCount;
+    }
+
+    /**
+     * Gets the number of rows of the truth table.
+     * @returns {number} The product of the domains.
+     */
+    getTableLength() {
+        return this._domains.reduce((accumulator, currentValue) => accumulator * currentValue, 1); // Multiplies all the elements of an array.
+    }
+
+    /**
+     * Computes a single row of the truth table from the offsets, without generating the other rows.
+     * @param {number} rowIndex - Index of the row.
+     * @param {number[]} row - Array for storing the values of variables, it is created if not provided.
+     * @returns {number[]} The values of variables in the row.
+     */
+    getRow(rowIndex, row = new Array(this._variablesCount)) {
         for (let i = 0; i < this._variablesCount; i++) {
-            for (let j = 1; j < tableLength; j++) {
-                truthTable[j][i] = (Math.floor(j / this._offsets[i])) % this._domains[i];
+            row[i] = (Math.floor(rowIndex / this._offsets[i])) % this._domains[i];
+        }
+        return row;
+    }
+
+    /**
+     * Gets the value of the function in a row of the truth table.
+     * @param {number} rowIndex - Index of the row.
+     * @returns {number} The value from the truth vector.
+     */
+    getValue(rowIndex) {
+        return this._truthVector[rowIndex];
+    }
+
+    /**
+     * Iterates over the rows of the truth table. Only the first row is computed from the offsets,
+     * every next row is obtained by incrementing the previous one as a mixed-radix number.
+     * @param {number} start - Index of the first row.
+     * @param {number} end - Index after the last row.
+     * @returns {Generator<number[]>} The rows, each one is a new array of the values of variables.
+     */
+    *iterateRows(start = 0, end = this.getTableLength()) {
+        if (start >= end) {
+            return;
+        }
+
+        const row = this.getRow(start);
+        for (let j = start; j < end; j++) {
+            yield row.slice();
+            // The last variable changes the fastest, overflowing digits carry to the previous variable.
+            for (let i = this._variablesCount - 1; i >= 0; i--) {
+                if (++row[i] < this._domains[i]) {
+                    break;
+                }
+                row[i] = 0;
             }
         }
-        return truthTable;
     }
 
     /**
@@ -70,27 +124,56 @@ class TruthTable {
         return this._truthVector[index];
     }
 
+    /**
+     * Evaluates many assignments at once. The assignments are validated against the domains once before the evaluation.
+     * It has the same parameters as MDD.evaluateBatch, so a table can be evaluated in place of a diagram.
+     * @param {Int32Array|Uint8Array|number[]} assignments - Flat array of assignments, one row of variablesCount values for each assignment.
+     * @param {number} variablesCount - The number of variables in one assignment, it must be the number of variables of the table.
+     * @param {Int32Array|null} results - Array for storing the results, it is created if not provided.
+     * @returns {Int32Array|null} - The evaluated result value of each assignment, or null if any of the assignments is invalid.
+     */
+    evaluateBatch(assignments, variablesCount, results = null) {
+        if (variablesCount !== this._variablesCount) {
+            console.error(`Batch evaluation cannot be performed. The truth table has ${this._variablesCount} variables, but ${variablesCount} are provided.`);
+            return null;
+        }
+        if (!validateAssignments(assignments, this._domains)) {
+            return null;
+        }
+
+        const assignmentsCount = assignments.length / variablesCount;
+        results = results || new Int32Array(assignmentsCount);
+        for (let row = 0, rowStart = 0; row < assignmentsCount; row++, rowStart += variablesCount) {
+            let index = 0;
+            for (let i = 0; i < variablesCount; i++) {
+                index += this._offsets[i] * assignments[rowStart + i];
+            }
+            results[row] = this._truthVector[index];
+        }
+        return results;
+    }
+
     /**
      * Prints the truth table.
      * @returns {void}
      */
     printTable() {
-        let truthTable = this.getTruthTable();
         // Print the row labels.
         let topRow = '';
-        for (let i = 0; i < truthTable[0].length; i++) {
+        for (let i = 0; i < this._variablesCount; i++) {
             topRow += `x${i} `;
         }
         topRow += '  f';
         console.log(topRow);
 
         // Print the truthTable values, straight line of '|' and truthVector values.
-        for (let i = 0; i < truthTable.length; i++) {
+        let i = 0;
+        for (const tableRow of this.iterateRows()) {
             let row = '';
-            for (let j = 0; j < truthTable[i].length; j++) {
-                row += `${truthTable[i][j]}  `;
+            for (let j = 0; j < tableRow.length; j++) {
+                row += `${tableRow[j]}  `;
             }
-            row += `| ${this._truthVector[i]}`;
+            row += `| ${this._truthVector[i++]}`;
             console.log(row);
         }
     }
@@ -99,36 +182,23 @@ class TruthTable {
     // have access to it here, so we don't have to pass it.
     /**
      * Converts the truth vector and domains into an MDD (Multi-Decision Diagram) representation.
-     * @returns {MDD} - The MDD created based on truthVector and domains.
+     * @param {NodeFactory|CompactNodeFactory} nodeFactory - Node factory used for creating the nodes.
+     *        Passing a CompactNodeFactory creates a CompactMDD instead of an MDD.
+     * @returns {MDD|CompactMDD} - The MDD created based on truthVector and domains.
      */
-    fromVector() {
-        // each line of stack contains a pair of [node, integer]
-        let stack  = []; // push() to push, pop() to pop.
-        let j = 0;
-
-        while (j < this._truthVector.length) {
-            let n = this._domains.length;
-            let mn = this._domains[n-1];
-            let successors = new Array(mn);
-            for (let k = 0; k < mn; k++) {
-                successors[k] = this._nodeFactory.createTerminalNode(this._truthVector[j]);
-                j++;
-            }
-            let node = this._nodeFactory.createInternalNode(n-1, successors);
-            //console.log("Node created in fromVector: " + node.toString());
-            stack.push([node, n-1]);
-            this.shrinkStack(stack);
-        }
-        let root = stack[stack.length - 1][0]; // "Peek" into the stack and retrieve just the node from the pair [node, integer].
-        return new MDD(root);
+    fromVector(nodeFactory = this._nodeFactory) {
+        const builder = new MDDBuilder(this._domains, nodeFactory, this);
+        builder.push(this._truthVector);
+        return builder.createDiagram();
     }
 
     /**
      * Shrinks the stack to optimize redundant nodes while building the MDD.
      * @param {Array[]} stack - The stack to shrink.
+     * @param {NodeFactory|CompactNodeFactory} nodeFactory - Node factory used for creating the nodes.
      * @returns {void}
      */
-    shrinkStack(stack = []) {
+    shrinkStack(stack = [], nodeFactory = this._nodeFactory) {
         while (true) {
             let peekIndex = stack.length - 1;
             let node = stack[peekIndex][0]; // "Peek" into the stack and retrieve just the node from the pair [node, integer].
@@ -151,18 +221,112 @@ class TruthTable {
                 let poppedElement = stack.pop(); // Pop pair [node, integer] from the stack and
                 successors[k] = poppedElement[0];       // retrieve just the node.
             }
-            node = this._nodeFactory.createInternalNode(i-1, successors);
+            node = nodeFactory.createInternalNode(i-1, successors);
             stack.push([node, i-1]);
         }
     }
 }
 
+/**
+ * Builds an MDD from a truth vector which arrives in chunks, e.g. read from a file, a stream or a worker.
+ *
+ * The truth vector is consumed in groups of the size of the last domain, each group becomes a node which is
+ * pushed onto a stack reduced by TruthTable.shrinkStack. The stack never holds more than the sum of the domains,
+ * so the whole truth vector never has to be in memory.
+ */
+class MDDBuilder {
+    /**
+     * Constructs a builder of the MDD of a function with the given domains.
+     * @param {number[]|Int32Array} domains - An array representing the domains of variables.
+     * @param {NodeFactory|CompactNodeFactory} nodeFactory - Node factory used for creating the nodes.
+     *        Passing a CompactNodeFactory creates a CompactMDD instead of an MDD.
+     * @param {TruthTable} truthTable - Truth table with the same domains, its shrinkStack reduces the stack.
+     */
+    constructor(domains, nodeFactory = new NodeFactory(), truthTable = new TruthTable(domains)) {
+        this._domains = domains;
+        this._nodeFactory = nodeFactory;
+        this._truthTable = truthTable;
+
+        this._expectedCount = Array.from(domains).reduce((accumulator, currentValue) => accumulator * currentValue, 1);
+        this._count = 0; // Number of truth vector values pushed so far
+
+        // each line of stack contains a pair of [node, integer]
+        this._stack = [];
+        this._lastIndex = domains.length - 1;
+        this._lastDomain = domains[this._lastIndex];
+        this._successors = new Array(this._lastDomain); // Terminal nodes of the group which is being filled
+        this._successorsCount = 0;
+    }
+
+    /**
+     * Pushes the next chunk of the truth vector. Chunks may have any length.
+     * @param {number[]|Int32Array|Uint8Array} values - The next values of the truth vector.
+     * @returns {void}
+     */
+    push(values) {
+        const nodeFactory = this._nodeFactory;
+        for (let j = 0; j < values.length; j++) {
+            this._successors[this._successorsCount++] = nodeFactory.createTerminalNode(values[j]);
+            if (this._successorsCount === this._lastDomain) {
+                let node = nodeFactory.createInternalNode(this._lastIndex, this._successors);
+                this._stack.push([node, this._lastIndex]);
+                this._truthTable.shrinkStack(this._stack, nodeFactory);
+
+                this._successors = new Array(this._lastDomain);
+                this._successorsCount = 0;
+            }
+        }
+        this._count += values.length;
+    }
+
+    /**
+     * Pushes all chunks of the truth vector and finishes the MDD.
+     * @param {AsyncIterable|Iterable|ReadableStream} chunks - Chunks of the truth vector, each is an array of values.
+     * @returns {Promise<MDD|CompactMDD|null>} - The MDD, or null if the number of values does not match the domains.
+     */
+    async pushAll(chunks) {
+        if (typeof ReadableStream !== "undefined" && chunks instanceof ReadableStream) {
+            const reader = chunks.getReader();
+            for (let chunk = await reader.read(); !chunk.done; chunk = await reader.read()) {
+                this.push(chunk.value);
+            }
+        } else {
+            for await (const chunk of chunks) {
+                this.push(chunk);
+            }
+        }
+        return this.finish();
+    }
+
+    /**
+     * Finishes the MDD after all values of the truth vector were pushed.
+     * @returns {MDD|CompactMDD|null} - The MDD, or null if the number of values does not match the domains.
+     */
+    finish() {
+        if (this._count !== this._expectedCount) {
+            console.error(`MDD cannot be built. The number of truth vector values (${this._count}) does not match the product of the domains (${this._expectedCount}).`);
+            return null;
+        }
+        return this.createDiagram();
+    }
+
+    /**
+     * Creates the diagram from the root on the top of the stack, without checking the number of pushed values.
+     * @returns {MDD|CompactMDD} - The MDD.
+     */
+    createDiagram() {
+        let root = this._stack[this._stack.length - 1][0]; // "Peek" into the stack and retrieve just the node from the pair [node, integer].
+        return this._nodeFactory.createDiagram(root);
+    }
+}
+
 if (typeof window !== 'undefined') {
     window.TruthTable = TruthTable;
+    window.MDDBuilder = MDDBuilder;
 }
 
-export { TruthTable };
+export { TruthTable, MDDBuilder };
 // Enable CommonJS only if running in Node.js (Jest)
 if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
-    module.exports = { TruthTable };
+    module.exports = { TruthTable, MDDBuilder };
 }
\ No newline at end of file
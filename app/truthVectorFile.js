@@ -0,0 +1,115 @@
+// Binary truth vector file:
+//   bytes 0-3  magic "MDDV"
+//   byte  4    format version (1)
+//   byte  5    size of one value in bytes (1, 2 or 4)
+//   bytes 6-7  number of variables n (uint16)
+//   then n domain sizes (uint32 each) and the values of the truth vector (unsigned, value size each).
+// Numbers are little-endian, the byte order of typed arrays on all common platforms. The header length
+// is a multiple of 4, so the values can be read as a typed array view of the file without copying them.
+const MAGIC = [0x4D, 0x44, 0x44, 0x56];
+const VERSION = 1;
+const HEADER_LENGTH = 8;
+const VALUE_ARRAY_TYPES = { 1: Uint8Array, 2: Uint16Array, 4: Uint32Array };
+
+/**
+ * Reads a binary truth vector file. The truth vector is a view of the buffer, not a copy, so it can be used
+ * by TruthTable directly. The file contents must not change while the truth vector is used.
+ * @param {ArrayBuffer|Uint8Array} buffer - Contents of the file, e.g. from File.arrayBuffer() or fs.readFileSync().
+ * @returns {{domains: Int32Array, truthVector: (Uint8Array|Uint16Array|Uint32Array)}|null} - The domains
+ *          and the truth vector, or null if the file is not valid.
+ */
+function readTruthVectorFile(buffer) {
+    let bytes = buffer instanceof ArrayBuffer ? new Uint8Array(buffer) : buffer;
+    if (bytes.length < HEADER_LENGTH || MAGIC.some((byte, i) => bytes[i] !== byte)) {
+        console.error("Truth vector file cannot be read. It is not a truth vector file.");
+        return null;
+    }
+    const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+    if (view.getUint8(4) !== VERSION) {
+        console.error(`Truth vector file cannot be read. Unsupported version ${view.getUint8(4)}.`);
+        return null;
+    }
+    const valueSize = view.getUint8(5);
+    const ArrayType = VALUE_ARRAY_TYPES[valueSize];
+    if (ArrayType === undefined) {
+        console.error(`Truth vector file cannot be read. Unsupported value size ${valueSize}.`);
+        return null;
+    }
+
+    const variablesCount = view.getUint16(6, true);
+    const valuesOffset = HEADER_LENGTH + variablesCount * 4;
+    if (bytes.length < valuesOffset) {
+        console.error("Truth vector file cannot be read. The file is shorter than its header.");
+        return null;
+    }
+    const domains = new Int32Array(variablesCount);
+    let valuesCount = 1;
+    for (let i = 0; i < variablesCount; i++) {
+        domains[i] = view.getUint32(HEADER_LENGTH + i * 4, true);
+        if (domains[i] < 1) {
+            console.error(`Truth vector file cannot be read. Invalid domain size ${domains[i]} of variable x${i}.`);
+            return null;
+        }
+        valuesCount *= domains[i];
+    }
+    if (bytes.length - valuesOffset !== valuesCount * valueSize) {
+        console.error(`Truth vector file cannot be read. The number of truth vector values (${(bytes.length - valuesOffset) / valueSize}) does not match the product of the domains (${valuesCount}).`);
+        return null;
+    }
+
+    // A view must be aligned to the value size, a buffer of Node.js may start anywhere in its pool
+    if ((bytes.byteOffset + valuesOffset) % valueSize !== 0) {
+        bytes = bytes.slice();
+    }
+    const truthVector = new ArrayType(bytes.buffer, bytes.byteOffset + valuesOffset, valuesCount);
+    return { domains, truthVector };
+}
+
+/**
+ * Writes the truth vector to a binary truth vector file, using the smallest value size which fits all values.
+ * @param {number[]|Int32Array} domains - An array representing the domains of variables.
+ * @param {number[]|Int32Array|Uint8Array|Uint16Array|Uint32Array} truthVector - The truth vector of the function.
+ * @returns {ArrayBuffer|null} - Contents of the file, or null if the truth vector cannot be stored.
+ */
+function writeTruthVectorFile(domains, truthVector) {
+    const valuesCount = Array.from(domains).reduce((product, size) => product * size, 1);
+    if (truthVector.length !== valuesCount) {
+        console.error(`Truth vector file cannot be written. The number of truth vector values (${truthVector.length}) does not match the product of the domains (${valuesCount}).`);
+        return null;
+    }
+    let maxValue = 0;
+    for (let i = 0; i < truthVector.length; i++) {
+        const value = truthVector[i];
+        if (!(value >= 0 && value <= 0xFFFFFFFF) || !Number.isInteger(value)) {
+            console.error(`Truth vector file cannot be written. Invalid value ${value} at position ${i}.`);
+            return null;
+        }
+        maxValue = Math.max(maxValue, value);
+    }
+    const valueSize = maxValue <= 0xFF ? 1 : maxValue <= 0xFFFF ? 2 : 4;
+
+    const valuesOffset = HEADER_LENGTH + domains.length * 4;
+    const buffer = new ArrayBuffer(valuesOffset + valuesCount * valueSize);
+    const view = new DataView(buffer);
+    MAGIC.forEach((byte, i) => view.setUint8(i, byte));
+    view.setUint8(4, VERSION);
+    view.setUint8(5, valueSize);
+    view.setUint16(6, domains.length, true);
+    for (let i = 0; i < domains.length; i++) {
+        view.setUint32(HEADER_LENGTH + i * 4, domains[i], true);
+    }
+    new VALUE_ARRAY_TYPES[valueSize](buffer, valuesOffset, valuesCount).set(truthVector);
+    return buffer;
+}
+
+if (typeof window !== 'undefined') {
+    window.readTruthVectorFile = readTruthVectorFile;
+    window.writeTruthVectorFile = writeTruthVectorFile;
+}
+
+export { readTruthVectorFile, writeTruthVectorFile };
+
+// Enable CommonJS only if running in Node.js (Jest)
+if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
+    module.exports = { readTruthVectorFile, writeTruthVectorFile };
+}
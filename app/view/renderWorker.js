@@ -0,0 +1,254 @@
+/**
+ * Bounded cache of rendered results with least recently used eviction.
+ * Keys are made of the engine, format and a hash of the DOT string. The DOT string itself is stored too,
+ * so a hash collision cannot return a result of a different graph.
+ */
+class RenderCache {
+    /**
+     * Constructs an empty cache.
+     * @param {number} maxEntries - Maximal number of stored results.
+     */
+    constructor(maxEntries = 16) {
+        this._maxEntries = maxEntries;
+        this._entries = new Map(); // Entries {src, result} by key, ordered from the least recently used
+    }
+
+    /**
+     * Generates the key of the DOT string rendered with the given options.
+     * @param {string} src - The DOT string.
+     * @param {Object} options - Render options with format and engine.
+     * @returns {string} The key.
+     */
+    makeKey(src, options) {
+        // 32-bit FNV-1a hash of the DOT string
+        let hash = 0x811c9dc5;
+        for (let i = 0; i < src.length; i++) {
+            hash = Math.imul(hash ^ src.charCodeAt(i), 0x01000193);
+        }
+        return `${options.engine}:${options.format}:${src.length}:${hash >>> 0}`;
+    }
+
+    /**
+     * Gets the stored result and marks it as the most recently used one.
+     * @param {string} src - The DOT string.
+     * @param {Object} options - Render options with format and engine.
+     * @returns {string|undefined} The stored result, or undefined if there is none.
+     */
+    get(src, options) {
+        const key = this.makeKey(src, options);
+        const entry = this._entries.get(key);
+        if (entry === undefined || entry.src !== src) {
+            return undefined;
+        }
+        this._entries.delete(key);
+        this._entries.set(key, entry);
+        return entry.result;
+    }
+
+    /**
+     * Stores the result, evicting the least recently used one if the cache is full.
+     * @param {string} src - The DOT string.
+     * @param {Object} options - Render options with format and engine.
+     * @param {string} result - The rendered result.
+     * @returns {void}
+     */
+    set(src, options, result) {
+        const key = this.makeKey(src, options);
+        this._entries.delete(key);
+        this._entries.set(key, {src: src, result: result});
+        if (this._entries.size > this._maxEntries) {
+            this._entries.delete(this._entries.keys().next().value);
+        }
+    }
+}
+
+/**
+ * Persistent Graphviz render worker shared by the preview and the export.
+ *
+ * Creating the worker loads and instantiates the whole Graphviz module, which is slow,
+ * so a single worker is kept alive and jobs are matched with their results by request ids.
+ * Preview jobs are replaceable: when a new preview starts while an older one is still running,
+ * the worker is restarted to drop the stale job, and the stale job resolves with null.
+ * Results are cached, so rendering the same DOT string again does not run Graphviz at all.
+ */
+class RenderWorker {
+    /**
+     * Constructs the render worker. The worker itself is created lazily with the first job.
+     * @param {string} workerURL - URL of the Graphviz worker script.
+     */
+    constructor(workerURL = "./full.render.js") {
+        this._workerURL = workerURL;
+        this._worker = null;
+        this._nextId = 0;
+        this._jobs = new Map(); // Running jobs by id, each is {src, options, replaceable, resolve, reject}
+        this._cache = new RenderCache();
+    }
+
+    /**
+     * Gets the render worker shared by the whole page.
+     * @returns {RenderWorker} The shared render worker.
+     */
+    static getShared() {
+        if (!RenderWorker._shared) {
+            RenderWorker._shared = new RenderWorker();
+        }
+        return RenderWorker._shared;
+    }
+
+    /**
+     * Renders the DOT string in the worker.
+     * @param {string} src - The DOT string.
+     * @param {Object} options - Render options, mainly format ("svg", "png", ...) and engine ("dot", ...).
+     * @param {boolean} replaceable - True if a newer replaceable job makes this job stale (used for the preview).
+     * @returns {Promise<string|null>} The rendered result, or null if the job was replaced by a newer one.
+     */
+    render(src, options = {}, replaceable = false) {
+        if (replaceable) {
+            this.dropStaleJobs();
+        }
+
+        const fullOptions = this.getFullOptions(options);
+        const cachedResult = this._cache.get(src, fullOptions);
+        if (cachedResult !== undefined) {
+            return Promise.resolve(cachedResult);
+        }
+
+        const id = this._nextId++;
+        return new Promise((resolve, reject) => {
+            this._jobs.set(id, {src: src, options: fullOptions, replaceable: replaceable, resolve: resolve, reject: reject});
+            this.getWorker().postMessage({id: id, src: src, options: fullOptions});
+        });
+    }
+
+    /**
+     * Gets the cached result of rendering the DOT string.
+     * @param {string} src - The DOT string.
+     * @param {Object} options - Render options, see render.
+     * @returns {string|undefined} The cached result, or undefined if the DOT string was not rendered recently.
+     */
+    getCachedResult(src, options = {}) {
+        return this._cache.get(src, this.getFullOptions(options));
+    }
+
+    /**
+     * Stores a result obtained without Graphviz (e.g. a restyled SVG), so rendering the DOT string returns it.
+     * @param {string} src - The DOT string.
+     * @param {Object} options - Render options, see render.
+     * @param {string} result - The result Graphviz would produce for the DOT string.
+     * @returns {void}
+     */
+    cacheResult(src, options, result) {
+        this._cache.set(src, this.getFullOptions(options), result);
+    }
+
+    /**
+     * Fills in the default render options.
+     * @param {Object} options - Render options, see render.
+     * @returns {Object} The options with all properties set.
+     */
+    getFullOptions(options) {
+        return Object.assign({format: "svg", engine: "dot", files: [], images: [], yInvert: false, nop: 0}, options);
+    }
+
+    /**
+     * Renders the DOT string to an SVG element.
+     * @param {string} src - The DOT string.
+     * @param {Object} options - Render options, see render. The format is always "svg".
+     * @returns {Promise<SVGSVGElement>} The rendered SVG element.
+     */
+    renderSVGElement(src, options = {}) {
+        return this.render(src, Object.assign({}, options, {format: "svg"})).then(function (result) {
+            return new DOMParser().parseFromString(result, "image/svg+xml").documentElement;
+        });
+    }
+
+    /**
+     * Drops the running replaceable jobs. The worker cannot stop a running job, so it is restarted,
+     * and the jobs which are still needed are sent to the new worker.
+     * @returns {void}
+     */
+    dropStaleJobs() {
+        let hasStaleJobs = false;
+        for (const [id, job] of this._jobs) {
+            if (job.replaceable) {
+                hasStaleJobs = true;
+                this._jobs.delete(id);
+                job.resolve(null);
+            }
+        }
+        if (!hasStaleJobs) {
+            return;
+        }
+
+        this.terminateWorker();
+        for (const [id, job] of this._jobs) {
+            this.getWorker().postMessage({id: id, src: job.src, options: job.options});
+        }
+    }
+
+    /**
+     * Gets the worker, creating it if needed.
+     * @returns {Worker} The worker.
+     */
+    getWorker() {
+        if (this._worker === null) {
+            this._worker = new Worker(this._workerURL);
+            this._worker.addEventListener("message", (event) => this.onMessage(event.data));
+            this._worker.addEventListener("error", (event) => this.onError(new Error(event.message)));
+        }
+        return this._worker;
+    }
+
+    /**
+     * Terminates the worker, a new one is created with the next job.
+     * @returns {void}
+     */
+    terminateWorker() {
+        if (this._worker !== null) {
+            this._worker.terminate();
+            this._worker = null;
+        }
+    }
+
+    /**
+     * Handles the reply of the worker.
+     * @param {Object} data - The reply {id, result} or {id, error}.
+     * @returns {void}
+     */
+    onMessage(data) {
+        const job = this._jobs.get(data.id);
+        if (job === undefined) {
+            return; // Reply to a dropped job
+        }
+        this._jobs.delete(data.id);
+
+        if (typeof data.error !== "undefined") {
+            job.reject(new Error(data.error.message));
+        } else {
+            this._cache.set(job.src, job.options, data.result);
+            job.resolve(data.result);
+        }
+    }
+
+    /**
+     * Handles an error which stopped the worker. All running jobs fail.
+     * @param {Error} error - The error.
+     * @returns {void}
+     */
+    onError(error) {
+        this.terminateWorker();
+        const jobs = Array.from(this._jobs.values());
+        this._jobs.clear();
+        jobs.forEach(job => job.reject(error));
+    }
+}
+
+if (typeof window !== 'undefined') {
+    window.RenderCache = RenderCache;
+    window.RenderWorker = RenderWorker;
+}
+
+// Enable CommonJS only if running in Node.js (Jest)
+if (typeof module !== "undefined" && typeof module.exports !== "undefined") {
+    module.exports = { RenderCache, RenderWorker };
+}
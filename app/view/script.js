@@ -21,7 +21,7 @@
         downloadBtn = document.getElementById("download"),
         editor = ace.edit("editor"),
         lastHD = -1,
-        worker = null,
+        renderWorker = RenderWorker.getShared(),
         parser = new DOMParser(),
         showError = null,
         formatEl = "svg",
@@ -87,41 +87,27 @@ function renderGraph() {
     reviewer.classList.add("working");
     reviewer.classList.remove("error");
 
-    let worker;
-
-    if (worker) {
-        worker.terminate();
-    } else if (!worker) {
-        worker = new Worker("./full.render.js");
-
-        worker.addEventListener("message", function (e) {
-            if (typeof e.data.error !== "undefined") {
-                var event = new CustomEvent("error", {"detail": new Error(e.data.error.message)});
-                worker.dispatchEvent(event);
-                return
-            }
-            reviewer.classList.remove("working");
-            reviewer.classList.remove("error");
-            document.body.style.cursor = "default";
-            updateOutput(e.data.result);
-        }, false);
-        worker.addEventListener('error', function (e) {
-            show_error(e.detail);
-            document.body.style.cursor = "default";
-        }, false);
-    }
-
     show_status("rendering...");
-    var params = {
-        "src": editor.getSession().getDocument().getValue(),
-        "id": new Date().toJSON(),
-        "options": {
-            "files": [],
-            "format": formatEl === "png-image-element" ? "png" : "svg",
-            "engine": engineEl || "dot"
-        },
+    var options = {
+        "files": [],
+        "format": formatEl === "png-image-element" ? "png" : "svg",
+        "engine": engineEl || "dot"
     };
-    worker.postMessage(params);
+    // The render worker is shared with the export and kept alive between renders.
+    // If a newer render starts before this one finishes, this one resolves with null.
+    // Results are cached, so a render of an unchanged graph finishes immediately.
+    renderWorker.render(editor.getSession().getDocument().getValue(), options, true).then(function (result) {
+        if (result === null) {
+            return;
+        }
+        reviewer.classList.remove("working");
+        reviewer.classList.remove("error");
+        document.body.style.cursor = "default";
+        updateOutput(result);
+    }).catch(function (e) {
+        show_error(e);
+        document.body.style.cursor = "default";
+    });
 }
 
     function updateState() {
@@ -228,6 +214,30 @@ function renderGraph() {
         }
     };
 
+    // Clears the editor and the preview to the state of a freshly loaded page, so the page does not have to be
+    // loaded again (used by resetApplication in index.html). A running render is dropped, its result is then null.
+    window.resetPreview = function () {
+        editor.getSession().setValue("");
+        clearTimeout(lastHD); // The change of the editor would render the empty graph
+        renderWorker.dropStaleJobs();
+        clearTimeout(t_stetus);
+        el_stetus.innerHTML = "";
+
+        reviewer.classList.remove("working");
+        reviewer.classList.remove("error");
+        Array.from(reviewer.children).forEach(function (child) {
+            if (child !== errorEl) {
+                reviewer.removeChild(child);
+            }
+        });
+        while (errorEl.firstChild) {
+            errorEl.removeChild(errorEl.firstChild);
+        }
+        downloadBtn.removeAttribute("download");
+        downloadBtn.href = "#";
+        history.replaceState(null, "", location.pathname + location.search);
+    };
+
     /*formatEl.addEventListener("change", renderGraph);
     engineEl.addEventListener("change", renderGraph);
     rawEl.addEventListener("change", renderGraph);
@@ -0,0 +1,114 @@
+/**
+ * Paginated view of a truth table. Only the rows of the shown page are computed and added to the page,
+ * so even a truth table with millions of rows takes no more memory than its truth vector.
+ */
+class TruthTableView {
+    /**
+     * Constructs the view inside the container.
+     * @param {HTMLElement} container - The element the view is rendered into.
+     * @param {number} pageSize - Number of rows on one page.
+     */
+    constructor(container, pageSize = 16) {
+        this._container = container;
+        this._pageSize = pageSize;
+        this._truthTable = null;
+        this._page = 0;
+    }
+
+    /**
+     * Shows the truth table from its first page.
+     * @param {TruthTable|null} truthTable - The truth table, or null to clear the view.
+     * @returns {void}
+     */
+    setTable(truthTable) {
+        this._truthTable = truthTable;
+        this._page = 0;
+        this.render();
+    }
+
+    /**
+     * Gets the number of pages of the shown truth table.
+     * @returns {number} The number of pages.
+     */
+    getPageCount() {
+        return this._truthTable === null ? 0 : Math.ceil(this._truthTable.getTableLength() / this._pageSize);
+    }
+
+    /**
+     * Shows the page with the given index, it is clamped to the existing pages.
+     * @param {number} page - Index of the page.
+     * @returns {void}
+     */
+    showPage(page) {
+        this._page = Math.max(0, Math.min(page, this.getPageCount() - 1));
+        this.render();
+    }
+
+    /**
+     * Renders the current page of the truth table and the page navigation.
+     * @returns {void}
+     */
+    render() {
+        while (this._container.firstChild) {
+            this._container.removeChild(this._container.firstChild);
+        }
+        if (this._truthTable === null) {
+            return;
+        }
+
+        const tableLength = this._truthTable.getTableLength();
+        const start = this._page * this._pageSize;
+        const end = Math.min(start + this._pageSize, tableLength);
+
+        const table = document.createElement("table");
+        table.className = "truth-table";
+
+        // Header with the variables and the function
+        const headerRow = table.createTHead().insertRow();
+        for (let i = 0; i < this._truthTable.getVariablesCount(); i++) {
+            const cell = document.createElement("th");
+            cell.innerHTML = `x<sub>${i}</sub>`;
+            headerRow.appendChild(cell);
+        }
+        const functionCell = document.createElement("th");
+        functionCell.textContent = "f";
+        headerRow.appendChild(functionCell);
+
+        // Rows of the current page only
+        const body = table.createTBody();
+        let rowIndex = start;
+        for (const values of this._truthTable.iterateRows(start, end)) {
+            const row = body.insertRow();
+            values.forEach(value => row.insertCell().textContent = value);
+            row.insertCell().textContent = this._truthTable.getValue(rowIndex++);
+        }
+        this._container.appendChild(table);
+
+        // Page navigation
+        const navigation = document.createElement("div");
+        navigation.className = "truth-table-navigation";
+        navigation.appendChild(this.createButton("<", this._page > 0, () => this.showPage(this._page - 1)));
+        const status = document.createElement("span");
+        status.textContent = `Rows ${start + 1}-${end} of ${tableLength}`;
+        navigation.appendChild(status);
+        navigation.appendChild(this.createButton(">", end < tableLength, () => this.showPage(this._page + 1)));
+        this._container.appendChild(navigation);
+    }
+
+    /**
+     * Creates a button of the page navigation.
+     * @param {string} text - Text of the button.
+     * @param {boolean} enabled - True if the button can be clicked.
+     * @param {Function} onClick - Click handler.
+     * @returns {HTMLButtonElement} The button.
+     */
+    createButton(text, enabled, onClick) {
+        const button = document.createElement("button");
+        button.textContent = text;
+        button.disabled = !enabled;
+        button.addEventListener("click", onClick);
+        return button;
+    }
+}
+
+window.TruthTableView = TruthTableView;
@@ -0,0 +1,290 @@
+// Command line tool building MDDs of many functions and writing their DOT (and optionally SVG) files.
+//
+// Usage: node mdd-cli.mjs [options] <input files...>
+//   Input files are JSONL files with one job per line, {"name"?, "domains", "truthVector", "settings"?},
+//   or binary truth vector files (see app/truthVectorFile.js) with one job each.
+//   --out <directory>  Directory the files are written to (mdd-output by default).
+//   --svg              Render SVG files by the bundled Viz.js as well.
+//   --workers <count>  Number of worker threads (the number of CPU cores by default).
+//   --reorder          Minimize the order of variables before the graph is created.
+//   --split            Run one job at a time, split into parts built by all workers (for very long truth vectors).
+import fs from "fs";
+import os from "os";
+import path from "path";
+import readline from "readline";
+import { createRequire } from "module";
+import { Worker, isMainThread, parentPort, workerData } from "worker_threads";
+
+const USAGE = "Usage: node mdd-cli.mjs [--out <directory>] [--svg] [--workers <count>] [--reorder] [--split] <input files...>";
+
+/**
+ * Parses the command line arguments.
+ * @param {string[]} args - The arguments without the node executable and the script.
+ * @returns {Object|null} - The options {inputs, outputDirectory, svg, workersCount, reorder, split},
+ *          or null if the arguments are not valid.
+ */
+function parseArguments(args) {
+    const options = {
+        inputs: [],
+        outputDirectory: "mdd-output",
+        svg: false,
+        workersCount: os.availableParallelism ? os.availableParallelism() : os.cpus().length,
+        reorder: false,
+        split: false,
+    };
+    for (let i = 0; i < args.length; i++) {
+        if (args[i] === "--out" && i + 1 < args.length) {
+            options.outputDirectory = args[++i];
+        } else if (args[i] === "--svg") {
+            options.svg = true;
+        } else if (args[i] === "--workers" && i + 1 < args.length) {
+            options.workersCount = Number(args[++i]);
+            if (!Number.isInteger(options.workersCount) || options.workersCount < 1) {
+                console.error(`Invalid number of workers ${args[i]}.`);
+                return null;
+            }
+        } else if (args[i] === "--reorder") {
+            options.reorder = true;
+        } else if (args[i] === "--split") {
+            options.split = true;
+        } else if (args[i].startsWith("--")) {
+            console.error(`Unknown option ${args[i]}.`);
+            return null;
+        } else {
+            options.inputs.push(args[i]);
+        }
+    }
+    return options.inputs.length > 0 ? options : null;
+}
+
+/**
+ * Reads the jobs of the input file one by one, so a JSONL file is never kept in memory as a whole.
+ * @param {string} inputPath - Path of a JSONL or binary truth vector file.
+ * @param {Function} readTruthVectorFile - The reader of binary files.
+ * @returns {AsyncGenerator<Object>} - Jobs {name, domains, truthVector, settings}, or {name, error} for invalid lines.
+ */
+async function* readJobs(inputPath, readTruthVectorFile) {
+    const baseName = path.basename(inputPath, path.extname(inputPath));
+    if (!inputPath.endsWith(".jsonl")) {
+        const result = readTruthVectorFile(fs.readFileSync(inputPath));
+        yield result === null ? { name: baseName, error: "Invalid truth vector file." } : { name: baseName, ...result, settings: {} };
+        return;
+    }
+
+    const lines = readline.createInterface({ input: fs.createReadStream(inputPath), crlfDelay: Infinity });
+    let lineNumber = 0;
+    for await (const line of lines) {
+        lineNumber++;
+        if (line.trim() === "") {
+            continue;
+        }
+        const name = `${baseName}-${lineNumber}`;
+        try {
+            const job = JSON.parse(line);
+            yield {
+                name: job.name !== undefined ? String(job.name).replace(/[^\w.-]/g, "_") : name, // Used as a file name
+                domains: Int32Array.from(job.domains),
+                truthVector: Int32Array.from(job.truthVector),
+                settings: job.settings || {},
+            };
+        } catch (error) {
+            yield { name, error: `Invalid job on line ${lineNumber}. ${error.message}` };
+        }
+    }
+}
+
+/**
+ * Checks that the truth vector of the job has a value for every assignment of the domains.
+ * @param {Object} job - The job {domains, truthVector}.
+ * @returns {string|null} - The error message, or null if the job is valid.
+ */
+function validateJob(job) {
+    let product = 1;
+    for (let i = 0; i < job.domains.length; i++) {
+        if (!(job.domains[i] >= 1)) {
+            return `Invalid domain size ${job.domains[i]} of variable x${i}.`;
+        }
+        product *= job.domains[i];
+    }
+    if (job.truthVector.length !== product) {
+        return `The number of truth vector values (${job.truthVector.length}) does not match the product of the domains (${product}).`;
+    }
+    return null;
+}
+
+/**
+ * Runs all jobs of the input files in a pool of worker threads.
+ * @param {Object} options - The options returned by parseArguments.
+ * @returns {Promise<number>} - The number of failed jobs.
+ */
+async function runJobs(options) {
+    const { readTruthVectorFile } = await import("./app/truthVectorFile.js");
+    fs.mkdirSync(options.outputDirectory, { recursive: true });
+
+    const idleWorkers = [];
+    const waitingForWorker = []; // Resolve functions of requests for a free worker
+    let runningCount = 0;
+    let onAllDone = null;
+    let failedCount = 0;
+    let writtenCount = 0;
+
+    const releaseWorker = (worker) => {
+        const next = waitingForWorker.shift();
+        next === undefined ? idleWorkers.push(worker) : next(worker);
+    };
+    const acquireWorker = () => idleWorkers.length > 0
+        ? Promise.resolve(idleWorkers.pop())
+        : new Promise(resolve => waitingForWorker.push(resolve));
+
+    const workers = Array.from({ length: options.workersCount }, () => {
+        const worker = new Worker(new URL(import.meta.url), {
+            workerData: { outputDirectory: options.outputDirectory, svg: options.svg, reorder: options.reorder },
+        });
+        worker.on("message", (reply) => {
+            if (reply.error !== undefined) {
+                failedCount++;
+                console.error(`${reply.name}: ${reply.error}`);
+            } else {
+                writtenCount++;
+            }
+            runningCount--;
+            releaseWorker(worker);
+            if (runningCount === 0 && onAllDone !== null) {
+                onAllDone();
+            }
+        });
+        worker.on("error", (error) => {
+            console.error(`Worker stopped. ${error.message}`);
+            process.exit(1);
+        });
+        idleWorkers.push(worker);
+        return worker;
+    });
+
+    // The next job is read only when a worker is free for it
+    for (const inputPath of options.inputs) {
+        for await (const job of readJobs(inputPath, readTruthVectorFile)) {
+            const error = job.error || validateJob(job);
+            if (error) {
+                failedCount++;
+                console.error(`${job.name}: ${error}`);
+                continue;
+            }
+            const worker = await acquireWorker();
+            runningCount++;
+            worker.postMessage(job, [job.domains.buffer, job.truthVector.buffer]);
+        }
+    }
+    if (runningCount > 0) {
+        await new Promise(resolve => onAllDone = resolve);
+    }
+    await Promise.all(workers.map(worker => worker.terminate()));
+
+    console.log(`${writtenCount} diagrams written to ${options.outputDirectory}, ${failedCount} jobs failed.`);
+    return failedCount;
+}
+
+/**
+ * Runs the jobs one by one, each of them is split into parts built by all workers (see ParallelMDDBuilder).
+ * @param {Object} options - The options returned by parseArguments.
+ * @returns {Promise<number>} - The number of failed jobs.
+ */
+async function runSplitJobs(options) {
+    const { readTruthVectorFile } = await import("./app/truthVectorFile.js");
+    const { ParallelMDDBuilder } = await import("./app/parallelBuilder.js");
+    const { createGraph } = await import("./app/mddWorker.js");
+    fs.mkdirSync(options.outputDirectory, { recursive: true });
+
+    const workers = Array.from({ length: options.workersCount }, () => new Worker(new URL("./app/partWorker.js", import.meta.url)));
+    const builder = new ParallelMDDBuilder(workers);
+    const renderSVG = options.svg ? createSVGRenderer() : null;
+    let failedCount = 0;
+    let writtenCount = 0;
+
+    for (const inputPath of options.inputs) {
+        for await (const job of readJobs(inputPath, readTruthVectorFile)) {
+            try {
+                const error = job.error || validateJob(job);
+                if (error) {
+                    throw new Error(error);
+                }
+                const mdd = await builder.build(job.domains, job.truthVector);
+                const settings = { ...job.settings, reorderVariables: options.reorder || job.settings.reorderVariables };
+                await writeDiagram(path.join(options.outputDirectory, job.name), createGraph(mdd, job.domains, settings).toDOTString(), renderSVG);
+                writtenCount++;
+            } catch (error) {
+                failedCount++;
+                console.error(`${job.name}: ${error.message}`);
+            }
+        }
+    }
+    await Promise.all(workers.map(worker => worker.terminate()));
+
+    console.log(`${writtenCount} diagrams written to ${options.outputDirectory}, ${failedCount} jobs failed.`);
+    return failedCount;
+}
+
+/**
+ * Creates the function rendering DOT strings to SVG by the bundled Viz.js.
+ * @returns {function(string): Promise<string>} - The function.
+ */
+function createSVGRenderer() {
+    const require = createRequire(import.meta.url);
+    const Viz = require("./app/view/viz.js");
+    const { Module, render } = require("./app/view/full.render.js");
+    let viz = new Viz({ Module, render });
+
+    return async (dotString) => {
+        try {
+            return await viz.renderString(dotString);
+        } catch (error) {
+            viz = new Viz({ Module, render }); // Viz.js cannot be used after an error
+            throw error;
+        }
+    };
+}
+
+/**
+ * Writes the DOT file and, if the renderer is given, the SVG file of the diagram.
+ * @param {string} outputPath - Path of the files without the extension.
+ * @param {string} dotString - The DOT string of the diagram.
+ * @param {function(string): Promise<string>|null} renderSVG - The SVG renderer, or null.
+ * @returns {Promise<void>}
+ */
+async function writeDiagram(outputPath, dotString, renderSVG) {
+    fs.writeFileSync(`${outputPath}.dot`, dotString);
+    if (renderSVG !== null) {
+        fs.writeFileSync(`${outputPath}.svg`, await renderSVG(dotString));
+    }
+}
+
+/**
+ * Worker thread part. Each message is a job, the worker writes its files and replies {name} or {name, error}.
+ * @returns {Promise<void>}
+ */
+async function runWorker() {
+    const { buildGraph } = await import("./app/mddWorker.js");
+    const renderSVG = workerData.svg ? createSVGRenderer() : null;
+
+    parentPort.on("message", async (job) => {
+        const settings = { ...job.settings, reorderVariables: workerData.reorder || job.settings.reorderVariables };
+        try {
+            const dotString = buildGraph(job.domains, job.truthVector, settings).toDOTString();
+            await writeDiagram(path.join(workerData.outputDirectory, job.name), dotString, renderSVG);
+            parentPort.postMessage({ name: job.name });
+        } catch (error) {
+            parentPort.postMessage({ name: job.name, error: error.message });
+        }
+    });
+}
+
+if (isMainThread) {
+    const options = parseArguments(process.argv.slice(2));
+    if (options === null) {
+        console.error(USAGE);
+        process.exit(2);
+    }
+    (options.split ? runSplitJobs(options) : runJobs(options)).then(failedCount => process.exit(failedCount > 0 ? 1 : 0));
+} else {
+    runWorker();
+}
@@ -0,0 +1,96 @@
+const {TruthTable} = require('../app/table'); // Imports the TruthTable class from table.js.
+const {Graph} = require('../app/graph'); // Imports the Graph class from graph.js.
+const {ApplyEngine, ComputedTable} = require('../app/applyEngine'); // Imports the ApplyEngine and ComputedTable class from applyEngine.js.
+
+// Generates the DOT string of the MDD, equal diagrams have equal DOT strings.
+function toDOTString(mdd) {
+    const graph = new Graph();
+    graph.traverseMDD(mdd.getRoot());
+    return graph.toDOTString();
+}
+
+describe('ApplyEngine', () => {
+    const domains = [3, 2, 3];
+    const vectorA = [0, 1, 2, 0, 0, 0, 1, 1, 1, 2, 0, 1, 2, 2, 2, 0, 1, 0];
+    const vectorB = [1, 1, 1, 0, 2, 0, 0, 1, 2, 2, 2, 2, 0, 0, 1, 1, 0, 0];
+    const vectorC = [0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1];
+
+    // Builds the MDD of the truth vector with the node factory of the engine.
+    function fromVector(engine, truthVector) {
+        return new TruthTable(domains, truthVector).fromVector(engine.getNodeFactory());
+    }
+
+    it('should combine two diagrams the same as their truth vectors', () => {
+        const engine = new ApplyEngine();
+        const mddA = fromVector(engine, vectorA);
+        const mddB = fromVector(engine, vectorB);
+
+        for (const [operation, operationFunction] of [['min', Math.min], ['max', Math.max], ['plus', (a, b) => a + b], [(a, b) => (a - b + 3) % 3, (a, b) => (a - b + 3) % 3]]) {
+            const expectedVector = vectorA.map((value, i) => operationFunction(value, vectorB[i]));
+
+            expect(toDOTString(engine.apply(operation, mddA, mddB))).toBe(toDOTString(fromVector(engine, expectedVector)));
+        }
+    });
+
+    it('should combine three diagrams by if-then-else', () => {
+        const engine = new ApplyEngine();
+        const expectedVector = vectorC.map((value, i) => value !== 0 ? vectorA[i] : vectorB[i]);
+
+        const mdd = engine.ite(fromVector(engine, vectorC), fromVector(engine, vectorA), fromVector(engine, vectorB));
+
+        expect(toDOTString(mdd)).toBe(toDOTString(fromVector(engine, expectedVector)));
+    });
+
+    it('should reuse computed results and keep the computed table bounded', () => {
+        const engine = new ApplyEngine(undefined, 4);
+        const mddA = fromVector(engine, vectorA);
+        const mddB = fromVector(engine, vectorB);
+        const expectedDOTString = toDOTString(new ApplyEngine().apply('max', mddA, mddB));
+
+        expect(toDOTString(engine.apply('max', mddA, mddB))).toBe(expectedDOTString);
+        expect(engine.getComputedTable().getSize()).toBe(4);
+        // Commutative operations share the results for swapped operands.
+        const hits = engine.getComputedTable().hits;
+        engine.apply('max', mddB, mddA);
+        expect(engine.getComputedTable().hits).toBeGreaterThan(hits);
+    });
+
+    it('should print an error message when the operands have different domains', () => {
+        const engine = new ApplyEngine();
+        const consoleErrorSpy = jest.spyOn(console, 'error').mockImplementation();
+
+        const mddA = fromVector(engine, vectorA);
+        const mddB = new TruthTable([2, 2, 3], [0, 0, 0, 0, 1, 1, 0, 1, 1, 0, 2, 2]).fromVector(engine.getNodeFactory());
+        expect(engine.apply('min', mddA, mddB)).toBeNull();
+        expect(consoleErrorSpy).toHaveBeenCalledWith('Apply cannot be performed. Variable x0 has 3 values in one operand and 2 in another.');
+        expect(engine.apply('minimum', mddA, mddA)).toBeNull();
+        expect(consoleErrorSpy).toHaveBeenCalledWith('Apply cannot be performed. Unknown operation minimum.');
+
+        consoleErrorSpy.mockRestore();
+    });
+});
+
+describe('ComputedTable', () => {
+    it('should evict the least recently used result', () => {
+        const computedTable = new ComputedTable(2);
+        computedTable.set(1, 0, 1, -1, 'a');
+        computedTable.set(1, 0, 2, -1, 'b');
+        computedTable.get(1, 0, 1);
+        computedTable.set(0, 0, 1, 2, 'c');
+
+        expect(computedTable.get(1, 0, 1)).toBe('a');
+        expect(computedTable.get(1, 0, 2)).toBeUndefined();
+        expect(computedTable.get(0, 0, 1, 2)).toBe('c');
+    });
+
+    it('should not return the result of other operands with the same hash', () => {
+        const computedTable = new ComputedTable();
+        computedTable.makeHashKey = () => 0; // Every key collides
+        computedTable.set(1, 0, 1, -1, 'a');
+
+        expect(computedTable.get(1, 0, 1)).toBe('a');
+        expect(computedTable.get(2, 0, 1)).toBeUndefined();
+        expect(computedTable.get(1, 1, 0)).toBeUndefined();
+        expect(computedTable.get(1, 0, 1, 2)).toBeUndefined();
+    });
+});
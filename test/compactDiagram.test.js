@@ -0,0 +1,163 @@
+const {TerminalNode, MDD} = require('../app/diagram'); // Imports the TerminalNode and MDD class from diagram.js.
+const {CompactMDD, CompactNodeFactory} = require('../app/compactDiagram'); // Imports the CompactMDD and CompactNodeFactory class from compactDiagram.js.
+const {TruthTable} = require('../app/table'); // Imports the TruthTable class from table.js.
+const {Graph} = require('../app/graph'); // Imports the Graph class from graph.js.
+
+describe('CompactNodeFactory', () => {
+    it('should create only one terminal node for each value and give it a negative id', () => {
+        const nodeFactory = new CompactNodeFactory();
+
+        expect(nodeFactory.createTerminalNode(0)).toBe(-1);
+        expect(nodeFactory.createTerminalNode(1)).toBe(-2);
+        expect(nodeFactory.createTerminalNode(0)).toBe(-1);
+        expect(nodeFactory._terminals.length).toBe(2);
+    });
+
+    it('should collect unreachable terminal nodes and copy only reachable ones into a diagram', () => {
+        const nodeFactory = new CompactNodeFactory();
+        new TruthTable([2, 2], [5, 6, 6, 5]).fromVector(nodeFactory);
+        const rootB = nodeFactory.getDiagramRoot(new TruthTable([2, 2], [7, 8, 6, 6]).fromVector(nodeFactory));
+        expect(nodeFactory._terminals.length).toBe(4);
+        expect(Array.from(nodeFactory.createDiagram(rootB).getBuffers().terminalValues)).toEqual([6, 7, 8]);
+
+        const [newRootB] = nodeFactory.collectGarbage([rootB]);
+        expect(nodeFactory._terminals.map(terminal => terminal.getResultValue())).toEqual([6, 7, 8]);
+        expect(nodeFactory.createTerminalNode(7)).toBe(-2);
+        expect(nodeFactory.createTerminalNode(5)).toBe(-4);
+        const mddB = nodeFactory.createDiagram(newRootB);
+        expect(mddB.evaluateBatch([0, 0, 0, 1, 1, 0, 1, 1], 2)).toEqual(Int32Array.from([7, 8, 6, 6]));
+
+        // A constant diagram is only its terminal node
+        expect(nodeFactory.collectGarbage([nodeFactory.createTerminalNode(8)])).toEqual(Int32Array.from([-1]));
+        expect(nodeFactory._terminals.length).toBe(1);
+        expect(Array.from(nodeFactory.createDiagram(-1).getBuffers().terminalValues)).toEqual([8]);
+    });
+
+    it('should create only one internal node for each structure and skip redundant nodes', () => {
+        // Small initial capacity, so the arrays and the unique table have to grow.
+        const nodeFactory = new CompactNodeFactory(1);
+        const terminal0 = nodeFactory.createTerminalNode(0);
+        const terminal1 = nodeFactory.createTerminalNode(1);
+
+        const node0 = nodeFactory.createInternalNode(1, [terminal0, terminal1]);
+        const node1 = nodeFactory.createInternalNode(1, [terminal1, terminal0]);
+        const node2 = nodeFactory.createInternalNode(0, [node0, node1, node0]);
+
+        expect(nodeFactory.createInternalNode(1, [terminal0, terminal1])).toBe(node0);
+        expect(nodeFactory.createInternalNode(0, [node0, node1, node0])).toBe(node2);
+        expect(nodeFactory.createInternalNode(0, [node1, node1])).toBe(node1);
+        expect(nodeFactory._nodeCount).toBe(3);
+    });
+});
+
+describe('CompactMDD', () => {
+    // Test data from table 1.2 from thesis.
+    const domains = [2, 2, 3];
+    const truthVector = [0, 0, 0, 0, 1, 1, 0, 1, 1, 0, 2, 2];
+
+    it('should be created directly by fromVector and evaluate the same as TruthTable', () => {
+        const tableOfTruth = new TruthTable(domains, truthVector);
+        const compactMDD = tableOfTruth.fromVector(new CompactNodeFactory());
+
+        expect(compactMDD).toBeInstanceOf(CompactMDD);
+        expect(compactMDD.getNodeCount()).toBe(5);
+        expect(compactMDD.getIndex(compactMDD.getRoot())).toBe(0);
+
+        for (const row of tableOfTruth.getTruthTable()) {
+            expect(compactMDD.evaluate(row).getResultValue()).toBe(tableOfTruth.evaluate(row));
+        }
+    });
+
+    it('should evaluate a batch of assignments the same as TruthTable', () => {
+        const tableOfTruth = new TruthTable(domains, truthVector);
+        const compactMDD = tableOfTruth.fromVector(new CompactNodeFactory());
+        const assignments = Uint8Array.from(tableOfTruth.getTruthTable().flat());
+
+        expect(compactMDD.evaluateBatch(assignments, domains.length)).toEqual(tableOfTruth.evaluateBatch(assignments, domains.length));
+    });
+
+    it('should print an error message when an invalid decision is provided in evaluate', () => {
+        const compactMDD = new TruthTable(domains, truthVector).fromVector(new CompactNodeFactory());
+        const consoleErrorSpy = jest.spyOn(console, 'error').mockImplementation();
+
+        expect(compactMDD.evaluate([2, 0, 0])).toBeNull();
+        expect(consoleErrorSpy).toHaveBeenCalledWith('Invalid decision at node index 0: Either the decision exceeds the number of node\'s successors or it is beyond the provided decisions\' scope.');
+
+        consoleErrorSpy.mockRestore();
+    });
+
+    it('should convert to MDD and back without changing the structure', () => {
+        const mdd = new TruthTable(domains, truthVector).fromVector();
+        const compactMDD = CompactMDD.fromMDD(mdd);
+        const convertedMDD = compactMDD.toMDD();
+
+        expect(convertedMDD).toBeInstanceOf(MDD);
+        const convertedCompactMDD = CompactMDD.fromMDD(convertedMDD);
+        expect(convertedCompactMDD._levels).toEqual(compactMDD._levels);
+        expect(convertedCompactMDD._successorOffsets).toEqual(compactMDD._successorOffsets);
+        expect(convertedCompactMDD._successors).toEqual(compactMDD._successors);
+
+        const consoleLogSpy = jest.spyOn(console, 'log').mockImplementation();
+        mdd.printMDDStructure();
+        const expectedStructure = consoleLogSpy.mock.calls.slice();
+        consoleLogSpy.mockClear();
+        convertedMDD.printMDDStructure();
+        expect(consoleLogSpy.mock.calls).toEqual(expectedStructure);
+        consoleLogSpy.mockRestore();
+    });
+
+    it('should convert an MDD consisting of a single TerminalNode', () => {
+        const compactMDD = CompactMDD.fromMDD(new MDD(new TerminalNode(4)));
+
+        expect(compactMDD.getNodeCount()).toBe(0);
+        expect(compactMDD.isTerminal(compactMDD.getRoot())).toBe(true);
+        expect(compactMDD.evaluate([]).getResultValue()).toBe(4);
+        expect(compactMDD.toMDD().getRoot().getResultValue()).toBe(4);
+    });
+
+    it('should be traversed by Graph into the same DOT string as MDD', () => {
+        const tableOfTruth = new TruthTable(domains, truthVector);
+        const graph = new Graph();
+        graph.traverseMDD(tableOfTruth.fromVector().getRoot());
+        const compactGraph = new Graph();
+        compactGraph.traverseMDD(tableOfTruth.fromVector(new CompactNodeFactory()));
+
+        expect(compactGraph.toDOTString()).toBe(graph.toDOTString());
+    });
+
+    it('should change the value of one assignment the same way as MDD', () => {
+        const domains = [2, 3, 2];
+        const truthVector = [0, 0, 1, 1, 0, 0, 0, 0, 1, 1, 0, 0];
+        const nodeFactory = new CompactNodeFactory();
+        let compactMDD = new TruthTable(domains, truthVector).fromVector(nodeFactory);
+
+        for (const [row, value] of [[[0, 0, 0], 2], [[1, 2, 1], 1], [[0, 0, 0], 0]]) {
+            compactMDD = compactMDD.setValue(row, value, domains, nodeFactory);
+            truthVector[(row[0] * 3 + row[1]) * 2 + row[2]] = value;
+            const graph = new Graph();
+            graph.traverseMDD(new TruthTable(domains, truthVector).fromVector().getRoot());
+            const compactGraph = new Graph();
+            compactGraph.traverseMDD(compactMDD);
+
+            expect(compactGraph.toDOTString()).toBe(graph.toDOTString());
+        }
+    });
+
+    it('should contain only the nodes of its own diagram when the factory created several diagrams', () => {
+        const nodeFactory = new CompactNodeFactory();
+        const mddA = new TruthTable([2, 2, 2], [0, 1, 1, 0, 1, 0, 0, 1]).fromVector(nodeFactory);
+        const mddB = new TruthTable([3], [2, 0, 1]).fromVector(nodeFactory);
+
+        expect(mddA.getNodeCount()).toBe(5);
+        expect(mddB.getNodeCount()).toBe(1);
+        expect(mddB.getLevelSizes(1)).toEqual([3]);
+        expect(mddB.evaluateBatch([0, 1, 2], 1)).toEqual(Int32Array.from([2, 0, 1]));
+        expect(mddA.evaluateBatch([0, 0, 1, 1, 1, 1], 3)).toEqual(Int32Array.from([1, 1]));
+
+        // The root ids of the diagrams differ from their ids in the factory, but the factory knows them
+        expect(nodeFactory.createDiagram(nodeFactory.getDiagramRoot(mddA)).getNodeCount()).toBe(5);
+        expect(nodeFactory.getDiagramRoot(mddB)).toBe(5);
+        expect(nodeFactory.getDiagramRoot(mddB.setValue([1], 2, [3], nodeFactory))).toBe(6);
+    });
+});
+
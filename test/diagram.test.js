@@ -1,4 +1,6 @@
 const {InternalNode, TerminalNode, MDD} = require('../app/diagram'); // Imports the InternalNode, TerminalNode and MDD class from diagram.js.
+const {NodeFactory} = require('../app/nodeFactory'); // Imports the NodeFactory class from nodeFactory.js.
+const {TruthTable} = require('../app/table'); // Imports the TruthTable class from table.js.
 import seedrandom from "seedrandom";
 
 /**
@@ -332,4 +334,24 @@ describe('MDD', () => {
 
         consoleErrorSpy.mockRestore();
     });
+
+    it('should change the value of one assignment by rebuilding only its path', () => {
+        const domains = [3, 2, 2, 3];
+        const truthVector = Array.from({length: 36}, (_, i) => i % 5 === 0 ? 1 : 0);
+        const nodeFactory = new NodeFactory();
+        let mdd = new TruthTable(domains, truthVector).fromVector(nodeFactory);
+
+        // Each change gives the same (reduced) diagram as building the changed truth vector from scratch
+        const truthTable = new TruthTable(domains, truthVector);
+        for (const [rowIndex, value] of [[0, 0], [7, 2], [35, 1], [20, 1], [7, 0]]) {
+            truthVector[rowIndex] = value;
+            mdd = mdd.setValue(truthTable.getRow(rowIndex), value, domains, nodeFactory);
+            expect(mdd.getRoot()).toBe(new TruthTable(domains, truthVector).fromVector(nodeFactory).getRoot());
+        }
+
+        const consoleErrorSpy = jest.spyOn(console, 'error').mockImplementation();
+        expect(mdd.setValue([0, 2, 0, 0], 1, domains, nodeFactory)).toBeNull();
+        expect(consoleErrorSpy).toHaveBeenCalledWith('Value cannot be set. Invalid value 2 of variable x1.');
+        consoleErrorSpy.mockRestore();
+    });
 });
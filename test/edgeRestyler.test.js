@@ -0,0 +1,97 @@
+const fs = require('fs');
+const path = require('path');
+const {Graph} = require('../app/graph'); // Imports the Graph class from graph.js.
+const {EdgeRestyler} = require('../app/edgeRestyler'); // Imports the EdgeRestyler class from edgeRestyler.js.
+const {buildGraph, buildDOTString} = require('../app/mddWorker'); // Imports the build functions from mddWorker.js.
+
+// Creates an empty graph with the given settings.
+function createGraph(settings) {
+    const graph = new Graph();
+    graph.applySettings(settings);
+    return graph;
+}
+
+// Creates an element of an edge group with the attributes Graphviz gives it.
+function createShapeElement(tagName, attributes) {
+    return {
+        tagName: tagName,
+        attributes: new Map(Object.entries(attributes)),
+        getAttribute(name) {
+            return this.attributes.has(name) ? this.attributes.get(name) : null;
+        },
+        setAttribute(name, value) {
+            this.attributes.set(name, value);
+        },
+        removeAttribute(name) {
+            this.attributes.delete(name);
+        },
+    };
+}
+
+describe('EdgeRestyler', () => {
+    // Test data from table 1.2 from thesis.
+    const domains = [2, 2, 3];
+    const truthVector = [0, 0, 0, 0, 1, 1, 0, 1, 1, 0, 2, 2];
+    const settings = {edgeStyles: ['dashed', 'solid', 'dotted'], edgeColors: ['red', 'black', 'blue']};
+    const newSettings = {edgeStyles: ['bold', 'dotted', 'solid'], edgeColors: ['gray', 'navy', 'red'], labelColorMatchesEdge: true};
+
+    it('should restyle the DOT string the same as building it with the new settings', () => {
+        const graph = buildGraph(domains, truthVector, settings);
+        const edgeRestyler = new EdgeRestyler(graph.getEdgeDecisions());
+
+        expect(edgeRestyler.decisionsCount).toBe(3);
+        expect(edgeRestyler.restyleDOTString(graph.toDOTString(), createGraph(newSettings)))
+            .toBe(buildDOTString(domains, truthVector, newSettings));
+    });
+
+    it('should not restyle a DOT string with different edges', () => {
+        const edgeRestyler = new EdgeRestyler(buildGraph(domains, truthVector, settings).getEdgeDecisions());
+
+        expect(edgeRestyler.restyleDOTString(buildDOTString([2, 2], [0, 1, 1, 0]), createGraph(newSettings))).toBeNull();
+    });
+
+    it('should allow only changes which do not change the layout', () => {
+        const edgeRestyler = new EdgeRestyler([0, 1, 2]);
+        const graph = createGraph(settings);
+
+        expect(edgeRestyler.canRestyle(graph, createGraph(newSettings))).toBe(true);
+        expect(edgeRestyler.canRestyle(graph, createGraph({edgeStyling: false, edgeColoring: false}))).toBe(true);
+        expect(edgeRestyler.canRestyle(graph, createGraph({font: 'Arial'}))).toBe(false);
+        expect(edgeRestyler.canRestyle(graph, createGraph({labelsEnabled: false}))).toBe(false);
+        expect(edgeRestyler.canRestyle(graph, createGraph({edgeStyles: ['invis']}))).toBe(false);
+        expect(edgeRestyler.canRestyle(graph, createGraph({edgeColors: ['#123456']}))).toBe(false);
+    });
+
+    it('should restyle every color offered in the edge color menus', () => {
+        const page = fs.readFileSync(path.join(__dirname, '../app/view/index.html'), 'utf8');
+        const colorMenu = page.match(/<select id="dynamicEdgeColor\$\{i\}">([\s\S]*?)<\/select>/)[1];
+        const colors = Array.from(colorMenu.matchAll(/<option value="(\w+)">/g), match => match[1]);
+        const edgeRestyler = new EdgeRestyler([0]);
+
+        expect(colors.length).toBe(14);
+        colors.forEach(color => {
+            expect(edgeRestyler.canRestyle(createGraph(settings), createGraph({edgeColors: [color]}))).toBe(true);
+        });
+    });
+
+    it('should update the edge shapes in the SVG the way Graphviz draws them', () => {
+        // Edge groups of edges with decisions 2 and 0, as Graphviz renders them with the default settings
+        const path = createShapeElement('path', {fill: 'none', stroke: '#0000ff', 'stroke-dasharray': '1,5'});
+        const arrowhead = createShapeElement('polygon', {fill: '#0000ff', stroke: '#0000ff'});
+        const label = createShapeElement('text', {'font-size': '14.00', fill: '#000000'});
+        const edgeElements = [
+            {getAttribute: () => 'edge1', children: [path, arrowhead, label]},
+            {getAttribute: () => 'edge2', children: [createShapeElement('path', {stroke: '#ff0000'})]},
+        ];
+        const svgElement = {querySelectorAll: (selector) => selector === 'g.edge' ? edgeElements : []};
+
+        const edgeRestyler = new EdgeRestyler([2, 0]);
+        edgeRestyler.restyleSVGElement(svgElement, createGraph({edgeStyles: [, , 'bold'], edgeColors: [, , 'purple'], labelColorMatchesEdge: true}));
+
+        expect(Object.fromEntries(path.attributes)).toEqual({fill: 'none', stroke: '#a020f0', 'stroke-width': '2'});
+        expect(Object.fromEntries(arrowhead.attributes)).toEqual({fill: '#a020f0', stroke: '#a020f0', 'stroke-width': '2'});
+        expect(Object.fromEntries(label.attributes)).toEqual({'font-size': '14.00', fill: '#a020f0'});
+        expect(edgeElements[1].children[0].getAttribute('stroke')).toBe('#ff0000');
+        expect(edgeElements[1].children[0].getAttribute('stroke-dasharray')).toBe('5,2');
+    });
+});
@@ -0,0 +1,160 @@
+const {InternalNode, TerminalNode} = require('../app/diagram'); // Imports the InternalNode and TerminalNode class from diagram.js.
+const {TruthTable} = require('../app/table'); // Imports the TruthTable class from table.js.
+const {Graph} = require('../app/graph'); // Imports the Graph class from graph.js.
+const {buildGraph, buildDOTString} = require('../app/mddWorker'); // Imports the buildGraph and buildDOTString functions from mddWorker.js.
+
+describe('Graph - traverseMDD', () => {
+    it('should add one vertex for each node and one edge for each decision.', () => {
+        // Test data from table 1.2 from thesis.
+        const tableOfTruth = new TruthTable([2, 2, 3], [0, 0, 0, 0, 1, 1, 0, 1, 1, 0, 2, 2]);
+        const mdd = tableOfTruth.fromVector();
+
+        const graph = new Graph();
+        const rootVertexId = graph.traverseMDD(mdd.getRoot());
+
+        expect(rootVertexId).toBe(0);
+        // Root, two nodes with index 1, two nodes with index 2 and three terminal nodes.
+        expect(graph.vertices.size).toBe(8);
+        expect(graph.edges.size).toBe(2 + 2 * 2 + 2 * 3);
+    });
+
+    it('should visit every shared node only once.', () => {
+        // Chain of nodes where both decisions lead to the same successor, which is 2^30 paths long.
+        const terminalNode0 = new TerminalNode(0);
+        const terminalNode1 = new TerminalNode(1);
+        let node = new InternalNode(30, [terminalNode0, terminalNode1]);
+        for (let index = 29; index >= 0; index--) {
+            node = new InternalNode(index, [node, node]);
+        }
+
+        const graph = new Graph();
+        const addVertexSpy = jest.spyOn(graph, 'addVertex');
+        graph.traverseMDD(node);
+
+        expect(graph.vertices.size).toBe(33);
+        expect(graph.edges.size).toBe(31 * 2);
+        expect(addVertexSpy).toHaveBeenCalledTimes(33);
+
+        addVertexSpy.mockRestore();
+    });
+
+    it('should traverse deep diagrams without overflowing the stack.', () => {
+        const terminalNode0 = new TerminalNode(0);
+        const terminalNode1 = new TerminalNode(1);
+        let node = new InternalNode(100000, [terminalNode0, terminalNode1]);
+        for (let index = 99999; index >= 0; index--) {
+            node = new InternalNode(index, [node, terminalNode1]);
+        }
+
+        const graph = new Graph();
+        graph.traverseMDD(node);
+
+        expect(graph.vertices.size).toBe(100003);
+        expect(graph.edges.size).toBe(100001 * 2);
+    });
+
+    it('should number vertices in depth-first order.', () => {
+        const terminalNode0 = new TerminalNode(0);
+        const terminalNode1 = new TerminalNode(1);
+        const internalNode2 = new InternalNode(2, [terminalNode0, terminalNode1]);
+        const internalNode1 = new InternalNode(1, [internalNode2, terminalNode1]);
+        const internalNode0 = new InternalNode(0, [internalNode1, internalNode2]);
+
+        const graph = new Graph();
+        graph.traverseMDD(internalNode0);
+
+        expect(graph.vertices.get(internalNode0).id).toBe(0);
+        expect(graph.vertices.get(internalNode1).id).toBe(1);
+        expect(graph.vertices.get(internalNode2).id).toBe(2);
+        expect(graph.vertices.get(terminalNode0).id).toBe(3);
+        expect(graph.vertices.get(terminalNode1).id).toBe(4);
+        expect([...graph.edges.keys()]).toEqual(['2-3-0', '2-4-1', '1-2-0', '1-4-1', '0-1-0', '0-2-1']);
+    });
+});
+
+describe('Graph - DOT generation', () => {
+    // Test data from table 1.2 from thesis.
+    const createGraph = () => {
+        const tableOfTruth = new TruthTable([2, 2, 3], [0, 0, 0, 0, 1, 1, 0, 1, 1, 0, 2, 2]);
+        const graph = new Graph();
+        graph.traverseMDD(tableOfTruth.fromVector().getRoot());
+        return graph;
+    };
+
+    it('should generate the DOT string with vertex and edge definitions.', () => {
+        const graph = createGraph();
+        graph.setEdgeStyling(true);
+        graph.setEdgeColoring(true);
+
+        const dotString = graph.toDOTString();
+
+        expect(dotString.startsWith('digraph DD {\n    graph [fontname = "Times-Roman", splines = true, overlap = false];\n')).toBe(true);
+        expect(dotString).toContain('    node [shape = square] 2 4 7;\n    node [shape = circle];\n');
+        expect(dotString).toContain('    0 [label = <x<sub><font point-size="10">0</font></sub>>];\n');
+        expect(dotString).toContain('    2 [label = "0"];\n');
+        expect(dotString).toContain('    0 -> 1 [style="dashed", color="red", label="0"];\n');
+        expect(dotString.endsWith('}')).toBe(true);
+    });
+
+    it('should generate chunks which join into the DOT string.', () => {
+        const graph = createGraph();
+        graph.setLabelColorMatchesEdge(true);
+
+        const chunks = Array.from(graph.toDOTChunks(100));
+
+        expect(chunks.length).toBeGreaterThan(1);
+        expect(chunks.join('')).toBe(graph.toDOTString());
+        for (let i = 0; i < chunks.length - 1; i++) {
+            expect(chunks[i].length).toBeGreaterThanOrEqual(100);
+        }
+    });
+
+    it('should build edge attributes only once for each decision.', () => {
+        const graph = createGraph();
+        const getEdgeAttributesSpy = jest.spyOn(graph, 'getEdgeAttributes');
+
+        graph.getEdgeDefinitions();
+
+        // Decisions 0, 1 and 2.
+        expect(getEdgeAttributesSpy).toHaveBeenCalledTimes(3);
+
+        getEdgeAttributesSpy.mockRestore();
+    });
+});
+
+describe('Graph - settings', () => {
+    it('should apply only the settings present in the object.', () => {
+        const graph = new Graph();
+        graph.applySettings({edgeColoring: false, font: 'Arial', edgeColors: ['green', 'navy']});
+
+        expect(graph.edgeColoring).toBe(false);
+        expect(graph.edgeStyling).toBe(true);
+        expect(graph.font).toBe('Arial');
+        expect(graph.edgeColors).toEqual(['green', 'navy', 'blue']);
+        expect(graph.edgeStyles).toEqual(['dashed', 'solid', 'dotted']);
+    });
+
+    it('should build the same DOT string in the worker function as with Graph directly.', () => {
+        const domains = [2, 2, 3];
+        const truthVector = [0, 0, 0, 0, 1, 1, 0, 1, 1, 0, 2, 2];
+        const settings = {edgeStyling: false, labelsEnabled: false, font: 'Courier New', edgeColors: ['teal']};
+
+        const graph = new Graph();
+        graph.traverseMDD(new TruthTable(domains, truthVector).fromVector().getRoot());
+        graph.applySettings(settings);
+
+        expect(buildDOTString(Int32Array.from(domains), Int32Array.from(truthVector), settings)).toBe(graph.toDOTString());
+    });
+
+    it('should update the last built diagram by the changes of the truth vector in the worker function.', () => {
+        const domains = Int32Array.from([2, 3, 2, 2]);
+        const truthVector = Int32Array.from({length: 24}, (_, i) => i % 3 === 0 ? 1 : 0);
+        buildGraph(domains, truthVector);
+
+        const changes = Int32Array.from([0, 2, 7, 1, 23, 2, 7, 0]);
+        for (let i = 0; i < changes.length; i += 2) {
+            truthVector[changes[i]] = changes[i + 1];
+        }
+        expect(buildGraph(domains, truthVector, {}, changes).toDOTString()).toBe(buildDOTString(domains, truthVector, {}));
+    });
+});
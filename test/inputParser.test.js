@@ -0,0 +1,48 @@
+const {parseNumberList} = require('../app/inputParser'); // Imports the parseNumberList function from inputParser.js.
+
+describe('parseNumberList', () => {
+    it('should parse numbers separated by commas, whitespace or both', () => {
+        const result = parseNumberList(' 0, 0,1 2\t3,\n4 ,5 ');
+
+        expect(result.values).toBeInstanceOf(Int32Array);
+        expect(Array.from(result.values)).toEqual([0, 0, 1, 2, 3, 4, 5]);
+        expect(result.count).toBe(7);
+        expect(result.errorPosition).toBe(-1);
+    });
+
+    it('should parse into the given array type', () => {
+        const result = parseNumberList('2, 2, 3', {minValue: 1, arrayType: Uint16Array});
+
+        expect(result.values).toBeInstanceOf(Uint16Array);
+        expect(Array.from(result.values)).toEqual([2, 2, 3]);
+    });
+
+    it('should report the position of the first invalid character or number', () => {
+        expect(parseNumberList('Hello World').errorPosition).toBe(0);
+        expect(parseNumberList('2, 2.2, 3').errorPosition).toBe(4);
+        expect(parseNumberList('2, -2, 3').errorPosition).toBe(3);
+        expect(parseNumberList('2, 0, 3', {minValue: 1}).errorPosition).toBe(3);
+        expect(parseNumberList('1, 70000', {arrayType: Uint16Array}).errorPosition).toBe(3);
+        expect(parseNumberList('1, 99999999999').errorPosition).toBe(3);
+        expect(parseNumberList('1,, 2').errorPosition).toBe(2);
+        expect(parseNumberList(', 1').errorPosition).toBe(0);
+        expect(parseNumberList('1, 2,').errorPosition).toBe(4);
+        expect(parseNumberList('12a').errorPosition).toBe(2);
+    });
+
+    it('should report an empty text as invalid', () => {
+        expect(parseNumberList('')).toEqual({values: null, count: 0, errorPosition: 0});
+        expect(parseNumberList('  ').values).toBeNull();
+    });
+
+    it('should report the number of values if it differs from the expected count', () => {
+        const tooShort = parseNumberList('0, 0, 0, 0, 1, 1, 0, 1, 1, 0, 2', {expectedCount: 12});
+        const tooLong = parseNumberList('0, 1, 2, 3, 4', {expectedCount: 3});
+        const exact = parseNumberList('0, 0, 0, 0, 1, 1, 0, 1, 1, 0, 2, 2', {expectedCount: 12});
+
+        expect(tooShort).toEqual({values: null, count: 11, errorPosition: -1});
+        expect(tooLong).toEqual({values: null, count: 5, errorPosition: -1});
+        expect(exact.values.length).toBe(12);
+        expect(exact.values.buffer.byteLength).toBe(12 * Int32Array.BYTES_PER_ELEMENT);
+    });
+});
@@ -0,0 +1,89 @@
+const {TruthTable} = require('../app/table'); // Imports the TruthTable class from table.js.
+const {Graph} = require('../app/graph'); // Imports the Graph class from graph.js.
+const {MDDConstructor} = require('../app/mddConstructor'); // Imports the MDDConstructor class from mddConstructor.js.
+const {parseExpression, bindVariable, getExpressionKey} = require('../app/expression'); // Imports the expression functions from expression.js.
+
+// Generates the DOT string of the MDD, equal diagrams have equal DOT strings.
+function toDOTString(mdd) {
+    const graph = new Graph();
+    graph.traverseMDD(mdd.getRoot());
+    return graph.toDOTString();
+}
+
+// Builds the MDD from the full truth vector of the function.
+function fromVector(domains, callback) {
+    const truthTable = new TruthTable(domains, []);
+    const truthVector = Array.from(truthTable.iterateRows(), callback);
+    return new TruthTable(domains, truthVector).fromVector();
+}
+
+describe('MDDConstructor', () => {
+    const domains = [3, 2, 4, 2];
+    const callback = row => row[0] === 2 ? row[1] : (Math.max(row[2], row[3]) + row[1]) % 3;
+
+    it('should build the same MDD from a callback as fromVector', () => {
+        const mdd = new MDDConstructor(domains).fromFunction(callback);
+
+        expect(toDOTString(mdd)).toBe(toDOTString(fromVector(domains, callback)));
+    });
+
+    it('should build the same MDD from an expression as fromVector', () => {
+        const mdd = new MDDConstructor(domains).fromExpression('x0 == 2 ? x1 : (max(x2, x3) + x1) % 3');
+
+        expect(toDOTString(mdd)).toBe(toDOTString(fromVector(domains, callback)));
+    });
+
+    it('should build the same MDD from sparse rows as fromVector', () => {
+        const rows = [];
+        for (const row of new TruthTable(domains, []).iterateRows()) {
+            if (callback(row) !== 1) {
+                rows.push([row, callback(row)]);
+            }
+        }
+        const mdd = new MDDConstructor(domains).fromSparseRows(rows, 1);
+
+        expect(toDOTString(mdd)).toBe(toDOTString(fromVector(domains, callback)));
+    });
+
+    it('should build a diagram of a function with many variables without enumerating the assignments', () => {
+        // Sum of 60 binary variables modulo 3, its truth vector would have 2^60 values.
+        const variables = Array.from({length: 60}, (_, i) => `x${i}`);
+        const mdd = new MDDConstructor(new Array(60).fill(2)).fromExpression(`(${variables.join(' + ')}) % 3`);
+
+        const assignment = Array.from({length: 60}, (_, i) => i % 2);
+        expect(mdd.evaluate(assignment).getResultValue()).toBe(30 % 3);
+        expect(mdd.getLevelSizes(60)).toEqual(new Array(60).fill(2));
+    });
+
+    it('should print an error message for invalid inputs', () => {
+        const mddConstructor = new MDDConstructor([2, 2]);
+        const consoleErrorSpy = jest.spyOn(console, 'error').mockImplementation();
+
+        expect(mddConstructor.fromExpression('x0 + x2')).toBeNull();
+        expect(consoleErrorSpy).toHaveBeenCalledWith('MDD cannot be built. Variable x2 does not exist, the function has 2 variables.');
+        expect(mddConstructor.fromExpression('x0 $ x1')).toBeNull();
+        expect(consoleErrorSpy).toHaveBeenCalledWith('MDD cannot be built. Unexpected character at position 3 of the expression.');
+        expect(mddConstructor.fromExpression('x1 / x0')).toBeNull();
+        expect(consoleErrorSpy).toHaveBeenCalledWith('MDD cannot be built. Division by zero in the expression.');
+        expect(mddConstructor.fromSparseRows([[[0, 2], 1]])).toBeNull();
+        expect(consoleErrorSpy).toHaveBeenCalledWith('MDD cannot be built. Invalid value 2 of variable x1 in row 0.');
+
+        consoleErrorSpy.mockRestore();
+    });
+});
+
+describe('Expression', () => {
+    it('should respect the precedence of operators', () => {
+        expect(getExpressionKey(parseExpression('x0 + x1 * x2 == 1 || !x0'))).toBe('(((x0)+((x1)*(x2)))==(1))||(!(x0))');
+        expect(getExpressionKey(parseExpression('x0 ? x1 : x2 ? 1 : 2'))).toBe('(x0)?(x1):((x2)?(1):(2))');
+        expect(getExpressionKey(parseExpression('x0 - x1 - x2'))).toBe('((x0)-(x1))-(x2)');
+    });
+
+    it('should simplify the expression when a variable is bound', () => {
+        const expression = parseExpression('x0 && x1 || x2 + 0');
+
+        expect(getExpressionKey(bindVariable(expression, 0, 0))).toBe('(0)||(x2)');
+        expect(getExpressionKey(bindVariable(bindVariable(expression, 0, 1), 1, 3))).toBe('1');
+        expect(bindVariable(expression, 3, 1)).toBe(expression);
+    });
+});
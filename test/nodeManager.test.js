@@ -0,0 +1,74 @@
+const {TruthTable} = require('../app/table'); // Imports the TruthTable class from table.js.
+const {NodeFactory} = require('../app/nodeFactory'); // Imports the NodeFactory class from nodeFactory.js.
+const {CompactNodeFactory} = require('../app/compactDiagram'); // Imports the CompactNodeFactory class from compactDiagram.js.
+const {NodeManager} = require('../app/nodeManager'); // Imports the NodeManager class from nodeManager.js.
+
+const domains = [2, 3, 2];
+const truthVectorA = [0, 1, 1, 2, 0, 0, 1, 1, 2, 2, 0, 1];
+const truthVectorB = [0, 1, 1, 2, 0, 0, 1, 2, 2, 2, 1, 1];
+
+// Evaluates the diagram for every row of the truth table.
+function evaluateAll(mdd) {
+    return Array.from(new TruthTable(domains, []).iterateRows(), row => mdd.evaluate(row).getResultValue());
+}
+
+describe('NodeManager', () => {
+    [['NodeFactory', () => new NodeFactory()], ['CompactNodeFactory', () => new CompactNodeFactory()]].forEach(([name, createFactory]) => {
+        it(`should keep only nodes of retained diagrams after garbage collection (${name})`, () => {
+            const nodeManager = new NodeManager(createFactory());
+            const nodeFactory = nodeManager.getNodeFactory();
+
+            const mddA = new TruthTable(domains, truthVectorA).fromVector(nodeFactory);
+            const nodeCountA = nodeFactory.getNodeCount();
+            const handleA = nodeManager.retain(nodeFactory.getDiagramRoot(mddA));
+            const handleB = nodeManager.retain(nodeFactory.getDiagramRoot(new TruthTable(domains, truthVectorB).fromVector(nodeFactory)));
+
+            nodeManager.release(handleA);
+            expect(nodeManager.collectGarbage()).toBeGreaterThan(0);
+
+            // The retained diagram is unchanged and rebuilding it reuses its nodes
+            const nodeCountB = nodeFactory.getNodeCount();
+            expect(evaluateAll(nodeFactory.createDiagram(handleB.root))).toEqual(truthVectorB);
+            const mddB = new TruthTable(domains, truthVectorB).fromVector(nodeFactory);
+            expect(nodeFactory.getDiagramRoot(mddB)).toBe(handleB.root);
+            expect(nodeFactory.getNodeCount()).toBe(nodeCountB);
+
+            // Released diagram is built again from the kept nodes and new ones
+            expect(evaluateAll(new TruthTable(domains, truthVectorA).fromVector(nodeFactory))).toEqual(truthVectorA);
+            expect(nodeFactory.getNodeCount()).toBeLessThan(nodeCountA + nodeCountB);
+        });
+    });
+
+    it('should collect garbage only over the limit', () => {
+        const nodeManager = new NodeManager(new CompactNodeFactory(), 4);
+        const nodeFactory = nodeManager.getNodeFactory();
+
+        new TruthTable(domains, truthVectorA).fromVector(nodeFactory);
+        const nodeCount = nodeFactory.getNodeCount();
+        expect(nodeCount).toBeGreaterThan(4);
+
+        nodeManager.retain(nodeFactory.getDiagramRoot(new TruthTable(domains, [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0]).fromVector(nodeFactory)));
+        expect(nodeFactory.getNodeCount()).toBeGreaterThan(nodeCount);
+        expect(nodeManager.enforceLimit()).toBeGreaterThan(0);
+        expect(nodeFactory.getNodeCount()).toBe(3); // Only the retained diagram is left, so the limit is kept
+        expect(nodeManager.enforceLimit()).toBe(0);
+    });
+
+    it('should share one handle for a root retained several times, also after garbage collection', () => {
+        const nodeManager = new NodeManager(new CompactNodeFactory());
+        const nodeFactory = nodeManager.getNodeFactory();
+
+        new TruthTable(domains, truthVectorA).fromVector(nodeFactory);
+        const root = nodeFactory.getDiagramRoot(new TruthTable(domains, truthVectorB).fromVector(nodeFactory));
+        const handle = nodeManager.retain(root);
+        expect(nodeManager.retain(root)).toBe(handle);
+
+        expect(nodeManager.collectGarbage()).toBeGreaterThan(0);
+        expect(handle.root).not.toBe(root);
+        expect(nodeManager.retain(handle.root)).toBe(handle);
+
+        // Released as many times as retained, the root gets a new handle
+        [1, 2, 3].forEach(() => nodeManager.release(handle));
+        expect(nodeManager.retain(handle.root)).not.toBe(handle);
+    });
+});
@@ -0,0 +1,70 @@
+const path = require('path');
+const {Worker} = require('worker_threads');
+const {TruthTable} = require('../app/table'); // Imports the TruthTable class from table.js.
+const {Graph} = require('../app/graph'); // Imports the Graph class from graph.js.
+const {NodeFactory} = require('../app/nodeFactory'); // Imports the NodeFactory class from nodeFactory.js.
+const {CompactMDD} = require('../app/compactDiagram'); // Imports the CompactMDD class from compactDiagram.js.
+const {ParallelMDDBuilder} = require('../app/parallelBuilder'); // Imports the ParallelMDDBuilder class from parallelBuilder.js.
+
+// Generates the DOT string of the diagram, equal diagrams have equal DOT strings.
+function toDOTString(mdd) {
+    const graph = new Graph();
+    graph.traverseMDD(mdd instanceof CompactMDD ? mdd : mdd.getRoot());
+    return graph.toDOTString();
+}
+
+describe('ParallelMDDBuilder', () => {
+    let workers;
+
+    beforeAll(() => {
+        workers = Array.from({length: 3}, () => new Worker(path.join(__dirname, '../app/partWorker.js')));
+    });
+
+    afterAll(async () => {
+        await Promise.all(workers.map(worker => worker.terminate()));
+    });
+
+    it('should build the same diagram as fromVector', async () => {
+        const domains = [2, 3, 2, 4, 3];
+        const truthVector = Int32Array.from({length: 144}, (_, i) => (i % 7 === 0 ? 2 : 0) + ((i >> 4) & 1));
+        const builder = new ParallelMDDBuilder(workers);
+
+        const compactMDD = await builder.build(domains, truthVector);
+        const mdd = await builder.build(domains, Array.from(truthVector), new NodeFactory());
+
+        const expected = toDOTString(new TruthTable(domains, truthVector).fromVector());
+        expect(toDOTString(compactMDD)).toBe(expected);
+        expect(toDOTString(mdd)).toBe(expected);
+    });
+
+    it('should merge equal parts into one subdiagram', async () => {
+        // The function does not depend on the split variables, so all parts are the same
+        const domains = [3, 3, 2];
+        const truthVector = Int32Array.from({length: 18}, (_, i) => i % 2);
+        const mdd = await new ParallelMDDBuilder(workers).build(domains, truthVector, new NodeFactory());
+
+        expect(mdd.getRoot().getIndex()).toBe(2);
+        expect(mdd.evaluate([2, 1, 1]).getResultValue()).toBe(1);
+    });
+
+    it('should keep the last variable in the parts when the split could use every variable', async () => {
+        // Three workers would get two parts each from all assignments of both variables
+        const builder = new ParallelMDDBuilder(workers);
+        const domains = [2, 3];
+        const truthVector = [0, 1, 2, 0, 1, 1];
+        expect(toDOTString(await builder.build(domains, truthVector))).toBe(toDOTString(new TruthTable(domains, truthVector).fromVector()));
+
+        const mdd = await builder.build([8], [0, 1, 2, 3, 4, 5, 6, 7]);
+        expect(mdd.getNodeCount()).toBe(1);
+        expect(mdd.evaluate([6]).getResultValue()).toBe(6);
+    });
+
+    it('should print an error message for a truth vector of a wrong length', async () => {
+        const consoleErrorSpy = jest.spyOn(console, 'error').mockImplementation();
+
+        expect(await new ParallelMDDBuilder(workers).build([2, 2], [0, 1, 1])).toBeNull();
+        expect(consoleErrorSpy).toHaveBeenCalledWith('MDD cannot be built. The number of truth vector values (3) does not match the product of the domains (4).');
+
+        consoleErrorSpy.mockRestore();
+    });
+});
@@ -1,4 +1,4 @@
-from graph_utils import GraphUtils
+from graph_utils import acquire_graph_utils, release_graph_utils
 from enums import *
 import os
 import unittest
@@ -9,8 +9,8 @@ class ConfigurationTest(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.gu = GraphUtils()
-        cls.downloaded_image_path_png = os.path.join(os.path.expanduser('~'), 'Downloads', 'Decision_Diagram.png')
+        cls.gu = acquire_graph_utils()
+        cls.downloaded_image_path_png = cls.gu.get_download_path('Decision_Diagram.png')
         cls.expected_image_path = os.path.join('expected_graph_diagrams')
 
     def setUp(self):
@@ -20,7 +20,7 @@ class ConfigurationTest(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.gu.teardown()
+        release_graph_utils(cls.gu)
 
     def test_correct_number_of_styling_selectors(self):
         # Stimulation
@@ -1,4 +1,10 @@
 import os
+import atexit
+import functools
+import shutil
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -8,8 +14,10 @@ from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.options import Options
 import time
+import base64
 import hashlib
-import difflib
+import re
+import xml.etree.ElementTree as ET
 from skimage.metrics import structural_similarity as ssim
 import numpy as np
 from PIL import Image
@@ -20,8 +28,286 @@ def set_input(input_box, value):
     input_box.clear()
     input_box.send_keys(value)
 
+
+# The tests run against the working tree served by a local HTTP server. Set MDD_VISUALIZER_URL to test
+# another site instead, e.g. the deployed one at https://mddvisualizer.z36.web.core.windows.net
+REPOSITORY_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+LOCAL_PAGE_PATH = "/app/view/index.html"
+
+_local_server = None
+
+
+class QuietRequestHandler(SimpleHTTPRequestHandler):
+    # Module scripts and workers are only loaded with a JavaScript MIME type, which the system may not know
+    extensions_map = {
+        **SimpleHTTPRequestHandler.extensions_map,
+        '.js': 'text/javascript',
+        '.mjs': 'text/javascript',
+        '.svg': 'image/svg+xml',
+    }
+
+    def log_message(self, format, *args):
+        pass
+
+
+# Start the server of the repository on a free port, it is shared by all tests of the process
+def start_local_server():
+    global _local_server
+    if _local_server is None:
+        handler = functools.partial(QuietRequestHandler, directory=REPOSITORY_ROOT)
+        _local_server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        _local_server.daemon_threads = True
+        threading.Thread(target=_local_server.serve_forever, daemon=True).start()
+        atexit.register(_local_server.shutdown)
+    host, port = _local_server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def get_application_url():
+    url = os.getenv('MDD_VISUALIZER_URL')
+    if url:
+        return url
+    return start_local_server() + LOCAL_PAGE_PATH
+
+
+# Install ChromeDriver once, the path is passed to the processes of run_parallel_tests.py in the environment
+def get_chromedriver_path():
+    if not os.getenv('MDD_CHROMEDRIVER_PATH'):
+        os.environ['MDD_CHROMEDRIVER_PATH'] = ChromeDriverManager().install()
+    return os.environ['MDD_CHROMEDRIVER_PATH']
+
+
+# Browsers are kept open between test classes and shared through this pool (one pool in each process).
+# Set MDD_TESTS_HEADLESS=true to run them headless, run_parallel_tests.py does that.
+_idle_graph_utils = []
+_all_graph_utils = []
+
+
+# Get a browser with a freshly reset application, a new one is opened only if all are in use
+def acquire_graph_utils():
+    if _idle_graph_utils:
+        gu = _idle_graph_utils.pop()
+        gu.reset_application()
+        return gu
+    if not _all_graph_utils:
+        atexit.register(close_browsers)
+    gu = GraphUtils()
+    _all_graph_utils.append(gu)
+    return gu
+
+
+def release_graph_utils(gu):
+    _idle_graph_utils.append(gu)
+
+
+def close_browsers():
+    while _all_graph_utils:
+        _all_graph_utils.pop().teardown()
+    _idle_graph_utils.clear()
+
+
+# Installed into every page loaded by the browser. Exports are downloaded by clicking a link to a Blob URL,
+# the clicks on these links are captured and the Blobs are kept in the page by their file names instead.
+EXPORT_CAPTURE_SCRIPT = """
+(() => {
+    const blobs = new Map();
+    const createObjectURL = URL.createObjectURL;
+    const revokeObjectURL = URL.revokeObjectURL;
+    URL.createObjectURL = function (object) {
+        const url = createObjectURL.call(URL, object);
+        if (object instanceof Blob) {
+            blobs.set(url, object);
+        }
+        return url;
+    };
+    URL.revokeObjectURL = function (url) {
+        blobs.delete(url);
+        revokeObjectURL.call(URL, url);
+    };
+
+    const click = HTMLAnchorElement.prototype.click;
+    HTMLAnchorElement.prototype.click = function () {
+        const blob = this.download ? blobs.get(this.href) : undefined;
+        if (blob === undefined) {
+            return click.call(this);
+        }
+        window.capturedExports[this.download] = blob;
+        window.dispatchEvent(new CustomEvent("exportcaptured"));
+    };
+    window.capturedExports = {};
+})();
+"""
+
+# Waits for the export with the given file name and returns its contents as base64, or null after the timeout.
+# The export is removed from the page, so it is never mistaken for a later export of the same name.
+TAKE_EXPORT_SCRIPT = """
+const [fileName, timeout, done] = arguments;
+function take() {
+    const blob = window.capturedExports[fileName];
+    if (blob === undefined) {
+        return false;
+    }
+    delete window.capturedExports[fileName];
+    const reader = new FileReader();
+    reader.onload = () => done(reader.result.substring(reader.result.indexOf(",") + 1));
+    reader.readAsDataURL(blob);
+    return true;
+}
+function onCaptured() {
+    if (take()) {
+        window.removeEventListener("exportcaptured", onCaptured);
+        clearTimeout(timeoutId);
+    }
+}
+const timeoutId = setTimeout(() => {
+    window.removeEventListener("exportcaptured", onCaptured);
+    done(null);
+}, timeout);
+if (take()) {
+    clearTimeout(timeoutId);
+} else {
+    window.addEventListener("exportcaptured", onCaptured);
+}
+"""
+
+
+# --SVG comparison--
+# Graphviz SVGs are compared by their structure: the nodes by their titles, the edges by their end nodes and labels,
+# and the bounding box of the graph. Coordinates may differ by a tolerance, everything else must be equal.
+SVG_NAMESPACE = {'svg': 'http://www.w3.org/2000/svg'}
+NUMBER_PATTERN = re.compile(r'-?\d*\.?\d+(?:[eE][-+]?\d+)?')
+# Graphviz draws the edge styles with these attributes
+SVG_DASH_STYLES = {'5,2': 'dashed', '1,5': 'dotted'}
+
+
+def parse_numbers(text):
+    return tuple(float(number) for number in NUMBER_PATTERN.findall(text or ''))
+
+
+def get_svg_shape(group):
+    for shape in group:
+        tag = shape.tag.rsplit('}', 1)[-1]
+        if tag in ('ellipse', 'polygon', 'path', 'polyline'):
+            return tag, shape
+    return None, None
+
+
+def get_svg_text(group):
+    return ''.join(text.text or '' for text in group.findall('svg:text', SVG_NAMESPACE))
+
+
+def get_edge_style(shape):
+    if shape.get('stroke-dasharray') is not None:
+        return SVG_DASH_STYLES.get(shape.get('stroke-dasharray'), shape.get('stroke-dasharray'))
+    if shape.get('stroke-width') == '2':
+        return 'bold'
+    return 'solid'
+
+
+# Extracts the bounding box, nodes and edges of the Graphviz SVG
+def extract_svg_structure(svg_path):
+    root = ET.parse(svg_path).getroot()
+    structure = {'bounding_box': parse_numbers(root.get('viewBox')), 'nodes': {}, 'edges': {}}
+    edge_counts = {}
+
+    for group in root.iter('{http://www.w3.org/2000/svg}g'):
+        title = group.findtext('svg:title', default='', namespaces=SVG_NAMESPACE)
+        tag, shape = get_svg_shape(group)
+        first_text = group.find('svg:text', SVG_NAMESPACE)
+        label_position = (float(first_text.get('x')), float(first_text.get('y'))) if first_text is not None else ()
+
+        if group.get('class') == 'node':
+            if tag == 'ellipse':
+                center = (float(shape.get('cx')), float(shape.get('cy')))
+            else:
+                points = parse_numbers(shape.get('points') or shape.get('d')) if shape is not None else ()
+                xs, ys = points[0::2], points[1::2]
+                center = ((min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2) if points else ()
+            structure['nodes'][title] = {
+                'shape': tag,
+                'label': get_svg_text(group),
+                'color': shape.get('stroke') if shape is not None else None,
+                'position': center,
+                'label position': label_position,
+            }
+        elif group.get('class') == 'edge':
+            tail, _, head = title.partition('->')
+            path = group.find('svg:path', SVG_NAMESPACE)
+            points = parse_numbers(path.get('d')) if path is not None else ()
+            # Edges between the same nodes differ by their labels, equal ones are numbered in their order
+            key = (tail, head, get_svg_text(group))
+            edge_counts[key] = edge_counts.get(key, 0) + 1
+            structure['edges'][key if edge_counts[key] == 1 else key + (edge_counts[key] - 1,)] = {
+                'style': get_edge_style(path) if path is not None else 'invis',
+                'color': path.get('stroke') if path is not None else None,
+                'start': points[:2],
+                'end': points[-2:],
+                'label position': label_position,
+            }
+    return structure
+
+
+def positions_differ(position1, position2, tolerance):
+    return len(position1) != len(position2) or any(abs(a - b) > tolerance for a, b in zip(position1, position2))
+
+
+def format_edge(key):
+    return f"{key[0]}->{key[1]}" + (f" [{key[2]}]" if key[2] else '') + (f" #{key[3]}" if len(key) > 3 else '')
+
+
+# Compares two extracted structures, returns the list of their differences (empty if they are equal)
+def compare_svg_structures(actual, expected, tolerance=0.5):
+    differences = []
+    if positions_differ(actual['bounding_box'], expected['bounding_box'], tolerance):
+        differences.append(f"Bounding box differs: {actual['bounding_box']} != {expected['bounding_box']}")
+
+    for kind, format_key in (('nodes', str), ('edges', format_edge)):
+        name = kind[:-1].capitalize()
+        for key in expected[kind].keys() - actual[kind].keys():
+            differences.append(f"{name} {format_key(key)} is missing")
+        for key in actual[kind].keys() - expected[kind].keys():
+            differences.append(f"{name} {format_key(key)} is not expected")
+        for key in actual[kind].keys() & expected[kind].keys():
+            for attribute, expected_value in expected[kind][key].items():
+                actual_value = actual[kind][key][attribute]
+                is_coordinate = isinstance(expected_value, tuple)
+                if positions_differ(actual_value, expected_value, tolerance) if is_coordinate else actual_value != expected_value:
+                    differences.append(f"{name} {format_key(key)} {attribute} differs: {actual_value} != {expected_value}")
+    return sorted(differences)
+
+
+# --Image comparison--
+# Exported PNGs are rendered at 10 times the size of the graph, so the images are compared on copies downscaled
+# to this size of the longer side. Reference images are decoded and downscaled once in a session.
+IMAGE_COMPARISON_SIZE = 1024
+# Images whose perceptual hashes differ in more bits than this are different without comparing them by SSIM
+MAX_HASH_DISTANCE = 12
+
+_reference_images = {}
+
+
+# Decodes the image to grayscale, downscales it and computes its difference hash
+def load_comparison_image(image_path):
+    image = Image.open(image_path).convert('L')
+    scale = IMAGE_COMPARISON_SIZE / max(image.size)
+    if scale < 1:
+        image = image.resize((max(1, round(image.width * scale)), max(1, round(image.height * scale))), Image.BOX)
+
+    # Difference hash: whether each cell of a 9x8 thumbnail is brighter than its left neighbour
+    thumbnail = np.asarray(image.resize((9, 8), Image.BOX), dtype=np.int16)
+    return {'pixels': np.asarray(image), 'hash': thumbnail[:, 1:] > thumbnail[:, :-1]}
+
+
+# Reference images are cached until their file changes
+def get_reference_image(image_path):
+    key = (os.path.abspath(image_path), os.path.getmtime(image_path))
+    if key not in _reference_images:
+        _reference_images[key] = load_comparison_image(image_path)
+    return _reference_images[key]
+
+
 class GraphUtils:
-    def __init__(self):
+    def __init__(self, headless=None):
         self.editor = None
         self.toggle_editor_button = None
         self.font_selector = None
@@ -40,6 +326,12 @@ class GraphUtils:
         self.truth_vector_input = None
         self.domain_input = None
         self.driver = None
+        self.application_url = get_application_url()
+        # Every browser downloads into its own directory, so browsers running in parallel do not overwrite the exports
+        self.download_directory = tempfile.mkdtemp(prefix='mdd-downloads-')
+        if headless is None:
+            headless = os.getenv('MDD_TESTS_HEADLESS', 'false').lower() == 'true'
+        self.headless = headless
 
         self._setup_browser()
         self.gather_elements()
@@ -47,30 +339,46 @@ class GraphUtils:
     def _setup_browser(self):
         is_github_runner = os.getenv('CI', 'false').lower() == 'true'
 
+        chrome_options = Options()
+        chrome_options.add_experimental_option("prefs", {
+            "download.default_directory": self.download_directory,
+            "download.prompt_for_download": False,
+        })
+        if is_github_runner or self.headless:
+            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--window-size=1920,1080")
+
         if is_github_runner:
-            chrome_options = Options()
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--remote-debugging-port=9222")
+            chrome_options.add_argument("--remote-debugging-port=0")  # A free port, more browsers may run at once
             os.environ['PATH'] += r":/usr/bin"  # Path for ChromeDriver on Linux
             self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
+                service=Service(get_chromedriver_path()),
                 options=chrome_options
             )
         else:
             os.environ['PATH'] += r"C:/Program Files/SeleniumDrivers/chrome-win64"
-            self.driver = webdriver.Chrome()
-            self.driver.maximize_window()
+            self.driver = webdriver.Chrome(options=chrome_options)
+            if not self.headless:
+                self.driver.maximize_window()
 
-        self.driver.get("https://mddvisualizer.z36.web.core.windows.net")
+        self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': EXPORT_CAPTURE_SCRIPT})
+        self.driver.get(self.application_url)
         self.driver.implicitly_wait(1)
         self.gather_elements()
 
-    # Reset app without closing and opening the browser
+    # Reset app without closing and opening the browser. The page resets itself by its resetApplication hook,
+    # it is loaded again only if it has no hook (e.g. an older deployed version).
     def reset_application(self):
-        self.driver.get("https://mddvisualizer.z36.web.core.windows.net")
-        self.gather_elements()
+        has_reset_hook = self.driver.execute_script(
+            "window.capturedExports = {};"
+            "if (typeof window.resetApplication !== 'function') { return false; }"
+            "window.resetApplication(); return true;"
+        )
+        if not has_reset_hook:
+            self.driver.get(self.application_url)
+            self.gather_elements()
 
     # Part of the initialisation process. Gather all relevant elements needed for the tests.
     def gather_elements(self):
@@ -102,6 +410,11 @@ class GraphUtils:
 
     def teardown(self):
         self.driver.quit()
+        shutil.rmtree(self.download_directory, ignore_errors=True)
+
+    # Path of an exported file in the download directory of this browser
+    def get_download_path(self, file_name):
+        return os.path.join(self.download_directory, file_name)
 
 
     ##############################################################################################################
@@ -150,13 +463,17 @@ class GraphUtils:
 
     # Render image and wait for it to complete
     def render(self, check_working=True):
+        preview = self.get_preview_element()
         self.render_button.click()
 
         if not check_working:
             return
 
+        # Cached renders finish immediately, so the "working" class may never be seen. In that case
+        # the graph replaced in the preview shows the render has finished.
         WebDriverWait(self.driver, 10).until(
             lambda d: "working" in d.find_element(By.ID, "viewCanvas").get_attribute("class")
+                      or self.get_preview_element() != preview
         )
 
         # Wait for viewCanvas to lose "Working" class (rendering completes)
@@ -164,6 +481,11 @@ class GraphUtils:
             lambda d: "working" not in d.find_element(By.ID, "viewCanvas").get_attribute("class")
         )
 
+    # Element holding the rendered graph in the preview, every finished render replaces it
+    def get_preview_element(self):
+        elements = self.driver.find_elements(By.CSS_SELECTOR, "#viewCanvas > a")
+        return elements[0] if elements else None
+
     ##############################################################################################################
     # Styling and coloring methods
     ##############################################################################################################
@@ -335,50 +657,53 @@ class GraphUtils:
         if os.path.exists(image_path):
             os.remove(image_path)
 
-    # Wait for the image to download
-    @staticmethod
-    def wait_for_image(image_path, timeout=10):
-        start_time = time.time()
-        while not os.path.exists(image_path):
-            if time.time() - start_time > timeout:
-                raise Exception("Timeout waiting for the image to download")
-            time.sleep(1)
-
+    # Wait for the export captured in the page and return its contents, the page notifies about it by an event
+    def get_export(self, file_name, timeout=10):
+        self.driver.set_script_timeout(timeout + 5)
+        contents = self.driver.execute_async_script(TAKE_EXPORT_SCRIPT, file_name, timeout * 1000)
+        if contents is None:
+            raise Exception("Timeout waiting for the image to download")
+        return base64.b64decode(contents)
+
+    # Wait for the exported image and write it to the image path
+    def wait_for_image(self, image_path, timeout=10):
+        contents = self.get_export(os.path.basename(image_path), timeout)
+        with open(image_path, 'wb') as file:
+            file.write(contents)
+
+    # Compare the images by SSIM of their downscaled grayscale copies, obviously different images are rejected
+    # by their perceptual hashes first
     @staticmethod
     def images_are_identical(downloaded_image_path, expected_image_path, threshold=0.99):
-        # Convert images to grayscale for SSIM comparison
-        img1 = np.array(Image.open(downloaded_image_path).convert('L'))
-        img2 = np.array(Image.open(expected_image_path).convert('L'))
+        downloaded = load_comparison_image(downloaded_image_path)
+        expected = get_reference_image(expected_image_path)
+
+        hash_distance = np.count_nonzero(downloaded['hash'] != expected['hash'])
+        if hash_distance > MAX_HASH_DISTANCE:
+            print(f"Perceptual hash distance: {hash_distance}")
+            return False
+
+        img1 = downloaded['pixels']
+        img2 = expected['pixels']
 
         # Resize if needed
         if img1.shape != img2.shape:
-            img2 = np.array(Image.open(expected_image_path).convert('L').resize(img1.shape[::-1]))
+            img2 = np.asarray(Image.fromarray(img2).resize(img1.shape[::-1], Image.BOX))
 
-        score, _ = ssim(img1, img2, full=True)
+        score = 1.0 if np.array_equal(img1, img2) else ssim(img1, img2, data_range=255)
         print(f"SSIM similarity: {score:.10f}")
 
         return score >= threshold
 
-        return similarity >= threshold
-
+    # Compare the nodes, edges and bounding boxes of the SVGs, coordinates may differ by the tolerance
     @staticmethod
-    def svg_files_are_identical(downloaded_svg_path, expected_svg_path, threshold=0.9999):
-
-        # Read files as text
-        with open(downloaded_svg_path, 'r', encoding='utf-8') as file1:
-            downloaded_content = file1.readlines()
-
-        with open(expected_svg_path, 'r', encoding='utf-8') as file2:
-            expected_content = file2.readlines()
-
-        # Calculate similarity
-        similarity = difflib.SequenceMatcher(None,
-                                             ''.join(downloaded_content),
-                                             ''.join(expected_content)).ratio()
-
-        print(f"SVG similarity: {similarity:.10f}")
+    def svg_files_are_identical(downloaded_svg_path, expected_svg_path, tolerance=0.5):
+        differences = compare_svg_structures(extract_svg_structure(downloaded_svg_path),
+                                             extract_svg_structure(expected_svg_path), tolerance)
+        for difference in differences:
+            print(f"SVG difference: {difference}")
 
-        return similarity >= threshold
+        return not differences
 
     @staticmethod
     def safe_clear_input(input_box):
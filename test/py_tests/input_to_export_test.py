@@ -1,5 +1,5 @@
 import os
-from graph_utils import GraphUtils
+from graph_utils import acquire_graph_utils, release_graph_utils
 from enums import *
 import unittest
 
@@ -12,11 +12,10 @@ class InputToExport(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.gu = GraphUtils()
-        downloaded_image_path = os.path.join(os.path.expanduser('~'), 'Downloads')
+        cls.gu = acquire_graph_utils()
         expected_image_path = os.path.join('expected_graph_diagrams')
-        cls.downloaded_image_path_png = os.path.join(downloaded_image_path, 'Decision_Diagram.png')
-        cls.downloaded_image_path_svg = os.path.join(downloaded_image_path, 'Decision_Diagram.svg')
+        cls.downloaded_image_path_png = cls.gu.get_download_path('Decision_Diagram.png')
+        cls.downloaded_image_path_svg = cls.gu.get_download_path('Decision_Diagram.svg')
         cls.expected_image_path_png = os.path.join(expected_image_path, 'expected_input_to_export.png')
         cls.expected_image_path_svg = os.path.join(expected_image_path, 'expected_input_to_export.svg')
 
@@ -27,7 +26,7 @@ class InputToExport(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.gu.teardown()
+        release_graph_utils(cls.gu)
 
     def test_input_to_export_png_positive(self):
         # Stimulation
@@ -0,0 +1,109 @@
+import argparse
+import io
+import math
+import multiprocessing
+import multiprocessing.util
+import os
+import sys
+import time
+import unittest
+
+import graph_utils
+
+# Runs all tests like run_all_tests.py, but the test cases are split into shards run by a pool of processes.
+# Every process keeps its own headless browser open for all shards it runs (see acquire_graph_utils),
+# and the application is reset by its in-page hook between test cases.
+#
+# Usage: python run_parallel_tests.py [--workers <count>] [--headed]
+
+
+def get_test_ids(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from get_test_ids(test)
+        else:
+            yield test.id()
+
+
+# Test cases of one class stay together in shards, so its setUpClass runs once for each shard
+def split_into_shards(test_ids, workers):
+    classes = {}
+    for test_id in test_ids:
+        classes.setdefault(test_id.rsplit('.', 1)[0], []).append(test_id)
+
+    # Several shards for every process, so the processes finish at about the same time
+    shard_size = max(1, math.ceil(len(test_ids) / (workers * 4)))
+    shards = []
+    for class_test_ids in classes.values():
+        for start in range(0, len(class_test_ids), shard_size):
+            shards.append(class_test_ids[start:start + shard_size])
+    return shards
+
+
+def init_worker():
+    # Pool processes do not run atexit handlers, but they run multiprocessing finalizers when the pool is closed
+    multiprocessing.util.Finalize(None, graph_utils.close_browsers, exitpriority=10)
+
+
+# Runs the shard in a pool process and returns its results, test cases and tracebacks cannot be sent back
+def run_shard(test_ids):
+    suite = unittest.defaultTestLoader.loadTestsFromNames(test_ids)
+    stream = io.StringIO()
+    result = unittest.TextTestRunner(stream=stream, buffer=True).run(suite)
+    return {
+        'tests_run': result.testsRun,
+        'failures': [(str(test), traceback) for test, traceback in result.failures],
+        'errors': [(str(test), traceback) for test, traceback in result.errors],
+        'skipped': len(result.skipped),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the GUI tests in parallel.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='number of browsers (default: CPU count)')
+    parser.add_argument('--headed', action='store_true', help='show the browsers')
+    args = parser.parse_args()
+
+    # All processes test the application served by this process (or the site given by MDD_VISUALIZER_URL)
+    os.environ['MDD_VISUALIZER_URL'] = graph_utils.get_application_url()
+    if not args.headed:
+        os.environ['MDD_TESTS_HEADLESS'] = 'true'
+    if os.getenv('CI', 'false').lower() == 'true':
+        graph_utils.get_chromedriver_path()
+
+    test_ids = list(get_test_ids(unittest.defaultTestLoader.discover('.', pattern='*_test.py')))
+    shards = split_into_shards(test_ids, args.workers)
+
+    start_time = time.time()
+    tests_run, failures, errors, skipped = 0, [], [], 0
+    pool = multiprocessing.Pool(min(args.workers, len(shards)) or 1, initializer=init_worker)
+    try:
+        for result in pool.imap_unordered(run_shard, shards):
+            tests_run += result['tests_run']
+            failures += result['failures']
+            errors += result['errors']
+            skipped += result['skipped']
+            for _ in range(result['tests_run']):
+                sys.stderr.write('.')
+            sys.stderr.flush()
+    finally:
+        pool.close()
+        pool.join()
+
+    sys.stderr.write('\n')
+    for kind, problems in (('ERROR', errors), ('FAIL', failures)):
+        for test, traceback in problems:
+            sys.stderr.write('=' * 70 + f'\n{kind}: {test}\n' + '-' * 70 + f'\n{traceback}\n')
+    sys.stderr.write('-' * 70 + f'\nRan {tests_run} tests in {time.time() - start_time:.3f}s\n\n')
+
+    details = [f'{name}={count}' for name, count in
+               (('failures', len(failures)), ('errors', len(errors)), ('skipped', skipped)) if count]
+    if failures or errors:
+        sys.stderr.write(f"FAILED ({', '.join(details)})\n")
+        return 1
+    sys.stderr.write(f"OK ({', '.join(details)})\n" if details else 'OK\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
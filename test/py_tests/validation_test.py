@@ -1,11 +1,11 @@
-from graph_utils import GraphUtils
+from graph_utils import acquire_graph_utils, release_graph_utils
 import unittest
 
 class ValidationTest(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.gu = GraphUtils()
+        cls.gu = acquire_graph_utils()
 
     def assert_no_error(self):
         # Verification of the red border style
@@ -49,7 +49,7 @@ class ValidationTest(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.gu.teardown()
+        release_graph_utils(cls.gu)
 
     ##############################################################################################################
     # Test Cases
@@ -0,0 +1,110 @@
+const {RenderCache, RenderWorker} = require('../app/view/renderWorker'); // Imports the RenderCache and RenderWorker class from renderWorker.js.
+
+const svgOptions = {engine: 'dot', format: 'svg'};
+
+// Records the messages instead of running Graphviz, replies are sent by reply.
+class FakeWorker {
+    constructor(url) {
+        this.url = url;
+        this.messages = [];
+        this.terminated = false;
+        this.listeners = {};
+        FakeWorker.instances.push(this);
+    }
+
+    addEventListener(type, listener) {
+        this.listeners[type] = listener;
+    }
+
+    postMessage(message) {
+        this.messages.push(message);
+    }
+
+    terminate() {
+        this.terminated = true;
+    }
+
+    reply(data) {
+        this.listeners.message({data: data});
+    }
+}
+
+describe('RenderCache', () => {
+    it('should return the stored result only for the same DOT string and options', () => {
+        const cache = new RenderCache();
+        cache.set('digraph { a }', svgOptions, '<svg>a</svg>');
+
+        expect(cache.get('digraph { a }', {engine: 'dot', format: 'svg'})).toBe('<svg>a</svg>');
+        expect(cache.get('digraph { b }', svgOptions)).toBeUndefined();
+        expect(cache.get('digraph { a }', {engine: 'dot', format: 'png'})).toBeUndefined();
+        expect(cache.get('digraph { a }', {engine: 'neato', format: 'svg'})).toBeUndefined();
+    });
+
+    it('should not return the result of another DOT string with the same key', () => {
+        // The DOT strings have the same length and the same FNV-1a hash
+        const cache = new RenderCache();
+        expect(cache.makeKey('digraph { n0xqd6 }', svgOptions)).toBe(cache.makeKey('digraph { n00wl8 }', svgOptions));
+
+        cache.set('digraph { n00wl8 }', svgOptions, '<svg>n00wl8</svg>');
+        expect(cache.get('digraph { n0xqd6 }', svgOptions)).toBeUndefined();
+        expect(cache.get('digraph { n00wl8 }', svgOptions)).toBe('<svg>n00wl8</svg>');
+
+        cache.set('digraph { n0xqd6 }', svgOptions, '<svg>n0xqd6</svg>');
+        expect(cache.get('digraph { n0xqd6 }', svgOptions)).toBe('<svg>n0xqd6</svg>');
+        expect(cache.get('digraph { n00wl8 }', svgOptions)).toBeUndefined();
+    });
+
+    it('should evict the least recently used result', () => {
+        const cache = new RenderCache(2);
+        cache.set('digraph { a }', svgOptions, 'A');
+        cache.set('digraph { b }', svgOptions, 'B');
+        expect(cache.get('digraph { a }', svgOptions)).toBe('A'); // b is now the least recently used one
+
+        cache.set('digraph { c }', svgOptions, 'C');
+        expect(cache.get('digraph { b }', svgOptions)).toBeUndefined();
+        expect(cache.get('digraph { a }', svgOptions)).toBe('A');
+        expect(cache.get('digraph { c }', svgOptions)).toBe('C');
+    });
+});
+
+describe('RenderWorker', () => {
+    beforeEach(() => {
+        FakeWorker.instances = [];
+        global.Worker = FakeWorker;
+    });
+
+    afterEach(() => {
+        delete global.Worker;
+    });
+
+    it('should render a DOT string rendered before from the cache without the worker', async () => {
+        const renderWorker = new RenderWorker();
+        const rendered = renderWorker.render('digraph { a }');
+        const worker = FakeWorker.instances[0];
+        worker.reply({id: worker.messages[0].id, result: '<svg>a</svg>'});
+        expect(await rendered).toBe('<svg>a</svg>');
+
+        expect(await renderWorker.render('digraph { a }')).toBe('<svg>a</svg>');
+        expect(worker.messages).toHaveLength(1);
+        expect(renderWorker.getCachedResult('digraph { a }', {format: 'png'})).toBeUndefined();
+    });
+
+    it('should drop stale replaceable jobs and send the other jobs to a new worker', async () => {
+        const renderWorker = new RenderWorker();
+        const exported = renderWorker.render('digraph { export }');
+        const stalePreview = renderWorker.render('digraph { old }', {}, true);
+        const preview = renderWorker.render('digraph { new }', {}, true);
+
+        expect(await stalePreview).toBeNull();
+        const [oldWorker, newWorker] = FakeWorker.instances;
+        expect(oldWorker.terminated).toBe(true);
+        expect(newWorker.messages.map(message => message.src)).toEqual(['digraph { export }', 'digraph { new }']);
+
+        // A late reply of the terminated worker is ignored
+        oldWorker.reply({id: oldWorker.messages[1].id, result: '<svg>old</svg>'});
+        newWorker.messages.forEach(message => newWorker.reply({id: message.id, result: `<svg>${message.src}</svg>`}));
+        expect(await exported).toBe('<svg>digraph { export }</svg>');
+        expect(await preview).toBe('<svg>digraph { new }</svg>');
+        expect(renderWorker.getCachedResult('digraph { old }')).toBeUndefined();
+    });
+});
@@ -0,0 +1,89 @@
+const {TruthTable} = require('../app/table'); // Imports the TruthTable class from table.js.
+const {VariableReordering} = require('../app/reordering'); // Imports the VariableReordering class from reordering.js.
+const {MDDConstructor} = require('../app/mddConstructor'); // Imports the MDDConstructor class from mddConstructor.js.
+
+// Checks that the diagram has the same value as the truth table for every row.
+function expectSameFunction(mdd, truthTable) {
+    let rowIndex = 0;
+    for (const row of truthTable.iterateRows()) {
+        expect(mdd.evaluate(row).getResultValue()).toBe(truthTable.getValue(rowIndex++));
+    }
+}
+
+describe('VariableReordering', () => {
+    const domains = [3, 2, 4, 2];
+    const truthVector = Array.from({length: 48}, (_, i) => (i * 7 + (i >> 3)) % 3);
+
+    it('should keep the function when adjacent levels are swapped', () => {
+        const truthTable = new TruthTable(domains, truthVector);
+        const reordering = new VariableReordering(truthTable.fromVector(), domains);
+
+        for (const level of [0, 2, 1, 0, 2]) {
+            reordering.swap(level);
+            expectSameFunction(reordering.getMDD(), truthTable);
+        }
+        expect(reordering.getOrder()).toEqual([3, 1, 2, 0]);
+    });
+
+    it('should return to the original diagram when a swap is undone', () => {
+        const truthTable = new TruthTable(domains, truthVector);
+        const reordering = new VariableReordering(truthTable.fromVector(), domains);
+        const levelSizes = reordering.getLevelSizes();
+
+        reordering.swap(1);
+        reordering.swap(1);
+
+        expect(reordering.getOrder()).toEqual([0, 1, 2, 3]);
+        expect(reordering.getLevelSizes()).toEqual(levelSizes);
+    });
+
+    it('should keep the level sizes up to date after swaps', () => {
+        const reordering = new VariableReordering(new TruthTable(domains, truthVector).fromVector(), domains);
+
+        for (const level of [0, 2, 1, 0, 2, 1, 1]) {
+            reordering.swap(level);
+            const levelSizes = reordering.countLevelNodes(0, domains.length - 1);
+            expect(reordering.getLevelSizes()).toEqual(levelSizes);
+            expect(reordering.getNodeCount()).toBe(levelSizes.reduce((sum, size) => sum + size, 0));
+        }
+    });
+
+    it('should shrink a diagram with a bad order by sifting', () => {
+        // Pairs of equal variables are far apart in the input order: x0 == x3 && x1 == x4 && x2 == x5
+        const mdd = new MDDConstructor(new Array(6).fill(3)).fromExpression('x0 == x3 && x1 == x4 && x2 == x5');
+        const reordering = new VariableReordering(mdd, new Array(6).fill(3));
+        const nodeCount = reordering.getNodeCount();
+
+        const siftedCount = reordering.sift();
+
+        expect(siftedCount).toBeLessThan(nodeCount);
+        expect(reordering.getNodeCount()).toBe(siftedCount);
+        expect(siftedCount).toBe(12); // Each pair is adjacent: one node for the first and three for the second variable
+        expect(reordering.getMDD().evaluate([1, 2, 0, 1, 2, 0]).getResultValue()).toBe(1);
+        expect(reordering.getMDD().evaluate([1, 2, 0, 1, 2, 1]).getResultValue()).toBe(0);
+    });
+
+    it('should not make the diagram larger by sifting', () => {
+        const truthTable = new TruthTable(domains, truthVector);
+        const reordering = new VariableReordering(truthTable.fromVector(), domains);
+        const nodeCount = reordering.getNodeCount();
+
+        expect(reordering.sift()).toBeLessThanOrEqual(nodeCount);
+        expectSameFunction(reordering.getMDD(), truthTable);
+    });
+
+    it('should explore the other side of the start level after the diagram grew on the first side', () => {
+        // Interleaved pairs: x1 is sifted first and goes up to the top (9 nodes), its start level is then
+        // over the growth limit (11 nodes), but below the start level it is next to x3 (7 nodes)
+        const pairDomains = [4, 2, 3, 4];
+        const truthTable = new TruthTable(pairDomains, Array.from(new TruthTable(pairDomains, []).iterateRows(),
+            row => (row[0] <= row[2] ? 1 : 0) + (row[1] <= row[3] ? 1 : 0)));
+        const reordering = new VariableReordering(truthTable.fromVector(), pairDomains);
+        expect(reordering.getNodeCount()).toBe(11);
+
+        expect(reordering.sift()).toBe(7);
+        expect(reordering.getOrder()).toEqual([0, 2, 1, 3]);
+        expect(reordering.countLevelNodes(0, pairDomains.length - 1)).toEqual([1, 2, 2, 2]);
+        expectSameFunction(reordering.getMDD(), truthTable);
+    });
+});
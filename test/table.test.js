@@ -1,5 +1,5 @@
 const {TerminalNode, InternalNode} = require('../app/diagram'); // Imports the TruthTable class from table.js.
-const {TruthTable} = require('../app/table'); // Imports the TruthTable class from table.js.
+const {TruthTable, MDDBuilder} = require('../app/table'); // Imports the TruthTable and MDDBuilder class from table.js.
 
 describe('TruthTable - Table generating and printing', () => {
     it('should generate and print correct binary truth table for 2 variables.', () => {
@@ -92,6 +92,26 @@ describe('TruthTable - Table generating and printing', () => {
 
         consoleLogSpy.mockRestore();
     });
+
+    it('should compute any row on demand the same as the generated truth table.', () => {
+        const tableOfTruth = new TruthTable([3, 2, 4], Array.from({length: 24}, (_, i) => i % 3));
+        const truthTable = tableOfTruth.getTruthTable();
+
+        expect(tableOfTruth.getTableLength()).toBe(24);
+        expect(tableOfTruth.getVariablesCount()).toBe(3);
+        for (let i = 0; i < truthTable.length; i++) {
+            expect(tableOfTruth.getRow(i)).toEqual(truthTable[i]);
+            expect(tableOfTruth.getValue(i)).toBe(i % 3);
+        }
+    });
+
+    it('should iterate over a range of rows by incrementing them.', () => {
+        const tableOfTruth = new TruthTable([3, 2, 4], []);
+
+        expect(Array.from(tableOfTruth.iterateRows(6, 10))).toEqual([[0, 1, 2], [0, 1, 3], [1, 0, 0], [1, 0, 1]]);
+        expect(Array.from(tableOfTruth.iterateRows(23))).toEqual([[2, 1, 3]]);
+        expect(Array.from(tableOfTruth.iterateRows(5, 5))).toEqual([]);
+    });
 });
 
 describe('TruthTable - Table evaluation', () => {
@@ -228,6 +248,30 @@ describe('TruthTable - fromTable', () => {
         // Assert that the size of the internalTable is 0, as no internalNode should have been created.
         expect(tableOfTruth._nodeFactory._internalTable.size).toBe(0);
     });
+
+    it('should distinguish InternalNodes whose successors have the same index but are different nodes.', () => {
+        const tableOfTruth = new TruthTable();
+        const nodeFactory = tableOfTruth._nodeFactory;
+
+        const terminalNode0 = nodeFactory.createTerminalNode(0);
+        const terminalNode1 = nodeFactory.createTerminalNode(1);
+        const terminalNode2 = nodeFactory.createTerminalNode(2);
+
+        const internalNode20 = nodeFactory.createInternalNode(2, [terminalNode0, terminalNode1]);
+        const internalNode21 = nodeFactory.createInternalNode(2, [terminalNode1, terminalNode2]);
+
+        // Both nodes are written as "N1:N2,N2", even though their successors are swapped.
+        const internalNode10 = nodeFactory.createInternalNode(1, [internalNode20, internalNode21]);
+        const internalNode11 = nodeFactory.createInternalNode(1, [internalNode21, internalNode20]);
+        expect(internalNode10.toString()).toBe(internalNode11.toString());
+
+        const internalNode00 = nodeFactory.createInternalNode(0, [internalNode10, internalNode11]);
+        const internalNode01 = nodeFactory.createInternalNode(0, [internalNode11, internalNode10]);
+
+        expect(internalNode00).not.toBe(internalNode01);
+        expect(nodeFactory.createInternalNode(0, [internalNode10, internalNode11])).toBe(internalNode00);
+        expect(nodeFactory._internalTable.size).toBe(6);
+    });
 });
 
 describe('TruthTable - fromVector method', () => {
@@ -394,3 +438,106 @@ describe('TruthTable and MDD evaluation comparison', () => {
         } while (i < truthTable.length);
     });
 });*/
+
+describe('TruthTable and MDD batch evaluation', () => {
+    // Test data from table 1.2 from thesis.
+    const domains = [2, 2, 3];
+    const truthVector = [0, 0, 0, 0, 1, 1, 0, 1, 1, 0, 2, 2];
+
+    it('should return the same results as evaluating each row separately', () => {
+        const tableOfTruth = new TruthTable(domains, truthVector);
+        const mdd = tableOfTruth.fromVector();
+        const assignments = Uint8Array.from(tableOfTruth.getTruthTable().flat());
+
+        const expectedResults = Int32Array.from(truthVector);
+        expect(tableOfTruth.evaluateBatch(assignments, domains.length)).toEqual(expectedResults);
+        expect(mdd.evaluateBatch(assignments, domains.length)).toEqual(expectedResults);
+    });
+
+    it('should store the results into the provided array', () => {
+        const tableOfTruth = new TruthTable(domains, truthVector);
+        const results = new Int32Array(2);
+
+        expect(tableOfTruth.evaluateBatch(Int32Array.from([1, 1, 2, 0, 1, 1]), domains.length, results)).toBe(results);
+        expect(results).toEqual(Int32Array.from([2, 1]));
+    });
+
+    it('should validate the assignments once and print an error message for invalid ones', () => {
+        const tableOfTruth = new TruthTable(domains, truthVector);
+        const mdd = tableOfTruth.fromVector();
+        const consoleSpy = jest.spyOn(console, 'error').mockImplementation();
+
+        expect(tableOfTruth.evaluateBatch(Int32Array.from([0, 1, 2, 0, 1]), domains.length)).toBeNull();
+        expect(consoleSpy).toHaveBeenCalledWith(
+            'Batch evaluation cannot be performed. The number of provided values (5) is not a multiple of the number of variables (3).'
+        );
+
+        expect(tableOfTruth.evaluateBatch(Int32Array.from([0, 1, 2, 0, 2, 0]), domains.length)).toBeNull();
+        expect(consoleSpy).toHaveBeenCalledWith(
+            'Batch evaluation cannot be performed. Invalid value 2 of variable x1 in assignment 1.'
+        );
+
+        consoleSpy.mockClear();
+        expect(mdd.evaluateBatch(Int32Array.from([0, 0, 3]), domains.length)).toBeNull();
+        expect(consoleSpy).toHaveBeenCalledTimes(1);
+        expect(consoleSpy).toHaveBeenCalledWith(
+            'Batch evaluation cannot be performed. Invalid value 3 of variable x2 in assignment 0.'
+        );
+
+        expect(tableOfTruth.evaluateBatch(Int32Array.from([0, 1]), 2)).toBeNull();
+        expect(consoleSpy).toHaveBeenCalledWith(
+            'Batch evaluation cannot be performed. The truth table has 3 variables, but 2 are provided.'
+        );
+
+        consoleSpy.mockRestore();
+    });
+});
+
+describe('MDDBuilder - building the MDD from chunks of the truth vector', () => {
+    // Test data from table 1.2 from thesis.
+    const domains = [2, 2, 3];
+    const truthVector = [0, 0, 0, 0, 1, 1, 0, 1, 1, 0, 2, 2];
+
+    // Collects the structure of the MDD printed by printMDDStructure.
+    function getStructure(mdd) {
+        const consoleLogSpy = jest.spyOn(console, 'log').mockImplementation();
+        mdd.printMDDStructure();
+        const structure = consoleLogSpy.mock.calls.slice();
+        consoleLogSpy.mockRestore();
+        return structure;
+    }
+
+    it('should build the same MDD as fromVector from chunks of any length', () => {
+        const expectedStructure = getStructure(new TruthTable(domains, truthVector).fromVector());
+
+        for (const chunkLength of [1, 2, 5, 12]) {
+            const builder = new MDDBuilder(domains);
+            for (let start = 0; start < truthVector.length; start += chunkLength) {
+                builder.push(Int32Array.from(truthVector.slice(start, start + chunkLength)));
+            }
+            expect(getStructure(builder.finish())).toEqual(expectedStructure);
+        }
+    });
+
+    it('should build the MDD from an async iterable of chunks', async () => {
+        async function* readChunks() {
+            yield Uint8Array.from(truthVector.slice(0, 7));
+            yield Uint8Array.from(truthVector.slice(7));
+        }
+
+        const mdd = await new MDDBuilder(domains).pushAll(readChunks());
+
+        expect(getStructure(mdd)).toEqual(getStructure(new TruthTable(domains, truthVector).fromVector()));
+    });
+
+    it('should print an error message when the number of values does not match the domains', () => {
+        const builder = new MDDBuilder(domains);
+        const consoleErrorSpy = jest.spyOn(console, 'error').mockImplementation();
+
+        builder.push(truthVector.slice(0, 11));
+        expect(builder.finish()).toBeNull();
+        expect(consoleErrorSpy).toHaveBeenCalledWith('MDD cannot be built. The number of truth vector values (11) does not match the product of the domains (12).');
+
+        consoleErrorSpy.mockRestore();
+    });
+});
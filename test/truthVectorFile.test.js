@@ -0,0 +1,47 @@
+const {readTruthVectorFile, writeTruthVectorFile} = require('../app/truthVectorFile'); // Imports the file functions from truthVectorFile.js.
+const {TruthTable} = require('../app/table'); // Imports the TruthTable class from table.js.
+
+describe('Truth vector file', () => {
+    const domains = [2, 3, 2];
+    const truthVector = [0, 0, 1, 1, 0, 0, 0, 0, 1, 1, 0, 2];
+
+    it('should read the written file as a view of its contents', () => {
+        const buffer = writeTruthVectorFile(domains, truthVector);
+        const result = readTruthVectorFile(buffer);
+
+        expect(buffer.byteLength).toBe(8 + 3 * 4 + 12);
+        expect(Array.from(result.domains)).toEqual(domains);
+        expect(result.truthVector).toBeInstanceOf(Uint8Array);
+        expect(result.truthVector.buffer).toBe(buffer);
+        expect(Array.from(result.truthVector)).toEqual(truthVector);
+
+        const mdd = new TruthTable(result.domains, result.truthVector).fromVector();
+        expect(mdd.evaluate([1, 2, 1]).getResultValue()).toBe(2);
+    });
+
+    it('should use the smallest value size and read unaligned buffers', () => {
+        const buffer = writeTruthVectorFile([2], [1, 70000]);
+        const bytes = new Uint8Array(buffer.byteLength + 1);
+        bytes.set(new Uint8Array(buffer), 1); // Like a Node.js buffer in the middle of its pool
+
+        const result = readTruthVectorFile(bytes.subarray(1));
+
+        expect(result.truthVector).toBeInstanceOf(Uint32Array);
+        expect(Array.from(result.truthVector)).toEqual([1, 70000]);
+        expect(writeTruthVectorFile([2], [1, 300]).byteLength).toBe(8 + 4 + 4);
+    });
+
+    it('should print an error message for invalid files', () => {
+        const consoleErrorSpy = jest.spyOn(console, 'error').mockImplementation();
+
+        expect(readTruthVectorFile(new Uint8Array([1, 2, 3]))).toBeNull();
+        expect(consoleErrorSpy).toHaveBeenCalledWith('Truth vector file cannot be read. It is not a truth vector file.');
+        const buffer = writeTruthVectorFile(domains, truthVector);
+        expect(readTruthVectorFile(buffer.slice(0, buffer.byteLength - 1))).toBeNull();
+        expect(consoleErrorSpy).toHaveBeenCalledWith('Truth vector file cannot be read. The number of truth vector values (11) does not match the product of the domains (12).');
+        expect(writeTruthVectorFile(domains, [0, 1])).toBeNull();
+        expect(consoleErrorSpy).toHaveBeenCalledWith('Truth vector file cannot be written. The number of truth vector values (2) does not match the product of the domains (12).');
+
+        consoleErrorSpy.mockRestore();
+    });
+});